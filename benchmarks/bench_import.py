@@ -0,0 +1,82 @@
+"""
+This module benchmarks the import time of the quasar packages
+by reading the output of python -X importtime in a fresh interpreter.
+"""
+
+#Built-in imports
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Tuple
+
+TARGETS = ("quasar", "quasar.chess", "quasar.engine", "quasar.gui")
+HEAVY_MODULES = ("pygame", "numpy")
+# modules a package loads on first access only, with what they would pull in
+LAZY_MODULES = {
+    "quasar.chess": ("quasar.chess.perft", "quasar.chess.store", "quasar.chess.packed",
+                     "concurrent.futures", "multiprocessing", "mmap"),
+}
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse the lines printed by python -X importtime.
+
+    :param output: Standard error of the interpreter.
+    :type output: str
+    :return: Self and cumulative microseconds per imported module.
+    :rtype: Dict[str, Tuple[int, int]]
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def time_import(target: str) -> Tuple[int, Dict[str, Tuple[int, int]], list]:
+    """
+    Import a module in a fresh interpreter and time it.
+
+    :param target: Module to import.
+    :type target: str
+    :return: Cumulative microseconds of the module, all parsed times
+        and files created in the working directory.
+    :rtype: Tuple[int, Dict[str, Tuple[int, int]], list]
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {target}"],
+                                cwd=cwd, env=env, capture_output=True, text=True, check=True)
+        created = os.listdir(cwd)
+    times = parse_importtime(result.stderr)
+    return times[target][1], times, created
+
+def main() -> None:
+    """
+    Run the benchmark and print the import cost per package.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Imports per package")
+    parser.add_argument("-t", "--top", type=int, default=0,
+                        help="Also print the slowest modules of every import")
+    args = parser.parse_args()
+
+    for target in TARGETS:
+        runs = [time_import(target) for _ in range(args.repeat)]
+        best, times, created = min(runs, key=lambda run: run[0])
+        heavy = [name for name in HEAVY_MODULES if name in times]
+        loaded = [name for name in LAZY_MODULES.get(target, ()) if name in times]
+        assert not loaded, f"{target} loaded {', '.join(loaded)} on import"
+        print(f"{target}: {best / 1000:.1f} ms | {len(times)} modules | "
+              f"heavy: {', '.join(heavy) or 'none'} | "
+              f"files created: {', '.join(created) or 'none'}")
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_us, _) in slowest[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms  {name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+This module benchmarks perft on the standard 8x8 area.
+
+It used to compare the square index against a board scanning its piece list,
+but move generation, make and undo now read the indexes directly instead of
+going through get_piece_at, so that baseline ran almost the same code.
+Use benchmarks/suite.py with a stored baseline to compare two trees.
+"""
+
+#Built-in imports
+import argparse
+import time
+
+#Internal imports
+from quasar.logger import silence
+from quasar.chess.board import Board
+from quasar.chess.perft import perft
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+
+def time_perft(fen: str, depth: int, repeat: int) -> tuple:
+    """
+    Time perft runs from a position and keep the fastest.
+
+    :param fen: Position to start from.
+    :type fen: str
+    :param depth: Perft depth.
+    :type depth: int
+    :param repeat: Number of runs.
+    :type repeat: int
+    :return: Node count and best elapsed seconds.
+    :rtype: tuple
+    """
+    board = Board()
+    board.load_fen(fen)
+    nodes, best = 0, float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nodes = perft(board, depth)
+        best = min(best, time.perf_counter() - start)
+    return nodes, best
+
+def main() -> None:
+    """
+    Run the benchmark and print the nodes per second per position.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--depth", type=int, default=3, help="Perft depth")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per position")
+    args = parser.parse_args()
+
+    silence()
+    for name, fen in (("STARTING_FEN", STARTING_FEN), ("POSITION_5_FEN", POSITION_5_FEN)):
+        nodes, elapsed = time_perft(fen, args.depth, args.repeat)
+        print(f"{name} depth {args.depth}: {nodes} nodes | {elapsed:.3f}s | "
+              f"{nodes / elapsed:,.0f} nodes/s")
+
+if __name__ == "__main__":
+    main()
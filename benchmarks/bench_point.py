@@ -0,0 +1,124 @@
+"""
+This module micro-benchmarks the immutable Point
+against the previous mutable, dict-backed implementation.
+"""
+
+#Built-in imports
+import argparse
+import timeit
+import tracemalloc
+
+#Internal imports
+from quasar.chess.point import Point
+
+class LegacyPoint:
+    """
+    The previous Point implementation, reduced to the operations benchmarked here.
+    """
+    def __init__(self, x, y) -> None:
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LegacyPoint):
+            return False
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash(self.x)+hash(self.y)
+
+    def __add__(self, other) -> "LegacyPoint":
+        if isinstance(other, LegacyPoint):
+            return LegacyPoint(self.x+other.x, self.y+other.y)
+        if isinstance(other, int):
+            return LegacyPoint(self.x+other, self.y+other)
+        if isinstance(other, tuple) and len(other) == 2:
+            return LegacyPoint(self.x+other[0], self.y+other[1])
+        raise ValueError("Invalid operand")
+
+    def __sub__(self, other) -> "LegacyPoint":
+        if isinstance(other, LegacyPoint):
+            return LegacyPoint(self.x-other.x, self.y-other.y)
+        if isinstance(other, int):
+            return LegacyPoint(self.x-other, self.y-other)
+        if isinstance(other, tuple) and len(other) == 2:
+            return LegacyPoint(self.x-other[0], self.y-other[1])
+        raise ValueError("Invalid operand")
+
+def allocated_bytes(point_class: type, count: int) -> int:
+    """
+    Measure the memory held by a list of freshly created points.
+
+    :param point_class: Point class to measure.
+    :type point_class: type
+    :param count: Number of points to create.
+    :type count: int
+    :return: Bytes allocated per point.
+    :rtype: int
+    """
+    tracemalloc.start()
+    points = [point_class(i, -i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del points
+    return size // count
+
+def hash_collisions(point_class: type, size: int) -> int:
+    """
+    Count hash collisions on a size x size grid.
+
+    :param point_class: Point class to measure.
+    :type point_class: type
+    :param size: Side length of the grid.
+    :type size: int
+    :return: Number of points sharing a hash with an earlier point.
+    :rtype: int
+    """
+    hashes = {hash(point_class(x, y)) for x in range(size) for y in range(size)}
+    return size * size - len(hashes)
+
+def time_operations(point_class: type, number: int) -> dict:
+    """
+    Time the operations that dominate move generation.
+
+    :param point_class: Point class to measure.
+    :type point_class: type
+    :param number: Number of repetitions per operation.
+    :type number: int
+    :return: Best-of-five seconds per operation name.
+    :rtype: dict
+    """
+    def best(statement) -> float:
+        return min(timeit.repeat(statement, number=number, repeat=5))
+
+    a = point_class(3, 4)
+    b = point_class(1, 2)
+    squares = {point_class(x, y): None for x in range(1, 9) for y in range(1, 9)}
+    return {
+        "create": best(lambda: point_class(3, 4)),
+        "add": best(lambda: a + b),
+        "sub": best(lambda: a - b),
+        "dict lookup": best(lambda: a in squares),
+    }
+
+def main() -> None:
+    """
+    Run the benchmark and print the comparison.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=200_000,
+                        help="Repetitions per timed operation")
+    args = parser.parse_args()
+
+    legacy = time_operations(LegacyPoint, args.number)
+    current = time_operations(Point, args.number)
+    for operation, legacy_time in legacy.items():
+        print(f"{operation:>12}: legacy {legacy_time:.3f}s | point {current[operation]:.3f}s | "
+              f"speedup {legacy_time / current[operation]:.2f}x")
+    print(f"{'bytes/point':>12}: legacy {allocated_bytes(LegacyPoint, 100_000)} | "
+          f"point {allocated_bytes(Point, 100_000)}")
+    print(f"{'collisions':>12}: legacy {hash_collisions(LegacyPoint, 256)} | "
+          f"point {hash_collisions(Point, 256)} (256x256 grid)")
+
+if __name__ == "__main__":
+    main()
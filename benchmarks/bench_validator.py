@@ -0,0 +1,109 @@
+"""
+This module benchmarks the validator throughput with rejection logging
+disabled, traced, and formatted eagerly the way it used to be.
+"""
+
+#Built-in imports
+import argparse
+import time
+
+#Internal imports
+from quasar.logger import logger, silence, unsilence
+from quasar.chess.board import Board, Validator, LegalityContext
+from quasar.chess.moves import Move, RejectReason
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+
+class EagerValidator(Validator):
+    """
+    Validator that formats every rejection message, as it used to.
+    """
+    def reject(self, move: Move, reason: RejectReason) -> bool:
+        """
+        Record the rejection and log it with an eagerly built message.
+
+        :param move: rejected move.
+        :type move: Move
+        :param reason: reason of the rejection.
+        :type reason: RejectReason
+        :return: Always False.
+        :rtype: bool
+        """
+        move.reject_reason = reason
+        logger.warning(f"{str(move)} | {reason.value}")
+        return False
+
+def validate_all(board: Board, validator: Validator, toggle_level: bool) -> tuple:
+    """
+    Validate every candidate move of the side to move on the 8x8 area once.
+
+    :param board: Board to validate the moves on.
+    :type board: Board
+    :param validator: Validator to benchmark.
+    :type validator: Validator
+    :param toggle_level: If the logger level is switched around every piece,
+        as the move generators used to do.
+    :type toggle_level: bool
+    :return: Number of validated and legal moves.
+    :rtype: tuple
+    """
+    context = LegalityContext(board, board.current_player)
+    validated = 0
+    legal = 0
+    for piece in context.own_pieces:
+        if toggle_level:
+            silence()
+        for move in board.get_candidate_moves_generator(piece, Point(1,1), Point(8,8)):
+            validated += 1
+            legal += validator(move, board, True, context)[1]
+        if toggle_level:
+            unsilence()
+    return validated, legal
+
+def time_validator(fen: str, validator: Validator, toggle_level: bool, repeat: int) -> tuple:
+    """
+    Time repeated validation of all candidate moves of a position.
+
+    :param fen: Position to validate the moves of.
+    :type fen: str
+    :param validator: Validator to benchmark.
+    :type validator: Validator
+    :param toggle_level: If the logger level is switched around every piece.
+    :type toggle_level: bool
+    :param repeat: Number of passes over the moves.
+    :type repeat: int
+    :return: Validated moves per pass, legal moves per pass and moves per second.
+    :rtype: tuple
+    """
+    board = Board()
+    board.load_fen(fen)
+    silence()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        validated, legal = validate_all(board, validator, toggle_level)
+    elapsed = time.perf_counter() - start
+    silence()
+    return validated, legal, int(validated * repeat / elapsed)
+
+def main() -> None:
+    """
+    Run the benchmark and print the throughput per position and mode.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=200, help="Passes per position")
+    args = parser.parse_args()
+
+    modes = (("eager", EagerValidator(), True),
+             ("traced", Validator(trace=True), False),
+             ("disabled", Validator(), False))
+    for name, fen in (("STARTING_FEN", STARTING_FEN), ("POSITION_5_FEN", POSITION_5_FEN)):
+        rates = {}
+        for mode, validator, toggle_level in modes:
+            validated, legal, rates[mode] = time_validator(fen, validator, toggle_level,
+                                                           args.repeat)
+        print(f"{name}: {validated} candidates, {legal} legal | " +
+              " | ".join(f"{mode} {rate} moves/s" for mode, rate in rates.items()) +
+              f" | speedup {rates['disabled'] / rates['eager']:.2f}x")
+
+if __name__ == "__main__":
+    main()
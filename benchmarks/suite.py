@@ -0,0 +1,385 @@
+"""
+This module runs the benchmark suite, writes the results as JSON
+and compares them against a stored baseline to flag regressions.
+
+Usage, from the repository root:
+
+    PYTHONPATH=. python benchmarks/suite.py run -o results.json
+    PYTHONPATH=. python benchmarks/suite.py run -k perft --baseline baseline.json
+    PYTHONPATH=. python benchmarks/suite.py compare baseline.json results.json
+
+Every benchmark is a setup function that builds its state and returns
+the workload to time and the number of operations the workload performs.
+After a warm-up run the best of several repeats is kept, and the results
+are per operation, so they compare across runs with different repeat counts.
+"""
+
+#Built-in imports
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+#Internal imports
+from quasar.logger import silence
+from quasar.chess.board import Board, LegalityContext
+from quasar.chess.pieces import PieceColor, PieceName
+from quasar.chess.point import Point
+from quasar.chess.perft import perft
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+from tests.conftest import random_board
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOTTOM_LEFT = Point(1, 1)
+TOP_RIGHT = Point(8, 8)
+DEFAULT_THRESHOLD = 0.10
+
+Workload = Tuple[Callable[[], None], int]
+BENCHMARKS: Dict[str, Callable[[], Optional[Workload]]] = {}
+
+def benchmark(name: str) -> Callable:
+    """
+    Register a benchmark setup function under a name.
+
+    :param name: Name of the benchmark in the results.
+    :type name: str
+    :return: Decorator registering the setup function.
+    :rtype: Callable
+    """
+    def register(setup: Callable[[], Optional[Workload]]) -> Callable[[], Optional[Workload]]:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def load_board(fen: str) -> Board:
+    """
+    Create a board holding a position.
+
+    :param fen: Position to load.
+    :type fen: str
+    :return: The board.
+    :rtype: Board
+    """
+    board = Board()
+    board.load_fen(fen)
+    return board
+
+@benchmark("get_piece_at")
+def bench_get_piece_at() -> Workload:
+    """
+    Look up every square of the 8x8 area on the starting position.
+    """
+    board = load_board(STARTING_FEN)
+    squares = [Point(x, y) for x in range(1, 9) for y in range(1, 9)] * 100
+
+    def run() -> None:
+        for square in squares:
+            board.get_piece_at(square)
+    return run, len(squares)
+
+def bench_possible_moves(name: PieceName) -> Workload:
+    """
+    Generate the legal moves of the white pieces of one kind on POSITION_5_FEN.
+
+    :param name: Kind of the pieces.
+    :type name: PieceName
+    :return: The workload and the number of pieces it generates moves for.
+    :rtype: Workload
+    """
+    board = load_board(POSITION_5_FEN)
+    pieces = board.find_pieces(name, PieceColor.WHITE) * 20
+
+    def run() -> None:
+        for piece in pieces:
+            for _ in board.get_possible_moves_generator(piece, BOTTOM_LEFT, TOP_RIGHT):
+                pass
+    return run, len(pieces)
+
+for _name in PieceName:
+    if _name != PieceName.NONE:
+        benchmark(f"possible_moves.{_name.name.lower()}")(
+            lambda name=_name: bench_possible_moves(name))
+
+@benchmark("validator")
+def bench_validator() -> Workload:
+    """
+    Validate every candidate move of the side to move on POSITION_5_FEN.
+    """
+    board = load_board(POSITION_5_FEN)
+    context = LegalityContext(board, board.current_player)
+    moves = [move for piece in context.own_pieces
+             for move in board.get_candidate_moves_generator(piece, BOTTOM_LEFT, TOP_RIGHT)]
+    moves *= 20
+    validator = board.validator
+
+    def run() -> None:
+        for move in moves:
+            validator(move, board, True, context)
+    return run, len(moves)
+
+@benchmark("make_undo")
+def bench_make_undo() -> Workload:
+    """
+    Make and undo every legal move of POSITION_5_FEN.
+    """
+    board = load_board(POSITION_5_FEN)
+    moves = board.generate_legal_moves(BOTTOM_LEFT, TOP_RIGHT) * 50
+
+    def run() -> None:
+        for move in moves:
+            board.make_move(move, False)
+            board.undo_move()
+    return run, len(moves)
+
+def bench_perft(fen: str, depth: int) -> Workload:
+    """
+    Count the leaf nodes of the move tree of a position on the 8x8 area.
+
+    :param fen: Position to start from.
+    :type fen: str
+    :param depth: Perft depth.
+    :type depth: int
+    :return: The workload and the number of leaf nodes.
+    :rtype: Workload
+    """
+    board = load_board(fen)
+    nodes = perft(board, depth, BOTTOM_LEFT, TOP_RIGHT)
+    return lambda: perft(board, depth, BOTTOM_LEFT, TOP_RIGHT), nodes
+
+benchmark("perft.starting.3")(lambda: bench_perft(STARTING_FEN, 3))
+benchmark("perft.position_5.2")(lambda: bench_perft(POSITION_5_FEN, 2))
+
+@benchmark("legal_moves.random_512")
+def bench_legal_moves_random() -> Workload:
+    """
+    Generate the legal moves of a random position with 512 pieces.
+    """
+    board = random_board(512, 140)
+    bounds = (Point(-150, -150), Point(150, 150))
+
+    def run() -> None:
+        board.generate_legal_moves(*bounds)
+    return run, 1
+
+@benchmark("legal_moves.window_256")
+def bench_legal_moves_window() -> Workload:
+    """
+    Generate the legal moves of a random position with 256 pieces
+    that fits in the bitboard window.
+    """
+    board = random_board(256, 25)
+    bounds = (Point(-30, -30), Point(35, 35))
+
+    def run() -> None:
+        board.generate_legal_moves(*bounds)
+    return run, 1
+
+def bench_range_query(chunked: bool) -> Workload:
+    """
+    Find the pieces inside small rectangles of a random position with 10,000 pieces,
+    with the chunk index or with a scan of every piece.
+
+    :param chunked: If the chunk index should be used.
+    :type chunked: bool
+    :return: The workload and the number of queries.
+    :rtype: Workload
+    """
+    board = random_board(10_000, 2000)
+    generator = random.Random(1)
+    corners = [Point(generator.randint(-2000, 1950), generator.randint(-2000, 1950))
+               for _ in range(100)]
+    rectangles = [(corner, corner + 50) for corner in corners]
+
+    def run() -> None:
+        for bottom_left, top_right in rectangles:
+            if chunked:
+                board.get_pieces_in(bottom_left, top_right)
+            else:
+                [piece for piece in board.pieces
+                 if bottom_left.x <= piece.position.x <= top_right.x and
+                 bottom_left.y <= piece.position.y <= top_right.y]
+    return run, len(rectangles)
+
+benchmark("range_query.chunks_10k")(lambda: bench_range_query(True))
+benchmark("range_query.scan_10k")(lambda: bench_range_query(False))
+
+@benchmark("legal_moves.sparse_10k")
+def bench_legal_moves_sparse() -> Workload:
+    """
+    Generate the legal moves inside a 100x100 area of a random position with 10,000 pieces.
+    """
+    board = random_board(10_000, 2000)
+    bounds = (Point(-50, -50), Point(50, 50))
+
+    def run() -> None:
+        board.generate_legal_moves(*bounds)
+    return run, 1
+
+@benchmark("load_fen")
+def bench_load_fen() -> Workload:
+    """
+    Load STARTING_FEN and POSITION_5_FEN into a board.
+    """
+    board = Board()
+    fens = [STARTING_FEN, POSITION_5_FEN] * 50
+
+    def run() -> None:
+        for fen in fens:
+            board.load_fen(fen)
+    return run, len(fens)
+
+@benchmark("gui.draw_board")
+def bench_draw_board() -> Optional[Workload]:
+    """
+    Draw frames of the starting position with the dummy video driver.
+    Skipped when pygame isn't installed.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        from quasar.gui.game import Game
+    except ImportError:
+        return None
+    cwd = os.getcwd()
+    # the piece images are loaded relative to the repository root
+    os.chdir(ROOT)
+    try:
+        game = Game()
+    finally:
+        os.chdir(cwd)
+    frames = 10
+
+    def run() -> None:
+        for _ in range(frames):
+            game.draw_board()
+    return run, frames
+
+def run_benchmarks(repeat: int, keyword: str = "") -> dict:
+    """
+    Run the registered benchmarks and collect their results.
+
+    :param repeat: Number of timed runs per benchmark, the best one is kept.
+    :type repeat: int
+    :param keyword: Only run the benchmarks whose name contains it.
+    :type keyword: str
+    :return: The results, with the environment they were measured in.
+    :rtype: dict
+    """
+    silence()
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if keyword not in name:
+            continue
+        workload = setup()
+        if workload is None:
+            print(f"{name:<28} skipped")
+            continue
+        run, operations = workload
+        # warm the caches so the first timed run isn't an outlier
+        run()
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        results[name] = {"operations": operations,
+                         "seconds": best,
+                         "us_per_operation": best / operations * 1e6}
+        print(f"{name:<28} {results[name]['us_per_operation']:12.2f} us/op "
+              f"({operations} ops in {best:.4f}s)")
+    return {"environment": {"python": platform.python_version(),
+                            "implementation": platform.python_implementation(),
+                            "machine": platform.machine(),
+                            "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+            "repeat": repeat,
+            "results": results}
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Compare results against a baseline and print the change of every benchmark.
+
+    :param baseline: Results to compare against.
+    :type baseline: dict
+    :param current: Results to check.
+    :type current: dict
+    :param threshold: Relative slowdown above which a benchmark regressed, e.g. 0.1 for 10%.
+    :type threshold: float
+    :return: Names of the regressed benchmarks.
+    :rtype: list
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<28} new")
+            continue
+        ratio = result["us_per_operation"] / base["us_per_operation"]
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "improved"
+        print(f"{name:<28} {base['us_per_operation']:12.2f} -> "
+              f"{result['us_per_operation']:12.2f} us/op {ratio:6.2f}x {status}")
+    for name in baseline["results"].keys() - current["results"].keys():
+        print(f"{name:<28} missing")
+    return regressions
+
+def read_results(path: str) -> dict:
+    """
+    Read results written by the run command.
+
+    :param path: Path of the JSON file.
+    :type path: str
+    :return: The results.
+    :rtype: dict
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def main() -> None:
+    """
+    Parse the command line and run or compare the benchmarks.
+    Exits with status 1 when a benchmark regressed.
+    """
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("-r", "--repeat", type=int, default=5, help="Timed runs per benchmark")
+    run_parser.add_argument("-k", "--keyword", default="",
+                            help="Only run the benchmarks whose name contains it")
+    run_parser.add_argument("-o", "--output", help="JSON file to write the results to")
+    run_parser.add_argument("-b", "--baseline", help="JSON results to compare against")
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", help="JSON results to compare against")
+    compare_parser.add_argument("current", help="JSON results to check")
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        current = run_benchmarks(args.repeat, args.keyword)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(current, file, indent=2)
+        if not args.baseline:
+            return
+        baseline = read_results(args.baseline)
+        baseline["results"] = {name: result for name, result in baseline["results"].items()
+                               if args.keyword in name}
+    else:
+        baseline = read_results(args.baseline)
+        current = read_results(args.current)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -16,10 +16,58 @@ __license__ = 'MIT'
 __copyright__ = 'Copyright 2024 Tymon Becella'
 __version__ = '0.0.1'
 
+import importlib
 import os
 
 from .logger import logger, clear_logs
-from .chess import board, errors, moves, pieces, point, utils
-from .engine import *
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
-from .gui import *
+
+# Subpackages and their exports are imported on first access,
+# so headless users of quasar.chess and quasar.engine never load pygame or numpy.
+_SUBPACKAGES = ("chess", "engine", "gui")
+_CHESS_MODULES = ("board", "errors", "moves", "pieces", "point", "utils")
+_EXPORTS = {
+    "Evaluation": "engine",
+    "material_evaluation": "engine",
+    "PIECE_VALUES": "engine",
+    "Search": "engine",
+    "SearchResult": "engine",
+    "MATE_SCORE": "engine",
+    "TranspositionTable": "engine",
+    "Bound": "engine",
+    "Game": "gui",
+    "BLACK_TILE": "gui",
+    "WHITE_TILE": "gui",
+    "SELECTED_TILE": "gui",
+    "ACCENT_COLOR": "gui",
+    "CHECK_COLOR": "gui",
+}
+
+def __getattr__(name: str):
+    """
+    Import subpackages, chess modules and exported names on first access.
+
+    :param name: Name of the attribute.
+    :type name: str
+    :raises AttributeError: If the name isn't provided by the package.
+    :return: The subpackage, module or exported object.
+    """
+    if name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _CHESS_MODULES:
+        value = importlib.import_module(f".chess.{name}", __name__)
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    """
+    List the attributes of the package, including the lazily imported ones.
+
+    :return: The attribute names.
+    :rtype: list
+    """
+    return sorted(set(globals()) | set(_SUBPACKAGES) | set(_CHESS_MODULES) | set(_EXPORTS))
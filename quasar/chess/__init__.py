@@ -5,9 +5,55 @@ It contains the main classes and functions of the package.
 
 __title__ = "chess"
 
+import importlib
+
 from .board import Board
 from .pieces import Piece, PieceFactory, PieceColor, PieceName
-from .moves import Move
+from .moves import Move, RayMove, RejectReason
 from .point import Point
 from .utils import *
 from .errors import *
+from .fen import parse_fen, parse_xfen, iter_xfen, stream_positions
+from .counters import Counters
+
+# perft loads multiprocessing, store loads mmap and only the engine and tools need packed,
+# so they and their exports are imported on first access to keep workers quick to start.
+# Importing quasar.chess.perft directly binds perft to the module instead of the function.
+_MODULES = ("packed", "perft", "store")
+_EXPORTS = {
+    "PackedMove": "packed",
+    "MoveBuffer": "packed",
+    "perft": "perft",
+    "divide": "perft",
+    "PerftResult": "perft",
+    "PositionStore": "store",
+    "encode_position": "store",
+    "decode_position": "store",
+}
+
+def __getattr__(name: str):
+    """
+    Import the heavy modules and their exported names on first access.
+
+    :param name: Name of the attribute.
+    :type name: str
+    :raises AttributeError: If the name isn't provided by the package.
+    :return: The module or exported object.
+    """
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    """
+    List the attributes of the package, including the lazily imported ones.
+
+    :return: The attribute names.
+    :rtype: list
+    """
+    return sorted(set(globals()) | set(_MODULES) | set(_EXPORTS))
@@ -0,0 +1,342 @@
+"""
+This module contains the BitboardWindow class, a dense copy of the pieces of a board
+for positions that fit in a WINDOW_SIZE x WINDOW_SIZE square of the infinite board.
+
+Every piece kind and color gets a Python int with one bit per square of the window,
+bit (y - origin.y) * WINDOW_SIZE + (x - origin.x), so the moves of all knights, kings
+and pawns of a side are found with a few shifts and masks instead of one lookup per offset.
+The pieces are kept WINDOW_MARGIN squares away from the edges of the window,
+so none of their targets falls outside of it.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .moves import Move
+from .pieces import Piece, PieceColor, PieceName, KNIGHT_OFFSETS, ROYAL_OFFSETS
+from .point import Point
+
+WINDOW_SIZE = 64
+WINDOW_MARGIN = 2
+# number of bounds masks kept, the view of the GUI changes them while panning
+BOUNDS_CACHE_SIZE = 256
+
+_new_tuple = tuple.__new__
+
+def get_rectangle_mask(left: int, bottom: int, right: int, top: int) -> int:
+    """
+    Mask of a rectangle of the window, clipped to the window.
+
+    :param left: first column, inclusive
+    :type left: int
+    :param bottom: first row, inclusive
+    :type bottom: int
+    :param right: last column, inclusive
+    :type right: int
+    :param top: last row, inclusive
+    :type top: int
+    :return: bitboard with the squares of the rectangle set
+    :rtype: int
+    """
+    left, bottom = max(left, 0), max(bottom, 0)
+    right, top = min(right, WINDOW_SIZE - 1), min(top, WINDOW_SIZE - 1)
+    if left > right or bottom > top:
+        return 0
+    row = ((1 << (right - left + 1)) - 1) << left
+    mask = 0
+    for y in range(bottom, top + 1):
+        mask |= row << (y * WINDOW_SIZE)
+    return mask
+
+FULL_MASK = get_rectangle_mask(0, 0, WINDOW_SIZE - 1, WINDOW_SIZE - 1)
+
+@lru_cache(maxsize=BOUNDS_CACHE_SIZE)
+def get_clipped_mask(left: int, bottom: int, right: int, top: int) -> int:
+    """
+    Cached mask of a rectangle of the window, with its corners clipped
+    to one square outside of the window by the caller so equal masks share an entry.
+
+    :param left: first column, inclusive
+    :type left: int
+    :param bottom: first row, inclusive
+    :type bottom: int
+    :param right: last column, inclusive
+    :type right: int
+    :param top: last row, inclusive
+    :type top: int
+    :return: bitboard with the squares of the rectangle set
+    :rtype: int
+    """
+    return get_rectangle_mask(left, bottom, right, top)
+
+@lru_cache(maxsize=None)
+def get_source_mask(dx: int, dy: int) -> int:
+    """
+    Mask of the squares an offset can be added to without leaving the window.
+
+    :param dx: x component of the offset
+    :type dx: int
+    :param dy: y component of the offset
+    :type dy: int
+    :return: bitboard of the squares
+    :rtype: int
+    """
+    return get_rectangle_mask(-dx, -dy, WINDOW_SIZE - 1 - dx, WINDOW_SIZE - 1 - dy)
+
+def shift(bitboard: int, offset: Point) -> int:
+    """
+    Move every square of a bitboard by an offset.
+    Squares that would leave the window are dropped instead of wrapping around.
+
+    :param bitboard: squares to move
+    :type bitboard: int
+    :param offset: offset to add to every square
+    :type offset: Point
+    :return: the moved squares
+    :rtype: int
+    """
+    dx, dy = offset
+    bitboard &= get_source_mask(dx, dy)
+    amount = dx + dy * WINDOW_SIZE
+    return bitboard << amount if amount >= 0 else bitboard >> -amount
+
+def iterate_bits(bitboard: int) -> Iterator[int]:
+    """
+    Iterate over the indexes of the set bits of a bitboard, lowest first.
+
+    :param bitboard: bitboard to iterate over
+    :type bitboard: int
+    :yield: index of a set bit
+    :rtype: int
+    """
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+class BitboardWindow:
+    """
+    The BitboardWindow class keeps one bitboard per piece kind and color
+    and one per color for the pieces of a board inside a square window.
+    """
+    __slots__ = ("origin", "boards", "occupied")
+
+    def __init__(self, origin: Point) -> None:
+        """
+        The constructor for the BitboardWindow class.
+
+        :param origin: Bottom left corner of the window.
+        :type origin: Point
+        """
+        self.origin = origin
+        self.boards: Dict[Tuple[PieceColor, PieceName], int] = {}
+        self.occupied: Dict[PieceColor, int] = {PieceColor.WHITE: 0, PieceColor.BLACK: 0}
+
+    @classmethod
+    def fit(cls, pieces: Sequence[Piece]) -> Optional["BitboardWindow"]:
+        """
+        Create a window centred on the pieces, if they fit inside its margins.
+
+        :param pieces: The pieces to put in the window.
+        :type pieces: Sequence[Piece]
+        :return: The window, or None if there are no pieces or they don't fit.
+        :rtype: Optional[BitboardWindow]
+        """
+        if not pieces:
+            return None
+        xs = [piece.position[0] for piece in pieces]
+        ys = [piece.position[1] for piece in pieces]
+        left, right, bottom, top = min(xs), max(xs), min(ys), max(ys)
+        if not cls.fits(Point(left, bottom), Point(right, top)):
+            return None
+        window = cls(Point((left + right + 1) // 2 - WINDOW_SIZE // 2,
+                           (bottom + top + 1) // 2 - WINDOW_SIZE // 2))
+        for piece in pieces:
+            window.add(piece)
+        return window
+
+    @staticmethod
+    def fits(bottom_left: Point, top_right: Point) -> bool:
+        """
+        Check if the pieces inside a rectangle fit inside the margins of a window.
+
+        :param bottom_left: Bottom left corner of the pieces.
+        :type bottom_left: Point
+        :param top_right: Top right corner of the pieces.
+        :type top_right: Point
+        :return: True if a window can be fitted around them.
+        :rtype: bool
+        """
+        inner = WINDOW_SIZE - 2 * WINDOW_MARGIN
+        return top_right[0] - bottom_left[0] < inner and top_right[1] - bottom_left[1] < inner
+
+    def copy(self) -> "BitboardWindow":
+        """
+        Create an independent copy of the window.
+
+        :return: The copied window.
+        :rtype: BitboardWindow
+        """
+        window = BitboardWindow(self.origin)
+        window.boards = dict(self.boards)
+        window.occupied = dict(self.occupied)
+        return window
+
+    def contains(self, square: Point) -> bool:
+        """
+        Check if a square is inside the margins of the window.
+
+        :param square: The square to check.
+        :type square: Point
+        :return: True if a piece on the square can be kept in the window.
+        :rtype: bool
+        """
+        x = square[0] - self.origin[0]
+        y = square[1] - self.origin[1]
+        return WINDOW_MARGIN <= x < WINDOW_SIZE - WINDOW_MARGIN and \
+            WINDOW_MARGIN <= y < WINDOW_SIZE - WINDOW_MARGIN
+
+    def get_index(self, square: Point) -> int:
+        """
+        Get the bit index of a square of the window.
+
+        :param square: The square.
+        :type square: Point
+        :return: The bit index.
+        :rtype: int
+        """
+        return (square[1] - self.origin[1]) * WINDOW_SIZE + square[0] - self.origin[0]
+
+    def get_square(self, index: int) -> Point:
+        """
+        Get the square of a bit index of the window.
+
+        :param index: The bit index.
+        :type index: int
+        :return: The square.
+        :rtype: Point
+        """
+        y, x = divmod(index, WINDOW_SIZE)
+        return _new_tuple(Point, (x + self.origin[0], y + self.origin[1]))
+
+    def add(self, piece: Piece) -> None:
+        """
+        Set the bit of a piece. The piece has to be inside the window.
+
+        :param piece: The piece to add.
+        :type piece: Piece
+        """
+        bit = 1 << self.get_index(piece.position)
+        key = (piece.color, piece.name)
+        self.boards[key] = self.boards.get(key, 0) | bit
+        self.occupied[piece.color] |= bit
+
+    def remove(self, piece: Piece) -> None:
+        """
+        Clear the bit of a piece.
+
+        :param piece: The piece to remove.
+        :type piece: Piece
+        """
+        bit = ~(1 << self.get_index(piece.position))
+        key = (piece.color, piece.name)
+        self.boards[key] &= bit
+        self.occupied[piece.color] &= bit
+
+    def get_bounds_mask(self, bottom_left_bound: Point, top_right_bound: Point) -> int:
+        """
+        Get the mask of the squares of the window inside the bounds.
+        Masks are cached by their clipped corners relative to the window,
+        as the same bounds are used for every generation.
+
+        :param bottom_left_bound: Bottom left corner of the area.
+        :type bottom_left_bound: Point
+        :param top_right_bound: Top right corner of the area.
+        :type top_right_bound: Point
+        :return: The mask.
+        :rtype: int
+        """
+        x, y = self.origin
+        return get_clipped_mask(min(max(bottom_left_bound[0] - x, -1), WINDOW_SIZE),
+                                min(max(bottom_left_bound[1] - y, -1), WINDOW_SIZE),
+                                min(max(top_right_bound[0] - x, -1), WINDOW_SIZE),
+                                min(max(top_right_bound[1] - y, -1), WINDOW_SIZE))
+
+    def generate_leaper_moves(self,
+                              color: PieceColor,
+                              piece_map: dict,
+                              bottom_left_bound: Point,
+                              top_right_bound: Point) -> List[Move]:
+        """
+        Generate the pseudo-legal moves of the knights, kings and pawns of a side
+        within the bounds, with the moved and captured pieces filled in.
+        Castling and the king safety of the moves aren't checked.
+
+        :param color: Side to generate the moves for.
+        :type color: PieceColor
+        :param piece_map: The pieces of the board by square.
+        :type piece_map: dict
+        :param bottom_left_bound: Bottom left corner of the area.
+        :type bottom_left_bound: Point
+        :param top_right_bound: Top right corner of the area.
+        :type top_right_bound: Point
+        :return: Candidate moves, only missing the king safety check.
+        :rtype: List[Move]
+        """
+        enemy_color = PieceColor.BLACK if color == PieceColor.WHITE else PieceColor.WHITE
+        own = self.occupied[color]
+        enemy = self.occupied[enemy_color]
+        empty = FULL_MASK & ~(own | enemy)
+        bounds = self.get_bounds_mask(bottom_left_bound, top_right_bound)
+        moves = []
+        for name, offsets in ((PieceName.KNIGHT, KNIGHT_OFFSETS), (PieceName.KING, ROYAL_OFFSETS)):
+            pieces = self.boards.get((color, name))
+            if pieces:
+                for offset in offsets:
+                    self.add_moves(moves, color, piece_map, shift(pieces, offset) & bounds & ~own,
+                                   offset)
+        pawns = self.boards.get((color, PieceName.PAWN))
+        if pawns:
+            forward = Point(0, color.value)
+            for offset in (Point(-1, color.value), Point(1, color.value)):
+                self.add_moves(moves, color, piece_map, shift(pawns, offset) & bounds & enemy,
+                               offset)
+            single = shift(pawns, forward) & empty
+            self.add_moves(moves, color, piece_map, single & bounds, forward)
+            double = shift(single, forward) & empty & bounds
+            offset = Point(0, 2 * color.value)
+            for index in iterate_bits(double):
+                target = self.get_square(index)
+                source = target - offset
+                pawn = piece_map[source]
+                if not pawn.moved:
+                    move = Move(color, source, target)
+                    move.moved = pawn
+                    moves.append(move)
+        return moves
+
+    def add_moves(self, moves: List[Move], color: PieceColor, piece_map: dict,
+                  targets: int, offset: Point) -> None:
+        """
+        Append the moves to the targets of a bitboard, made by a single offset.
+
+        :param moves: List to append the moves to.
+        :type moves: List[Move]
+        :param color: Side to move.
+        :type color: PieceColor
+        :param piece_map: The pieces of the board by square.
+        :type piece_map: dict
+        :param targets: Bitboard of the target squares.
+        :type targets: int
+        :param offset: Offset from the sources to the targets.
+        :type offset: Point
+        """
+        dx, dy = offset
+        for index in iterate_bits(targets):
+            target = self.get_square(index)
+            source = _new_tuple(Point, (target[0] - dx, target[1] - dy))
+            move = Move(color, source, target)
+            move.moved = piece_map[source]
+            captured = piece_map.get(target)
+            if captured is not None:
+                move.captured = captured
+            moves.append(move)
@@ -3,14 +3,41 @@ This module contains the Board class,
 which is responsible for managing the state of the game board.
 """
 
-import math
-from typing import Tuple, Generator, List
-from quasar.logger import logger, silence, unsilence
-from quasar.chess.moves import Move
-from quasar.chess.errors import NonePieceError, InvalidMoveError, InvalidPlayerError
+import struct
+from contextlib import contextmanager
+from typing import Iterable, Iterator,  Tuple, Generator, List, Optional
+from quasar.logger import logger, muted
+from quasar.chess.moves import Move, RayMove, RejectReason
+from quasar.chess.errors import NonePieceError, InvalidMoveError, InvalidPlayerError, \
+    InvalidPositionError, PositionKeyError
 from quasar.chess.point import Point
-from quasar.chess.pieces import Piece, PieceFactory, PieceColor, PieceName
-from quasar.chess.utils import fen_to_piece_name
+from quasar.chess.pieces import Piece, PieceFactory, PieceColor, PieceName, \
+    KNIGHT_OFFSETS, ROYAL_OFFSETS
+from quasar.chess.fen import Position, parse_fen, parse_xfen, format_fen, format_xfen
+from quasar.chess.lines import LineIndex, get_step, get_distance, get_ray_length, get_ray_entry, \
+    get_intersection
+from quasar.chess.zobrist import piece_key, side_key, SIDE_KEY
+from quasar.chess.counters import Counters
+from quasar.chess.bitboards import BitboardWindow
+from quasar.chess.chunks import ChunkIndex
+from quasar.chess.stats import BoardStats
+
+# side to move, key verification flag, en passant flag, position key, number of pieces,
+# en passant square, halfmove clock, fullmove number
+BOARD_HEADER = struct.Struct("<bBBQIqqII")
+# piece kind | black << 3 | moved << 4, x, y
+PIECE_RECORD = struct.Struct("<Bqq")
+PIECE_NAMES = tuple(PieceName)
+# number of knights, kings and pawns from which their moves are generated in one NumPy batch
+LEAPER_BATCH_SIZE = 48
+# farthest square from its piece a knight, king or pawn move can land on, castling included
+LEAPER_REACH = 2
+# king offsets of the castling attempts
+CASTLING_OFFSETS = (Point(2, 0), Point(-2, 0))
+# squares around the pieces moves are generated in when no bounds are given
+DEFAULT_BOUNDS_MARGIN = 8
+# if the leaper moves are generated from bitboards while the pieces fit in a window
+BITBOARD_WINDOW = True
 
 class Board:
     """
@@ -21,16 +48,27 @@ class Board:
         The constructor for the Board class.
         """
         self.pieces = []
+        self.piece_map = {}
+        self.lines = LineIndex()
+        self.chunks = ChunkIndex()
+        self.stats = BoardStats(self.chunks)
+        self.window = None
         self.captured_pieces = []
         self.moves = []
+        self.undo_records = []
 
         self.current_player = PieceColor.WHITE
+        self.en_passant = None
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self.position_key = 0
+        self.verify_key = False
 
         self.factory = PieceFactory()
         self.none_piece = self.factory.create_piece(PieceName.NONE, Point(0, 0), PieceColor.NONE)
 
         self.validator = Validator()
-        self.last_concentration = Point(0, 0)
+        self.counters = None
 
     def create_piece(self, name: PieceName, position: Point, color: PieceColor) -> Piece:
         """
@@ -51,23 +89,71 @@ class Board:
 
     def load_fen(self, fen: str) -> None:
         """
-        Load a FEN string into the board.
+        Load a FEN string into the board, replacing the current position.
 
         :param fen: The FEN string to load.
         :type fen: str
+        :raises InvalidPositionError: If the string isn't valid FEN.
         """
-        placement, turn, castling, en_passant, halfmove, fullmove = fen.split(" ")
-        del turn, castling, en_passant, halfmove, fullmove
-        placement = placement.split("/")
-        for y, row in enumerate(placement):
-            y = 8 - y
-            for x, char in enumerate(row):
-                if char.isdigit():
-                    x += int(char)
-                else:
-                    color = PieceColor.WHITE if char.isupper() else PieceColor.BLACK
-                    piece_name = PieceName[fen_to_piece_name(char)]
-                    self.create_piece(piece_name, Point(x+1, y), color)
+        self.load_position(parse_fen(fen))
+
+    def load_xfen(self, xfen: str) -> None:
+        """
+        Load an extended FEN string into the board, replacing the current position.
+        Unlike FEN, it can place pieces anywhere on the plane.
+
+        :param xfen: The extended FEN string to load.
+        :type xfen: str
+        :raises InvalidPositionError: If the string isn't valid extended FEN.
+        """
+        self.load_position(parse_xfen(xfen))
+
+    def load_position(self, position: Position) -> None:
+        """
+        Replace the current position with a parsed one.
+        The move history and the captured pieces are cleared.
+
+        :param position: The pieces, side to move, en passant square and move counters.
+        :type position: Position
+        :raises InvalidPositionError: If two pieces stand on the same square.
+        """
+        pieces, player, en_passant, halfmove_clock, fullmove_number = position
+        self.clear_moves()
+        self.clear_captured_pieces()
+        self.current_player = player
+        self.clear_pieces()
+        with muted():
+            for name, color, x, y, moved in pieces:
+                square = Point(x, y)
+                if square in self.piece_map:
+                    raise InvalidPositionError(f"Two pieces on {square!r}")
+                piece = self.factory.create_piece(name, square, color)
+                if moved:
+                    # marks the piece as moved and updates the pawn offsets
+                    piece.set_position(square)
+                self.add_piece(piece)
+        self.en_passant = en_passant
+        self.halfmove_clock = halfmove_clock
+        self.fullmove_number = fullmove_number
+
+    def get_fen(self) -> str:
+        """
+        Get the position as a FEN string.
+
+        :raises InvalidPositionError: If a piece stands outside the 8x8 area.
+        :return: The FEN string.
+        :rtype: str
+        """
+        return format_fen(self)
+
+    def get_xfen(self) -> str:
+        """
+        Get the position as an extended FEN string.
+
+        :return: The extended FEN string.
+        :rtype: str
+        """
+        return format_xfen(self)
 
     def change_player(self) -> None:
         """
@@ -80,6 +166,7 @@ class Board:
         else:
             raise InvalidPlayerError(
                 f"Current player has to be either WHITE or BLACK. Got {self.current_player.name}")
+        self.position_key ^= SIDE_KEY
 
     def get_pieces(self) -> list:
         """
@@ -98,6 +185,7 @@ class Board:
         :type piece: Piece
         """
         self.pieces.append(piece)
+        self.index_piece(piece)
 
     def remove_piece(self, piece: Piece) -> None:
         """
@@ -107,6 +195,203 @@ class Board:
         :type piece: Piece
         """
         self.pieces.remove(piece)
+        self.unindex_piece(piece)
+
+    def index_piece(self, piece: Piece, update_key: bool = True) -> None:
+        """
+        Register a piece in the square, line and chunk indexes, the statistics
+        and the bitboard window under its current position and hash it into the position key.
+        The window is dropped if the piece doesn't fit in it.
+
+        :param piece: The piece to index.
+        :type piece: Piece
+        :param update_key: If the piece should be hashed into the position key.
+        :type update_key: bool
+        """
+        previous = self.piece_map.get(piece.position)
+        if previous is None:
+            self.lines.add(piece.position)
+        elif previous is not piece:
+            self.stats.remove(previous)
+        if previous is not piece:
+            self.stats.add(piece)
+        self.piece_map[piece.position] = piece
+        self.chunks.add(piece)
+        window = self.window
+        if window is not None:
+            if window.contains(piece.position):
+                if previous is not None:
+                    window.remove(previous)
+                window.add(piece)
+            else:
+                self.window = None
+        if update_key:
+            self.position_key ^= piece_key(piece)
+
+    def unindex_piece(self, piece: Piece, update_key: bool = True) -> None:
+        """
+        Remove a piece from the square, line and chunk indexes, the statistics,
+        the bitboard window and the position key.
+        The piece is only dropped if the index still points to it.
+
+        :param piece: The piece to unindex.
+        :type piece: Piece
+        :param update_key: If the piece should be hashed out of the position key.
+        :type update_key: bool
+        """
+        if self.piece_map.get(piece.position) is piece:
+            del self.piece_map[piece.position]
+            self.lines.remove(piece.position)
+            self.chunks.remove(piece)
+            self.stats.remove(piece)
+            if self.window is not None:
+                self.window.remove(piece)
+            if update_key:
+                self.position_key ^= piece_key(piece)
+
+    def get_position_key(self) -> int:
+        """
+        Get the incrementally updated 64-bit key of the current position.
+
+        :return: The position key.
+        :rtype: int
+        """
+        return self.position_key
+
+    def compute_position_key(self) -> int:
+        """
+        Compute the position key from scratch.
+        It covers every piece with its moved flag and the side to move.
+
+        :return: The position key.
+        :rtype: int
+        """
+        key = side_key(self.current_player)
+        for piece in self.pieces:
+            key ^= piece_key(piece)
+        return key
+
+    def check_position_key(self) -> None:
+        """
+        Compare the incremental position key against a full recompute.
+
+        :raises PositionKeyError: If the keys differ.
+        """
+        expected = self.compute_position_key()
+        if self.position_key != expected:
+            raise PositionKeyError(
+                f"Incremental key {self.position_key:#018x} != recomputed key {expected:#018x}")
+
+    def copy(self) -> "Board":
+        """
+        Create an independent copy of the position.
+        The pieces are copied and the indexes cloned, nothing is hashed again.
+        The copy starts with an empty move history, so its moves can't be undone
+        past the point it was copied at, and without counters attached.
+
+        :return: The copied board.
+        :rtype: Board
+        """
+        board = Board()
+        board.pieces = [piece.copy() for piece in self.pieces]
+        board.piece_map = {piece.position: piece for piece in board.pieces}
+        board.lines = self.lines.copy()
+        board.chunks = self.chunks.copy(board.piece_map)
+        board.stats = self.stats.copy(board.chunks)
+        board.window = self.window.copy() if self.window is not None else None
+        board.current_player = self.current_player
+        board.en_passant = self.en_passant
+        board.halfmove_clock = self.halfmove_clock
+        board.fullmove_number = self.fullmove_number
+        board.position_key = self.position_key
+        board.verify_key = self.verify_key
+        board.validator = Validator(self.validator.trace)
+        return board
+
+    @contextmanager
+    def counting(self, counters: Optional[Counters] = None) -> Iterator[Counters]:
+        """
+        Count the work done on the board inside a with block.
+        The previously attached counters, usually none, are restored on exit.
+
+        :param counters: The counters to add to, new ones if None.
+        :type counters: Optional[Counters]
+        :yield: The attached counters.
+        :rtype: Counters
+        """
+        previous = self.counters
+        self.counters = Counters() if counters is None else counters
+        try:
+            yield self.counters
+        finally:
+            self.counters = previous
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the position into a compact byte string:
+        a header with the side to move, the en passant square and the move clocks,
+        followed by one fixed-size record per piece.
+        The move history isn't included.
+
+        :return: The serialized position.
+        :rtype: bytes
+        """
+        buffer = bytearray(BOARD_HEADER.size + PIECE_RECORD.size * len(self.pieces))
+        en_passant = self.en_passant if self.en_passant is not None else (0, 0)
+        BOARD_HEADER.pack_into(buffer, 0, self.current_player.value, self.verify_key,
+                               self.en_passant is not None, self.position_key, len(self.pieces),
+                               en_passant[0], en_passant[1],
+                               self.halfmove_clock, self.fullmove_number)
+        offset = BOARD_HEADER.size
+        for piece in self.pieces:
+            PIECE_RECORD.pack_into(buffer, offset,
+                                   piece.name.value |
+                                   (piece.color == PieceColor.BLACK) << 3 |
+                                   bool(piece.moved) << 4,
+                                   piece.position[0], piece.position[1])
+            offset += PIECE_RECORD.size
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Board":
+        """
+        Create a board from a byte string made by to_bytes.
+
+        :param data: The serialized position.
+        :type data: bytes
+        :raises ValueError: If the length of the data doesn't match the piece count.
+        :return: The deserialized board.
+        :rtype: Board
+        """
+        player, verify_key, has_en_passant, position_key, count, en_passant_x, en_passant_y, \
+            halfmove_clock, fullmove_number = BOARD_HEADER.unpack_from(data)
+        if len(data) != BOARD_HEADER.size + PIECE_RECORD.size * count:
+            raise ValueError(f"Expected {count} pieces, got {len(data)} bytes")
+        board = cls()
+        board.current_player = PieceColor(player)
+        with muted():
+            for bits, x, y in PIECE_RECORD.iter_unpack(memoryview(data)[BOARD_HEADER.size:]):
+                color = PieceColor.BLACK if bits & 8 else PieceColor.WHITE
+                piece = board.factory.create_piece(PIECE_NAMES[bits & 7], Point(x, y), color)
+                if bits & 16:
+                    # marks the piece as moved and updates the pawn offsets
+                    piece.set_position(piece.position)
+                board.add_piece(piece)
+        board.en_passant = Point(en_passant_x, en_passant_y) if has_en_passant else None
+        board.halfmove_clock = halfmove_clock
+        board.fullmove_number = fullmove_number
+        board.position_key = position_key
+        board.verify_key = bool(verify_key)
+        return board
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the board as its compact byte string.
+
+        :return: The constructor and its arguments.
+        :rtype: tuple
+        """
+        return (Board.from_bytes, (self.to_bytes(),))
 
     def clear(self) -> None:
         """
@@ -116,24 +401,34 @@ class Board:
         self.clear_moves()
         self.clear_captured_pieces()
         self.current_player = PieceColor.WHITE
+        self.en_passant = None
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self.position_key = 0
 
         self.factory = PieceFactory()
         self.none_piece = self.factory.create_piece(PieceName.NONE, Point(0, 0), PieceColor.NONE)
 
         self.validator = Validator()
-        self.last_concentration = Point(0, 0)
 
     def clear_pieces(self) -> None:
         """
         Clear the pieces from the board.
         """
         self.pieces = []
+        self.piece_map = {}
+        self.lines.clear()
+        self.chunks.clear()
+        self.stats = BoardStats(self.chunks)
+        self.window = None
+        self.position_key = side_key(self.current_player)
 
     def clear_moves(self) -> None:
         """
         Clear the moves from the board.
         """
         self.moves = []
+        self.undo_records = []
 
     def clear_captured_pieces(self) -> None:
         """
@@ -141,22 +436,69 @@ class Board:
         """
         self.captured_pieces = []
 
-    def get_concentration_position(self) -> Point:
+    def get_concentration_position(self) -> Tuple[float, float]:
         """
-        Get the concentration position of the pieces on the board.
-        Currently, it is not used.
+        Get the concentration position of the pieces on the board, their centroid.
+        It is kept up to date as pieces move, so no piece is visited.
+        It usually falls between squares, so it is a pair of floats rather than a Point.
 
-        :return: The concentration position of the pieces on the board.
-        :rtype: Point
+        :return: x and y of the concentration position, (0.0, 0.0) if there are no pieces.
+        :rtype: Tuple[float, float]
         """
-        new_concentration = self.last_concentration.copy()
-        for piece in self.pieces:
-            d = abs(piece.get_position() - self.last_concentration)
-            d = Point(math.sqrt(d.x), math.sqrt(d.y))
-            new_concentration += d
-        new_concentration /= len(self.pieces)
-        self.last_concentration = new_concentration
-        return self.last_concentration
+        centroid = self.stats.get_centroid()
+        return centroid if centroid is not None else (0.0, 0.0)
+
+    def get_bounding_box(self, color: Optional[PieceColor] = None) -> Optional[Tuple[Point, Point]]:
+        """
+        Get the smallest rectangle holding the pieces of a color.
+
+        :param color: The color of the pieces, None for both.
+        :type color: Optional[PieceColor]
+        :return: The bottom left and top right corners, None if there are no pieces.
+        :rtype: Optional[Tuple[Point, Point]]
+        """
+        return self.stats.get_bounding_box(color)
+
+    def get_material(self, name: PieceName, color: PieceColor) -> int:
+        """
+        Get the number of pieces of a kind and color on the board.
+
+        :param name: The kind of the pieces.
+        :type name: PieceName
+        :param color: The color of the pieces.
+        :type color: PieceColor
+        :return: The number of pieces.
+        :rtype: int
+        """
+        return self.stats.count(name, color)
+
+    def get_bounds(self,
+                   bottom_left_bound: Optional[Point] = None,
+                   top_right_bound: Optional[Point] = None,
+                   margin: int = DEFAULT_BOUNDS_MARGIN) -> Tuple[Point, Point]:
+        """
+        Fill in missing move generation bounds from the bounding box of the pieces,
+        grown by a margin on every side.
+
+        :param bottom_left_bound: Bottom left corner of the area, None to derive it.
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: Top right corner of the area, None to derive it.
+        :type top_right_bound: Optional[Point]
+        :param margin: Number of squares around the pieces.
+        :type margin: int
+        :return: The bottom left and top right corners of the area.
+        :rtype: Tuple[Point, Point]
+        """
+        if bottom_left_bound is not None and top_right_bound is not None:
+            return bottom_left_bound, top_right_bound
+        box = self.stats.get_bounding_box()
+        if box is None:
+            box = (Point(0, 0), Point(0, 0))
+        if bottom_left_bound is None:
+            bottom_left_bound = box[0] - margin
+        if top_right_bound is None:
+            top_right_bound = box[1] + margin
+        return bottom_left_bound, top_right_bound
 
     def get_white_pieces(self) -> list:
         """
@@ -185,10 +527,37 @@ class Board:
         :return: The piece at the position.
         :rtype: Piece
         """
-        for piece in self.pieces:
-            if piece.get_position() == position:
-                return piece
-        return self.none_piece
+        if self.counters is not None:
+            self.counters.get_piece_at += 1
+        return self.piece_map.get(position, self.none_piece)
+
+    def get_pieces_in(self, bottom_left_bound: Point, top_right_bound: Point) -> List[Piece]:
+        """
+        Get the pieces inside a rectangle.
+        Only the chunks of the board overlapping the rectangle are visited.
+
+        :param bottom_left_bound: Bottom left corner of the rectangle.
+        :type bottom_left_bound: Point
+        :param top_right_bound: Top right corner of the rectangle.
+        :type top_right_bound: Point
+        :return: The pieces inside the rectangle.
+        :rtype: List[Piece]
+        """
+        return self.chunks.query(bottom_left_bound, top_right_bound)
+
+    def get_pieces_near(self, position: Point, radius: int) -> List[Piece]:
+        """
+        Get the pieces at most radius squares away from a position along both axes,
+        the piece on the position included.
+
+        :param position: The centre of the neighbourhood.
+        :type position: Point
+        :param radius: The largest distance along x and along y.
+        :type radius: int
+        :return: The pieces in the neighbourhood.
+        :rtype: List[Piece]
+        """
+        return self.chunks.get_neighbours(position, radius)
 
     def find_pieces(self, name: PieceName, color: PieceColor) -> List[Piece]:
         """
@@ -207,46 +576,445 @@ class Board:
                 pieces.append(piece)
         return pieces
 
+    def get_candidate_moves_generator(
+        self, piece: Piece,
+        bottom_left_bound: Optional[Point] = None,
+        top_right_bound: Optional[Point] = None
+        ) -> Generator[Move, None, None]:
+        """
+        Generate the not yet validated moves of a piece within the bounds,
+        including castling attempts of the king.
+
+        :param piece: The piece to generate the moves for.
+        :type piece: Piece
+        :param bottom_left_bound: Bottom left corner of the area to generate moves in,
+            around the pieces if None.
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: Top right corner of the area to generate moves in,
+            around the pieces if None.
+        :type top_right_bound: Optional[Point]
+        :yield: Candidate move.
+        :rtype: Move
+        """
+        bottom_left_bound, top_right_bound = self.get_bounds(bottom_left_bound, top_right_bound)
+        if piece.sliding:
+            for step in piece.offsets:
+                yield from self.get_ray_moves_generator(piece, step,
+                                                        bottom_left_bound, top_right_bound)
+        else:
+            for offset in piece.get_offset_generator(bottom_left_bound, top_right_bound,
+                                                     self.counters):
+                yield Move(piece.get_color(), piece.get_position(), piece.get_position() + offset)
+        yield from self.get_castling_candidates((piece,), bottom_left_bound, top_right_bound)
+
+    def get_ray_moves_generator(
+        self, piece: Piece,
+        step: Point,
+        bottom_left_bound: Optional[Point] = None,
+        top_right_bound: Optional[Point] = None
+        ) -> Generator[Move, None, None]:
+        """
+        Generate the moves of a sliding piece along one ray within the bounds:
+        every empty square up to the first blocker, then the capture of an enemy blocker.
+
+        :param piece: The sliding piece.
+        :type piece: Piece
+        :param step: Unit step of the ray.
+        :type step: Point
+        :param bottom_left_bound: Bottom left corner of the area to generate moves in,
+            around the pieces if None.
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: Top right corner of the area to generate moves in,
+            around the pieces if None.
+        :type top_right_bound: Optional[Point]
+        :yield: Candidate move.
+        :rtype: Move
+        """
+        bottom_left_bound, top_right_bound = self.get_bounds(bottom_left_bound, top_right_bound)
+        position = piece.position
+        length = get_ray_length(position, step, bottom_left_bound, top_right_bound)
+        entry = get_ray_entry(position, step, bottom_left_bound, top_right_bound)
+        capture = None
+        blocker = self.lines.nearest(position, step)
+        if blocker is not None:
+            distance = get_distance(position, blocker)
+            if distance <= length:
+                length = distance - 1
+                if distance >= entry and self.piece_map[blocker].color != piece.color:
+                    capture = blocker
+        for i in range(entry, length + 1):
+            yield Move(piece.color, position, position + step * i)
+        if capture is not None:
+            yield Move(piece.color, position, capture)
+
+    def get_ray_move(self, piece: Piece, step: Point) -> Tuple[Optional[RayMove], Optional[Move]]:
+        """
+        Get the quiet moves of a sliding piece along one ray as a single ray move,
+        plus the capture of an enemy blocker. Neither is validated.
+
+        :param piece: The sliding piece.
+        :type piece: Piece
+        :param step: Unit step of the ray.
+        :type step: Point
+        :return: Ray move over the empty squares, None if there are none,
+            and the capture move, None if there is none.
+        :rtype: Tuple[Optional[RayMove], Optional[Move]]
+        """
+        blocker = self.lines.nearest(piece.position, step)
+        if blocker is None:
+            return RayMove(piece, step), None
+        distance = get_distance(piece.position, blocker)
+        ray = RayMove(piece, step, 1, distance - 1) if distance > 1 else None
+        capture = None
+        if self.piece_map[blocker].color != piece.color:
+            capture = Move(piece.color, piece.position, blocker)
+        return ray, capture
+
+    def get_ray_checks(self, ray: RayMove, king: Piece) -> List[int]:
+        """
+        Find the squares of a ray move from which the sliding piece would attack a king.
+
+        :param ray: The ray move.
+        :type ray: RayMove
+        :param king: The king to attack.
+        :type king: Piece
+        :return: Distances along the ray of the checking squares.
+        :rtype: List[int]
+        """
+        distances = []
+        for step in ray.moved.offsets:
+            crossing = get_intersection(ray.source, ray.step, king.position, step)
+            if crossing is None or crossing[1] < 1:
+                continue
+            target = ray.get_target(crossing[0])
+            if ray.contains(target) and \
+                self.lines.nearest(target, Point(-step.x, -step.y)) == king.position:
+                distances.append(crossing[0])
+        return distances
+
     def get_possible_moves_generator(
         self, piece: Piece,
-        bottom_left_bound: Point = Point(-999,-999),
-        top_right_bound: Point = Point(999,999)
+        bottom_left_bound: Optional[Point] = None,
+        top_right_bound: Optional[Point] = None
         ) -> Generator[Move, None, None]:
         """
-        _summary_
+        Generate the legal moves of a single piece within the bounds.
 
-        :param piece: _description_
+        :param piece: The piece to generate the moves for.
         :type piece: Piece
+        :param bottom_left_bound: Bottom left corner of the area to generate moves in,
+            around the pieces if None.
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: Top right corner of the area to generate moves in,
+            around the pieces if None.
+        :type top_right_bound: Optional[Point]
+        :yield: Legal move.
+        :rtype: Move
         """
-        silence()
+        bottom_left_bound, top_right_bound = self.get_bounds(bottom_left_bound, top_right_bound)
         #if piece.color != self.current_player:
         #    raise InvalidPlayerError(
         #        f"Current player is {self.current_player.name}, but piece is {piece.color.name}")
-        offset_generator = piece.get_offset_generator(bottom_left_bound, top_right_bound)
-        misfire = 0
-        while misfire < 100:
-            try:
-                offset = next(offset_generator)
-            except StopIteration:
-                break
-            target = piece.get_position() + offset
-            if bottom_left_bound.x <= target.x <= top_right_bound.x and \
-                bottom_left_bound.y <= target.y <= top_right_bound.y:
-                move = Move(piece.get_color(), piece.get_position(), target)
-                move, is_legal = self.validator(move, self, True)
+        # shared by the candidates, so the board is scanned once instead of once per move
+        context = LegalityContext(self, piece.color)
+        for move in self.get_candidate_moves_generator(piece, bottom_left_bound, top_right_bound):
+            move, is_legal = self.validator(move, self, True, context)
+            if is_legal:
+                if self.counters is not None:
+                    self.counters.moves_generated[piece.name] += 1
+                yield move
+
+    def generate_move_families(
+        self,
+        bottom_left_bound: Optional[Point] = None,
+        top_right_bound: Optional[Point] = None
+        ) -> Tuple[List[Move], List[RayMove]]:
+        """
+        Generate the legal moves of the side to move with the quiet slider moves
+        kept as ray moves, so an open line costs one object however long it is.
+        The bounds only apply to the concrete moves, the rays are unbounded.
+
+        :param bottom_left_bound: Bottom left corner of the area to generate concrete moves in,
+            around the pieces if None.
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: Top right corner of the area to generate concrete moves in,
+            around the pieces if None.
+        :type top_right_bound: Optional[Point]
+        :return: Legal concrete moves and legal ray moves.
+        :rtype: Tuple[List[Move], List[RayMove]]
+        """
+        bottom_left_bound, top_right_bound = self.get_bounds(bottom_left_bound, top_right_bound)
+        context = LegalityContext(self, self.current_player)
+        moves = []
+        rays = []
+        window = self.get_window()
+        if window is not None:
+            for move in window.generate_leaper_moves(context.color, self.piece_map,
+                                                     bottom_left_bound, top_right_bound):
+                # the bitboards only produce pseudo-legal moves, so only the king is left
+                if self.validator.is_king_safe(move, context):
+                    moves.append(move)
+                elif self.counters is not None:
+                    self.counters.rejections[move.reject_reason] += 1
+            for move in self.get_castling_candidates(context.own_pieces,
+                                                     bottom_left_bound, top_right_bound):
+                move, is_legal = self.validator(move, self, True, context)
                 if is_legal:
-                    yield move
+                    moves.append(move)
+        else:
+            # only the pieces close to the bounds can move a leaper into them
+            nearby = self.get_pieces_in(bottom_left_bound - LEAPER_REACH,
+                                        top_right_bound + LEAPER_REACH)
+            leapers = [piece for piece in nearby
+                       if piece.color == context.color and not piece.sliding]
+            if len(leapers) >= LEAPER_BATCH_SIZE:
+                candidates = self.get_leaper_candidates(context, nearby,
+                                                        bottom_left_bound, top_right_bound)
             else:
-                misfire += 1
-        if piece.is_king():
-            castling_moves = [
-            Move(piece.get_color(), piece.get_position(), piece.get_position() + Point(2,0)),
-            Move(piece.get_color(), piece.get_position(), piece.get_position() + Point(-2,0))]
-            for move in castling_moves:
-                move, is_legal = self.validator(move, self, True)
+                candidates = [move for piece in leapers
+                              for move in self.get_candidate_moves_generator(
+                                  piece, bottom_left_bound, top_right_bound)]
+            for move in candidates:
+                move, is_legal = self.validator(move, self, True, context)
                 if is_legal:
-                    yield move
-        unsilence()
+                    moves.append(move)
+        for piece in context.own_sliders:
+            for step in piece.offsets:
+                ray, capture = self.get_ray_move(piece, step)
+                if capture is not None and \
+                    bottom_left_bound.x <= capture.target.x <= top_right_bound.x and \
+                    bottom_left_bound.y <= capture.target.y <= top_right_bound.y:
+                    capture, is_legal = self.validator(capture, self, True, context)
+                    if is_legal:
+                        moves.append(capture)
+                if ray is not None:
+                    ray = self.validator.restrict_ray_move(ray, context)
+                    if ray is not None:
+                        rays.append(ray)
+        if self.counters is not None:
+            for move in moves:
+                self.counters.moves_generated[move.moved.name] += 1
+            for ray in rays:
+                self.counters.rays_generated[ray.moved.name] += 1
+        return moves, rays
+
+    def get_leaper_candidates(self,
+                              context: "LegalityContext",
+                              pieces: List[Piece],
+                              bottom_left_bound: Point,
+                              top_right_bound: Point) -> List[Move]:
+        """
+        Generate the candidate moves of all knights, kings and pawns of the side to move
+        at once with NumPy, already without own captures and impossible pawn moves.
+        Castling attempts of the king are added as in get_candidate_moves_generator.
+
+        :param context: The state of the position.
+        :type context: LegalityContext
+        :param pieces: The pieces of both sides close enough to the bounds to matter.
+        :type pieces: List[Piece]
+        :param bottom_left_bound: Bottom left corner of the area to generate moves in.
+        :type bottom_left_bound: Point
+        :param top_right_bound: Top right corner of the area to generate moves in.
+        :type top_right_bound: Point
+        :return: Candidate moves, not yet validated.
+        :rtype: List[Move]
+        """
+        # numpy is only loaded once a position is large enough to need it
+        from quasar.chess.leapers import generate_leaper_moves
+        moves = generate_leaper_moves(pieces, context.color,
+                                      bottom_left_bound, top_right_bound)
+        moves.extend(self.get_castling_candidates(context.own_pieces,
+                                                  bottom_left_bound, top_right_bound))
+        return moves
+
+    def get_castling_candidates(self,
+                                pieces: Iterable[Piece],
+                                bottom_left_bound: Point,
+                                top_right_bound: Point) -> List[Move]:
+        """
+        Get the castling attempts of the kings among the pieces
+        landing within the bounds, not yet validated.
+
+        :param pieces: The pieces to take the kings from.
+        :type pieces: Iterable[Piece]
+        :param bottom_left_bound: Bottom left corner of the area to generate moves in.
+        :type bottom_left_bound: Point
+        :param top_right_bound: Top right corner of the area to generate moves in.
+        :type top_right_bound: Point
+        :return: Candidate moves.
+        :rtype: List[Move]
+        """
+        moves = []
+        for king in pieces:
+            if king.is_king():
+                for offset in CASTLING_OFFSETS:
+                    target = king.position + offset
+                    if bottom_left_bound.x <= target.x <= top_right_bound.x and \
+                        bottom_left_bound.y <= target.y <= top_right_bound.y:
+                        moves.append(Move(king.color, king.position, target))
+        return moves
+
+    def get_window(self) -> Optional[BitboardWindow]:
+        """
+        Get the bitboard window of the position.
+        A new window is fitted around the pieces if the last one was dropped,
+        for example after a piece left it.
+
+        :return: The window, or None if the pieces don't fit in one
+            or the bitboards are turned off.
+        :rtype: Optional[BitboardWindow]
+        """
+        if not BITBOARD_WINDOW:
+            return None
+        if self.window is None:
+            # the bounding box rules out most positions that don't fit without visiting the pieces
+            box = self.stats.get_bounding_box()
+            if box is not None and BitboardWindow.fits(*box):
+                self.window = BitboardWindow.fit(self.pieces)
+        return self.window
+
+    def generate_legal_moves(
+        self,
+        bottom_left_bound: Optional[Point] = None,
+        top_right_bound: Optional[Point] = None
+        ) -> List[Move]:
+        """
+        Generate all legal moves of the side to move within the bounds in one pass.
+        The king location, checkers and attacked squares are computed once
+        and shared by every piece, and the ray moves are expanded inside the bounds.
+
+        :param bottom_left_bound: Bottom left corner of the area to generate moves in,
+            around the pieces if None.
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: Top right corner of the area to generate moves in,
+            around the pieces if None.
+        :type top_right_bound: Optional[Point]
+        :return: Legal moves.
+        :rtype: List[Move]
+        """
+        bottom_left_bound, top_right_bound = self.get_bounds(bottom_left_bound, top_right_bound)
+        moves, rays = self.generate_move_families(bottom_left_bound, top_right_bound)
+        for ray in rays:
+            moves.extend(ray.expand(bottom_left_bound, top_right_bound))
+        return moves
+
+    def _iterate_leaper_attackers(self,
+                                  square: Point,
+                                  color: PieceColor) -> Generator[Piece, None, None]:
+        """
+        Find the knights, kings and pawns of a color that attack a square
+        by probing the few squares they could attack it from.
+
+        :param square: The square to check.
+        :type square: Point
+        :param color: Color of the attacking pieces.
+        :type color: PieceColor
+        :yield: Attacking piece.
+        :rtype: Piece
+        """
+        piece_map = self.piece_map
+        x, y = square
+        for dx, dy in KNIGHT_OFFSETS:
+            piece = piece_map.get(Point(x + dx, y + dy))
+            if piece is not None and piece.color is color and piece.name is PieceName.KNIGHT:
+                yield piece
+        for dx, dy in ROYAL_OFFSETS:
+            piece = piece_map.get(Point(x + dx, y + dy))
+            if piece is not None and piece.color is color and piece.name is PieceName.KING:
+                yield piece
+        pawn_rank = y - color._value_
+        for pawn_file in (x - 1, x + 1):
+            piece = piece_map.get(Point(pawn_file, pawn_rank))
+            if piece is not None and piece.color is color and piece.name is PieceName.PAWN:
+                yield piece
+
+    def get_attackers(self,
+                      square: Point,
+                      color: PieceColor,
+                      ignore: Piece = None,
+                      sliders: List[Piece] = None) -> List[Piece]:
+        """
+        Find the pieces of a color that attack a square.
+
+        :param square: The square to check.
+        :type square: Point
+        :param color: Color of the attacking pieces.
+        :type color: PieceColor
+        :param ignore: Piece treated as absent when looking for blockers, e.g. the king.
+        :type ignore: Piece
+        :param sliders: Sliding pieces of the color, if already known.
+        :type sliders: List[Piece]
+        :return: The attacking pieces.
+        :rtype: List[Piece]
+        """
+        if self.counters is not None:
+            self.counters.check_tests += 1
+        attackers = list(self._iterate_leaper_attackers(square, color))
+        if sliders is None:
+            sliders = [piece for piece in self.pieces if piece.color == color and piece.sliding]
+        for piece in sliders:
+            if piece is not ignore and self.is_line_clear(piece, square, ignore):
+                attackers.append(piece)
+        return attackers
+
+    def is_square_attacked(self,
+                           square: Point,
+                           color: PieceColor,
+                           ignore: Piece = None) -> bool:
+        """
+        Check if any piece of a color attacks a square.
+        The leapers are found as in get_attackers, stopping at the first one,
+        the sliders by following the eight lines out of the square to their first piece,
+        so the cost doesn't grow with the number of pieces on the board.
+
+        :param square: The square to check.
+        :type square: Point
+        :param color: Color of the attacking pieces.
+        :type color: PieceColor
+        :param ignore: Piece treated as absent when looking for blockers, e.g. the king.
+        :type ignore: Piece
+        :return: True if the square is attacked, False otherwise.
+        :rtype: bool
+        """
+        if self.counters is not None:
+            self.counters.check_tests += 1
+        for _ in self._iterate_leaper_attackers(square, color):
+            return True
+        piece_map = self.piece_map
+        lines = self.lines
+        for step in ROYAL_OFFSETS:
+            blocker = lines.nearest(square, step)
+            if blocker is not None and ignore is not None and blocker == ignore.position:
+                blocker = lines.nearest(blocker, step)
+            if blocker is None:
+                continue
+            piece = piece_map[blocker]
+            if piece.color == color and piece.sliding and step in piece.offsets:
+                return True
+        return False
+
+    def is_line_clear(self, piece: Piece, square: Point, ignore: Piece = None) -> bool:
+        """
+        Check if a sliding piece reaches a square along one of its directions.
+
+        :param piece: The sliding piece.
+        :type piece: Piece
+        :param square: The square to reach.
+        :type square: Point
+        :param ignore: Piece treated as absent when looking for blockers.
+        :type ignore: Piece
+        :return: True if the square is on an unobstructed line of the piece.
+        :rtype: bool
+        """
+        step = get_step(piece.position, square)
+        if step is None or step not in piece.offsets:
+            return False
+        blocker = self.lines.nearest(piece.position, step)
+        if blocker is not None and ignore is not None and blocker == ignore.position:
+            blocker = self.lines.nearest(blocker, step)
+        if blocker is None:
+            return True
+        return get_distance(piece.position, blocker) >= get_distance(piece.position, square)
 
     def is_possible_move(self, move_to_check: Move) -> bool:
         """
@@ -261,7 +1029,7 @@ class Board:
         piece = move.moved
         target = move.target
         if is_legal:
-            generator = self.get_possible_moves_generator(piece)
+            generator = self.get_possible_moves_generator(piece, target, target)
             while True:
                 try:
                     move = next(generator)
@@ -271,15 +1039,20 @@ class Board:
                     return False
         return False
 
-    def capture(self, piece: Piece) -> None:
+    def capture(self, piece: Piece) -> int:
         """
         Capture a piece on the board.
 
         :param piece: The piece to capture.
         :type piece: Piece
+        :return: The index the piece had in the piece list.
+        :rtype: int
         """
+        index = self.pieces.index(piece)
+        del self.pieces[index]
         self.captured_pieces.append(piece)
-        self.pieces.remove(piece)
+        self.unindex_piece(piece)
+        return index
 
     def make_move(self, move: Move, check_if_legal: bool = True) -> None:
         """
@@ -301,42 +1074,82 @@ class Board:
         if not is_legal:
             raise InvalidMoveError()
 
+        if self.counters is not None:
+            self.counters.make_move += 1
+        piece = legal_move.moved
+        record = UndoRecord(self.position_key, self.current_player, piece.moved, piece.offsets,
+                            self.en_passant, self.halfmove_clock)
         self.change_player()
 
         self.moves.append(legal_move)
-        legal_move.moved.set_position(legal_move.target)
-        legal_move.moved.moved = True
-        try:
-            legal_move.moved.update_offsets()
-        except AttributeError:
-            pass
-        if legal_move.captured != self.none_piece:
-            self.capture(legal_move.captured)
-        if legal_move.flags.castling:
-            offset = legal_move.target - legal_move.source
-            if offset.x > 0:
+        self.undo_records.append(record)
+        if not legal_move.captured.is_none():
+            record.captured_index = self.capture(legal_move.captured)
+            self.halfmove_clock = 0
+        elif piece.is_pawn():
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if piece.is_pawn() and abs(legal_move.target.y - legal_move.source.y) == 2:
+            self.en_passant = Point(legal_move.source.x,
+                                    (legal_move.source.y + legal_move.target.y) // 2)
+        else:
+            self.en_passant = None
+        if record.player == PieceColor.BLACK:
+            self.fullmove_number += 1
+        self.unindex_piece(piece)
+        piece.set_position(legal_move.target)
+        self.index_piece(piece)
+        if legal_move.is_castling():
+            if legal_move.target.x > legal_move.source.x:
                 rook = self.get_piece_at(legal_move.source + Point(3,0))
-                rook.set_position(legal_move.source + Point(1,0))
-                rook.moved = True
+                target = legal_move.source + Point(1,0)
             else:
                 rook = self.get_piece_at(legal_move.source + Point(-4,0))
-                rook.set_position(legal_move.source + Point(-1,0))
-                rook.moved = True
+                target = legal_move.source + Point(-1,0)
+            record.rook = rook
+            record.rook_source = rook.position
+            record.rook_moved = rook.moved
+            self.unindex_piece(rook)
+            rook.set_position(target)
+            self.index_piece(rook)
+        if self.verify_key:
+            self.check_position_key()
 
     def undo_move(self) -> None:
         """
         Undo the last move made on the board.
+        The state is restored from the undo record pushed by make_move,
+        so nothing is hashed or recomputed.
         """
+        if self.counters is not None:
+            self.counters.undo_move += 1
         move = self.moves.pop()
-        move.moved.set_position(move.source)
-        if move.captured != self.none_piece:
-            self.pieces.append(move.captured)
-        move.moved.moved = False
-        self.change_player()
-        try:
-            move.moved.update_offsets()
-        except AttributeError:
-            pass
+        record = self.undo_records.pop()
+        piece = move.moved
+        self.unindex_piece(piece, False)
+        piece.position = move.source
+        piece.moved = record.moved
+        piece.offsets = record.offsets
+        self.index_piece(piece, False)
+        if record.captured_index >= 0:
+            captured = self.captured_pieces.pop()
+            self.pieces.insert(record.captured_index, captured)
+            self.index_piece(captured, False)
+        rook = record.rook
+        if rook is not None:
+            self.unindex_piece(rook, False)
+            rook.position = record.rook_source
+            rook.moved = record.rook_moved
+            self.index_piece(rook, False)
+        self.current_player = record.player
+        self.en_passant = record.en_passant
+        self.halfmove_clock = record.halfmove_clock
+        if record.player == PieceColor.BLACK:
+            self.fullmove_number -= 1
+        self.position_key = record.position_key
+        if self.verify_key:
+            self.check_position_key()
 
     def is_in_check(self, color: PieceColor) -> bool:
         """
@@ -347,13 +1160,10 @@ class Board:
         :return: True if the player is in check, False otherwise.
         :rtype: bool
         """
-        king = self.find_pieces(PieceName.KING, color)[0]
-        for piece in self.pieces:
-            if piece.color != color:
-                generator = self.get_possible_moves_generator(piece, king.position, king.position)
-                for move in generator:
-                    if move.target == king.position:
-                        return True
+        enemy = PieceColor.BLACK if color == PieceColor.WHITE else PieceColor.WHITE
+        for king in self.find_pieces(PieceName.KING, color):
+            if self.is_square_attacked(king.position, enemy):
+                return True
         return False
 
     def is_in_checkmate(self, color: PieceColor) -> bool:
@@ -369,14 +1179,63 @@ class Board:
                 print(piece.get_fen_char(), end=" ")
             print()
 
+class UndoRecord:
+    """
+    This class stores what make_move changed beyond the move itself,
+    so undo_move can restore the previous state exactly.
+    """
+    __slots__ = ("position_key", "player", "moved", "offsets", "en_passant", "halfmove_clock",
+                 "captured_index", "rook", "rook_source", "rook_moved")
+
+    def __init__(self, position_key: int, player: PieceColor, moved: bool, offsets: tuple,
+                 en_passant: Optional[Point] = None, halfmove_clock: int = 0) -> None:
+        """
+        The constructor for the UndoRecord class.
+
+        :param position_key: Position key before the move.
+        :type position_key: int
+        :param player: Side to move before the move.
+        :type player: PieceColor
+        :param moved: Moved flag of the moving piece before the move.
+        :type moved: bool
+        :param offsets: Offsets of the moving piece before the move.
+        :type offsets: tuple
+        :param en_passant: En passant square before the move.
+        :type en_passant: Optional[Point]
+        :param halfmove_clock: Halfmove clock before the move.
+        :type halfmove_clock: int
+        """
+        self.position_key = position_key
+        self.player = player
+        self.moved = moved
+        self.offsets = offsets
+        self.en_passant = en_passant
+        self.halfmove_clock = halfmove_clock
+        self.captured_index = -1
+        self.rook = None
+        self.rook_source = None
+        self.rook_moved = False
+
 class Validator:
     """
     This class is responsible for validating moves.
+    Rejected moves get a RejectReason code. The reasons are only logged for moves
+    validated outside of move generation, or for every move when tracing is on.
     """
+    def __init__(self, trace: bool = False) -> None:
+        """
+        The constructor for the Validator class.
+
+        :param trace: If the rejections of generated moves should be logged too.
+        :type trace: bool
+        """
+        self.trace = trace
+
     def __call__(self,
                  move_to_validate: Move,
                  board_state: Board,
-                 in_generator: bool = False
+                 in_generator: bool = False,
+                 context: "LegalityContext" = None
                 ) -> Tuple[Move, bool]:
         """
         This method performs all the logic to categorize move as legal or illegal.
@@ -387,20 +1246,49 @@ class Validator:
         :type board: Board
         :param in_generator: If the method is called from a generator.
         :type in_generator: bool
+        :param context: Precomputed state of the position, if available.
+        :type context: LegalityContext
         :return: Validated move.
         :rtype: Move
         """
         move_to_validate.moved = board_state.get_piece_at(move_to_validate.source)
         move_to_validate.captured = board_state.get_piece_at(move_to_validate.target)
 
-        if not self.is_move_legal(move_to_validate, board_state, in_generator):
+        counters = board_state.counters
+        if counters is not None:
+            counters.validator_calls += 1
+        if not self.is_move_legal(move_to_validate, board_state, in_generator, context):
             move_to_validate.legal = False
+            if counters is not None:
+                counters.rejections[move_to_validate.reject_reason] += 1
+            if self.trace or not in_generator:
+                logger.warning("%s | %s", move_to_validate, move_to_validate.reject_reason.value)
         else:
             move_to_validate.legal = True
+            if move_to_validate.is_castling() and (self.trace or not in_generator):
+                logger.info("%s | Castling", move_to_validate)
 
         return move_to_validate, move_to_validate.legal
 
-    def is_move_legal(self, move: Move, board: Board, in_generator: bool = False) -> bool:
+    def reject(self, move: Move, reason: RejectReason) -> bool:
+        """
+        This method records why a move is illegal.
+
+        :param move: rejected move.
+        :type move: Move
+        :param reason: reason of the rejection.
+        :type reason: RejectReason
+        :return: Always False, so it can be returned by the checks directly.
+        :rtype: bool
+        """
+        move.reject_reason = reason
+        return False
+
+    def is_move_legal(self,
+                      move: Move,
+                      board: Board,
+                      in_generator: bool = False,
+                      context: "LegalityContext" = None) -> bool:
         """
         This method checks if a move is legal.
 
@@ -410,6 +1298,8 @@ class Validator:
         :type board: Board
         :param in_generator: If the method is called from a generator.
         :type in_generator: bool
+        :param context: Precomputed state of the position, if available.
+        :type context: LegalityContext
         :raises NonePieceError: If there is no piece at the source of the move.
         :return: True if the move is legal, False otherwise.
         :rtype: bool
@@ -424,16 +1314,18 @@ class Validator:
         if piece.name == PieceName.PAWN:
             if move.captured.name == PieceName.NONE:
                 if abs(offset) == Point(1,1):
-                    logger.warning("%s | Pawn can't move diagonally without capturing", str(move))
-                    return False
+                    return self.reject(move, RejectReason.PAWN_DIAGONAL)
+                # a double push can't jump over a piece, without this check
+                # perft 3 of the starting position finds 8982 nodes instead of 8902
+                if abs(offset) == Point(0,2) and \
+                    not board.get_piece_at(move.source + Point(0, offset.y // 2)).is_none():
+                    return self.reject(move, RejectReason.PATH_BLOCKED)
             else:
                 if abs(offset) != Point(1,1):
-                    logger.warning("%s | Pawn can't move forward without capturing", str(move))
-                    return False
+                    return self.reject(move, RejectReason.PAWN_FORWARD)
 
         if piece.color == move.captured.color:
-            logger.warning("%s | Can't capture own piece", str(move))
-            return False
+            return self.reject(move, RejectReason.OWN_CAPTURE)
 
         if piece.is_king():
             if offset == Point(2,0) and \
@@ -446,88 +1338,217 @@ class Validator:
             not board.get_piece_at(move.source + Point(-4,0)).moved and \
             board.get_piece_at(move.source + Point(-4,0)).name == PieceName.ROOK:
                 move.flags.castling = True
-            if move.flags.castling:
-                logger.info("%s | Castling", str(move))
-
-        if piece.is_sliding() or (piece.is_king() and move.flags.castling):
-            source = move.source.copy()
-            target = move.target.copy()
-            direction = target - source
-            direction.x = 1 if direction.x > 0 else -1 if direction.x < 0 else 0
-            direction.y = 1 if direction.y > 0 else -1 if direction.y < 0 else 0
-            source += direction
-            while source != target:
-                if board.get_piece_at(source).name != PieceName.NONE:
-                    logger.warning("%s | Path is blocked by %s",
-                                   str(move),
-                                   board.get_piece_at(source).name.name)
-                    return False
-                source += direction
+
+        if (piece.is_sliding() or (piece.is_king() and move.is_castling())) and \
+            move.source != move.target:
+            direction = get_step(move.source, move.target)
+            if direction is None or (piece.is_sliding() and direction not in piece.offsets):
+                return self.reject(move, RejectReason.NOT_ON_LINE)
+            blocker = board.lines.nearest(move.source, direction)
+            if blocker is not None and \
+                get_distance(move.source, blocker) < get_distance(move.source, move.target):
+                return self.reject(move, RejectReason.PATH_BLOCKED)
 
         if piece.is_king():
             if offset == Point(-2,0):
                 if board.get_piece_at(move.source + Point(-3,0)).name != PieceName.NONE:
-                    logger.warning("%s | Can't castle through pieces", str(move))
-                    return False
+                    return self.reject(move, RejectReason.CASTLE_BLOCKED)
 
         if move.source == move.target:
-            log_msg = f"{str(move)} | Source and target are the same"
-            logger.warning(log_msg)
-            return False
+            return self.reject(move, RejectReason.SAME_SQUARE)
 
         if move.source != piece.position:
-            log_msg = f"{str(move)} | Source and piece position are different"
-            logger.warning(log_msg)
-            return False
+            return self.reject(move, RejectReason.WRONG_SOURCE)
 
         if not piece.sliding:
             if move.target not in [piece.position + offset for offset in piece.offsets]:
-                if not move.flags.castling:
-                    log_msg = f"{str(move)} | Move not in piece's offsets"
-                    logger.warning(log_msg)
-                    return False
+                if not move.is_castling():
+                    return self.reject(move, RejectReason.NOT_IN_OFFSETS)
 
-        board.make_move(move, False)
-        
-        enemy_pieces = board.get_black_pieces() if piece.color == PieceColor.WHITE else board.get_white_pieces()
-        
-        for enemy_piece in enemy_pieces:
-            offset_generator = enemy_piece.get_offset_generator(Point(1,1), Point(8,8))
-            for offset in offset_generator:
-                target_checked = board.get_piece_at(enemy_piece.position + offset)
-                if not target_checked.is_king():
-                    continue
-                if enemy_piece.is_sliding():
-                    source = enemy_piece.position.copy()
-                    target = target_checked.position.copy()
-                    direction = target - source
-                    direction.x = 1 if direction.x > 0 else -1 if direction.x < 0 else 0
-                    direction.y = 1 if direction.y > 0 else -1 if direction.y < 0 else 0
-                    source += direction
-                    while source != target:
-                        if board.get_piece_at(source).name != PieceName.NONE:
-                            break
-                        source += direction
-                    if source != target:
-                        continue
-                    if target_checked.is_king() and \
-                        enemy_piece.color != target_checked.color:
-                        logger.warning("%s | Can't move, sliding checks.", str(move))
-                        board.undo_move()
-                        return False
-                if enemy_piece.is_pawn() and abs(offset) == Point(1,1):
-                    if target_checked.is_king() and \
-                        enemy_piece.color != target_checked.color:
-                        logger.warning("%s | Can't move, pawn checks.", str(move))
-                        board.undo_move()
-                        return False
-                elif enemy_piece.is_knight():
-                    if target_checked.is_king() and \
-                        enemy_piece.color != target_checked.color:
-                        logger.warning("%s | Can't move, knight checks.", str(move))
-                        board.undo_move()
-                        return False
-        
-        board.undo_move()
+        if context is None or context.color != piece.color:
+            context = LegalityContext(board, piece.color)
+        return self.is_king_safe(move, context)
+
+    def is_king_safe(self, move: Move, context: "LegalityContext") -> bool:
+        """
+        This method checks if a pseudo-legal move leaves the own king safe.
+        It relies on the pins, checkers and attacked squares of the context,
+        so the move doesn't have to be played on the board.
+
+        :param move: move to be checked.
+        :type move: Move
+        :param context: Precomputed state of the position.
+        :type context: LegalityContext
+        :return: True if the king isn't attacked after the move, False otherwise.
+        :rtype: bool
+        """
+        piece = move.moved
+        king = context.king
+        if king.is_none():
+            return True
+
+        if piece is king:
+            if move.is_castling():
+                if context.checkers:
+                    return self.reject(move, RejectReason.CASTLE_IN_CHECK)
+                step = Point(1,0) if move.target.x > move.source.x else Point(-1,0)
+                if context.is_attacked(move.source + step) or context.is_attacked(move.target):
+                    return self.reject(move, RejectReason.CASTLE_ATTACKED)
+                return True
+            if context.is_attacked(move.target):
+                return self.reject(move, RejectReason.TARGET_ATTACKED)
+            return True
+
+        if len(context.checkers) > 1:
+            return self.reject(move, RejectReason.DOUBLE_CHECK)
+
+        if context.checkers and not context.resolves_check(move.target):
+            return self.reject(move, RejectReason.CHECK_NOT_RESOLVED)
+
+        pin = context.pins.get(piece)
+        if pin is not None:
+            relative = move.target - king.position
+            if relative.x * pin.y != relative.y * pin.x:
+                return self.reject(move, RejectReason.PINNED)
 
         return True
+
+    def restrict_ray_move(self, ray: RayMove,
+                          context: "LegalityContext") -> Optional[RayMove]:
+        """
+        This method narrows a pseudo-legal ray move down to its legal squares.
+        Every square of a ray is equally safe for the king unless the piece is pinned
+        or the king is in check, when only the interposing square is left.
+
+        :param ray: ray move to be checked.
+        :type ray: RayMove
+        :param context: Precomputed state of the position.
+        :type context: LegalityContext
+        :return: The legal part of the ray, or None if no square is legal.
+        :rtype: Optional[RayMove]
+        """
+        king = context.king
+        if king.is_none():
+            return ray
+        if len(context.checkers) > 1:
+            return None
+
+        pin = context.pins.get(ray.moved)
+        if pin is not None and ray.step != pin and ray.step != Point(-pin.x, -pin.y):
+            return None
+
+        if context.checkers:
+            checker = context.checkers[0]
+            if not checker.sliding:
+                return None
+            check_step = get_step(king.position, checker.position)
+            crossing = get_intersection(ray.source, ray.step, king.position, check_step)
+            if crossing is None:
+                return None
+            distance, king_distance = crossing
+            if not ray.get_distance(ray.get_target(distance)) or \
+                not 0 < king_distance < get_distance(king.position, checker.position):
+                return None
+            return RayMove(ray.moved, ray.step, distance, distance)
+
+        return ray
+
+class LegalityContext:
+    """
+    This class holds the state of a position shared by the validation of all its moves:
+    the king of the side to move, the enemy pieces, the pieces giving check,
+    the pinned pieces and a cache of squares attacked by the enemy.
+    """
+    def __init__(self, board: Board, color: PieceColor) -> None:
+        """
+        The constructor for the LegalityContext class.
+
+        :param board: Board to compute the state of.
+        :type board: Board
+        :param color: Color of the side to move.
+        :type color: PieceColor
+        """
+        self.board = board
+        self.color = color
+        self.enemy_color = PieceColor.BLACK if color == PieceColor.WHITE else PieceColor.WHITE
+        self.own_pieces = [piece for piece in board.pieces if piece.color == color]
+        self.enemy_pieces = [piece for piece in board.pieces if piece.color == self.enemy_color]
+        self.enemy_sliders = [piece for piece in self.enemy_pieces if piece.sliding]
+        self.own_sliders = [piece for piece in self.own_pieces if piece.sliding]
+        kings = [piece for piece in self.own_pieces if piece.is_king()]
+        self.king = kings[0] if kings else board.none_piece
+        self.checkers = []
+        self.pins = {}
+        self.attacked = {}
+        if not self.king.is_none():
+            self.checkers = board.get_attackers(self.king.position, self.enemy_color,
+                                                sliders=self.enemy_sliders)
+            self.pins = self.get_pins()
+
+    def resolves_check(self, square: Point) -> bool:
+        """
+        Check if a non-king move landing on a square resolves a single check:
+        it has to capture the checker or, for a sliding checker, block the line.
+
+        :param square: The target square of the move.
+        :type square: Point
+        :return: True if the square resolves the check, False otherwise.
+        :rtype: bool
+        """
+        checker = self.checkers[0]
+        if square == checker.position:
+            return True
+        if not checker.sliding:
+            return False
+        king_position = self.king.position
+        return get_step(king_position, square) == get_step(king_position, checker.position) and \
+            get_distance(king_position, square) < get_distance(king_position, checker.position)
+
+    def get_pins(self) -> dict:
+        """
+        Find the own pieces absolutely pinned to the king.
+        Every ray from the king is followed to its first two pieces.
+
+        :return: Pinned pieces mapped to the direction from the king to the pinner.
+        :rtype: dict
+        """
+        pins = {}
+        lines = self.board.lines
+        piece_map = self.board.piece_map
+        king_position = self.king.position
+        for step in ROYAL_OFFSETS:
+            first = lines.nearest(king_position, step)
+            if first is None or piece_map[first].color != self.color:
+                continue
+            second = lines.nearest(first, step)
+            if second is None:
+                continue
+            pinner = piece_map[second]
+            if pinner.color == self.enemy_color and pinner.sliding and step in pinner.offsets:
+                pins[piece_map[first]] = step
+        return pins
+
+    def is_in_check(self) -> bool:
+        """
+        Check if the side to move is in check.
+
+        :return: True if the king is attacked, False otherwise.
+        :rtype: bool
+        """
+        return bool(self.checkers)
+
+    def is_attacked(self, square: Point) -> bool:
+        """
+        Check if the enemy attacks a square, looking through the own king.
+        Results are cached for the lifetime of the context.
+
+        :param square: The square to check.
+        :type square: Point
+        :return: True if the square is attacked, False otherwise.
+        :rtype: bool
+        """
+        attacked = self.attacked.get(square)
+        if attacked is None:
+            attacked = self.board.is_square_attacked(square, self.enemy_color, self.king)
+            self.attacked[square] = attacked
+        return attacked
@@ -0,0 +1,320 @@
+"""
+This module contains the ChunkIndex class,
+which groups the pieces of a board into fixed-size square chunks.
+
+The plane is cut into CHUNK_SIZE x CHUNK_SIZE tiles. Every tile holding at least
+one piece is a Chunk in a dictionary keyed by the chunk coordinates, with an
+occupancy mask of one bit per square, one mask per color, and its pieces by bit.
+The color masks are plain attributes rather than a dictionary keyed by PieceColor,
+as hashing an enum member costs more than the rest of the update.
+The chunks are grouped the same way into regions of CHUNK_SIZE x CHUNK_SIZE chunks,
+each with a mask of its occupied chunks.
+
+A rectangle query walks the regions overlapping it, or the occupied regions if
+there are fewer of them, then only the occupied chunks under the part of the region
+mask inside the rectangle, then only the pieces under the part of the chunk mask
+inside it. Its cost follows the number of pieces found, not the area.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from .bitboards import iterate_bits
+from .pieces import Piece, PieceColor
+from .point import Point
+
+CHUNK_SHIFT = 4
+CHUNK_SIZE = 1 << CHUNK_SHIFT
+CHUNK_MASK = CHUNK_SIZE - 1
+ROW_MASK = (1 << CHUNK_SIZE) - 1
+
+WHITE = PieceColor.WHITE
+
+@lru_cache(maxsize=None)
+def get_tile_mask(left: int, bottom: int, right: int, top: int) -> int:
+    """
+    Mask of a rectangle of a chunk, in coordinates local to the chunk.
+
+    :param left: first column, inclusive
+    :type left: int
+    :param bottom: first row, inclusive
+    :type bottom: int
+    :param right: last column, inclusive
+    :type right: int
+    :param top: last row, inclusive
+    :type top: int
+    :return: mask with the squares of the rectangle set
+    :rtype: int
+    """
+    row = ((1 << (right - left + 1)) - 1) << left
+    mask = 0
+    for y in range(bottom, top + 1):
+        mask |= row << (y * CHUNK_SIZE)
+    return mask
+
+def get_local_index(x: int, y: int) -> int:
+    """
+    Index of the bit of a square inside its chunk, or of a chunk inside its region.
+
+    :param x: x coordinate
+    :type x: int
+    :param y: y coordinate
+    :type y: int
+    :return: bit index, between 0 and CHUNK_SIZE ** 2 - 1
+    :rtype: int
+    """
+    return (y & CHUNK_MASK) << CHUNK_SHIFT | x & CHUNK_MASK
+
+class Chunk:
+    """
+    The Chunk class stores the pieces of one tile of the board.
+    """
+    __slots__ = ("mask", "white", "black", "pieces")
+
+    def __init__(self) -> None:
+        """
+        The constructor for the Chunk class.
+        """
+        self.mask = 0
+        self.white = 0
+        self.black = 0
+        self.pieces: Dict[int, Piece] = {}
+
+    def get_color_mask(self, color: PieceColor) -> int:
+        """
+        Returns the occupancy mask of the pieces of a color.
+
+        :param color: color of the pieces
+        :type color: PieceColor
+        :return: mask of the squares of the pieces
+        :rtype: int
+        """
+        return self.white if color is PieceColor.WHITE else self.black
+
+    def copy(self) -> "Chunk":
+        """
+        Returns a copy of the chunk holding the same pieces.
+
+        :return: copied chunk
+        :rtype: Chunk
+        """
+        chunk = Chunk()
+        chunk.mask = self.mask
+        chunk.white = self.white
+        chunk.black = self.black
+        chunk.pieces = dict(self.pieces)
+        return chunk
+
+class ChunkIndex:
+    """
+    The ChunkIndex class stores the pieces of a board in chunks
+    keyed by their chunk coordinates.
+    """
+    def __init__(self) -> None:
+        """
+        The constructor for the ChunkIndex class.
+        """
+        self.chunks: Dict[Tuple[int, int], Chunk] = {}
+        self.regions: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def clear(self) -> None:
+        """
+        Remove every piece from the index.
+        """
+        self.chunks = {}
+        self.regions = {}
+
+    def copy(self, pieces: Dict[Point, Piece]) -> "ChunkIndex":
+        """
+        Returns a copy of the index holding other pieces on the same squares,
+        as made by Board.copy.
+
+        :param pieces: the pieces of the copy by square
+        :type pieces: Dict[Point, Piece]
+        :return: copied index
+        :rtype: ChunkIndex
+        """
+        clone = ChunkIndex()
+        for key, chunk in self.chunks.items():
+            chunk = chunk.copy()
+            chunk.pieces = {bit: pieces[piece.position] for bit, piece in chunk.pieces.items()}
+            clone.chunks[key] = chunk
+        clone.regions = dict(self.regions)
+        return clone
+
+    def add(self, piece: Piece) -> None:
+        """
+        Add a piece under its current position, replacing the piece on the square if any.
+
+        :param piece: piece to add
+        :type piece: Piece
+        """
+        x, y = piece.position
+        key = (x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = Chunk()
+            region = (key[0] >> CHUNK_SHIFT, key[1] >> CHUNK_SHIFT)
+            self.regions[region] = self.regions.get(region, 0) | 1 << get_local_index(*key)
+        index = (y & CHUNK_MASK) << CHUNK_SHIFT | x & CHUNK_MASK
+        bit = 1 << index
+        chunk.mask |= bit
+        if piece.color is WHITE:
+            chunk.white |= bit
+            chunk.black &= ~bit
+        else:
+            chunk.black |= bit
+            chunk.white &= ~bit
+        chunk.pieces[index] = piece
+
+    def remove(self, piece: Piece) -> None:
+        """
+        Remove a piece from under its current position.
+        Chunks left empty are dropped.
+
+        :param piece: piece to remove, has to be in the index
+        :type piece: Piece
+        """
+        x, y = piece.position
+        key = (x >> CHUNK_SHIFT, y >> CHUNK_SHIFT)
+        chunk = self.chunks[key]
+        index = (y & CHUNK_MASK) << CHUNK_SHIFT | x & CHUNK_MASK
+        bit = ~(1 << index)
+        chunk.mask &= bit
+        if not chunk.mask:
+            del self.chunks[key]
+            region = (key[0] >> CHUNK_SHIFT, key[1] >> CHUNK_SHIFT)
+            mask = self.regions[region] & ~(1 << get_local_index(*key))
+            if mask:
+                self.regions[region] = mask
+            else:
+                del self.regions[region]
+            return
+        if piece.color is WHITE:
+            chunk.white &= bit
+        else:
+            chunk.black &= bit
+        del chunk.pieces[index]
+
+    def query(self, bottom_left: Point, top_right: Point) -> List[Piece]:
+        """
+        Find the pieces inside a rectangle.
+
+        :param bottom_left: bottom left corner of the rectangle, inclusive
+        :type bottom_left: Point
+        :param top_right: top right corner of the rectangle, inclusive
+        :type top_right: Point
+        :return: pieces inside the rectangle, chunk by chunk
+        :rtype: List[Piece]
+        """
+        left, bottom = bottom_left
+        right, top = top_right
+        if left > right or bottom > top:
+            return []
+        pieces = []
+        chunks = self.chunks
+        for cx, cy in self.get_chunk_keys(left >> CHUNK_SHIFT, bottom >> CHUNK_SHIFT,
+                                          right >> CHUNK_SHIFT, top >> CHUNK_SHIFT):
+            chunk = chunks[(cx, cy)]
+            x, y = cx << CHUNK_SHIFT, cy << CHUNK_SHIFT
+            mask = chunk.mask & get_tile_mask(max(left - x, 0), max(bottom - y, 0),
+                                              min(right - x, CHUNK_MASK), min(top - y, CHUNK_MASK))
+            if mask == chunk.mask:
+                pieces.extend(chunk.pieces.values())
+            else:
+                chunk_pieces = chunk.pieces
+                pieces.extend(chunk_pieces[index] for index in iterate_bits(mask))
+        return pieces
+
+    def get_chunk_keys(self, left: int, bottom: int,
+                       right: int, top: int) -> List[Tuple[int, int]]:
+        """
+        Find the occupied chunks inside a rectangle of chunk coordinates.
+
+        :param left: first chunk column, inclusive
+        :type left: int
+        :param bottom: first chunk row, inclusive
+        :type bottom: int
+        :param right: last chunk column, inclusive
+        :type right: int
+        :param top: last chunk row, inclusive
+        :type top: int
+        :return: coordinates of the occupied chunks
+        :rtype: List[Tuple[int, int]]
+        """
+        region_left, region_bottom = left >> CHUNK_SHIFT, bottom >> CHUNK_SHIFT
+        region_right, region_top = right >> CHUNK_SHIFT, top >> CHUNK_SHIFT
+        regions = self.regions
+        area = (region_right - region_left + 1) * (region_top - region_bottom + 1)
+        if area <= len(regions):
+            keys = [(rx, ry) for ry in range(region_bottom, region_top + 1)
+                    for rx in range(region_left, region_right + 1) if (rx, ry) in regions]
+        else:
+            keys = [key for key in regions
+                    if region_left <= key[0] <= region_right and
+                    region_bottom <= key[1] <= region_top]
+        chunk_keys = []
+        for rx, ry in keys:
+            x, y = rx << CHUNK_SHIFT, ry << CHUNK_SHIFT
+            mask = regions[(rx, ry)] & get_tile_mask(
+                max(left - x, 0), max(bottom - y, 0),
+                min(right - x, CHUNK_MASK), min(top - y, CHUNK_MASK))
+            for index in iterate_bits(mask):
+                chunk_keys.append((x | index & CHUNK_MASK, y | index >> CHUNK_SHIFT))
+        return chunk_keys
+
+    def get_extent(self, color: PieceColor) -> Optional[List[int]]:
+        """
+        Find the smallest rectangle holding the pieces of a color.
+        Chunks lying entirely inside the rectangle found so far are skipped,
+        the others only cost a few operations on their color mask.
+
+        :param color: color of the pieces
+        :type color: PieceColor
+        :return: left, bottom, right and top of the rectangle, or None if there are no pieces
+        :rtype: Optional[List[int]]
+        """
+        extent = None
+        for (cx, cy), chunk in self.chunks.items():
+            mask = chunk.white if color is WHITE else chunk.black
+            if not mask:
+                continue
+            x, y = cx << CHUNK_SHIFT, cy << CHUNK_SHIFT
+            if extent is not None and extent[0] < x and x + CHUNK_MASK < extent[2] and \
+                    extent[1] < y and y + CHUNK_MASK < extent[3]:
+                continue
+            bottom = y + ((mask & -mask).bit_length() - 1 >> CHUNK_SHIFT)
+            top = y + (mask.bit_length() - 1 >> CHUNK_SHIFT)
+            # fold the rows onto the first one to get the occupied columns
+            width = CHUNK_SIZE * CHUNK_SIZE
+            while width > CHUNK_SIZE:
+                width >>= 1
+                mask |= mask >> width
+            columns = mask & ROW_MASK
+            left = x + (columns & -columns).bit_length() - 1
+            right = x + columns.bit_length() - 1
+            if extent is None:
+                extent = [left, bottom, right, top]
+            else:
+                extent[0] = min(extent[0], left)
+                extent[1] = min(extent[1], bottom)
+                extent[2] = max(extent[2], right)
+                extent[3] = max(extent[3], top)
+        return extent
+
+    def get_neighbours(self, square: Point, radius: int) -> List[Piece]:
+        """
+        Find the pieces at most radius squares away from a square in both directions,
+        the piece on the square included.
+
+        :param square: centre of the neighbourhood
+        :type square: Point
+        :param radius: largest distance along x and along y
+        :type radius: int
+        :return: pieces in the neighbourhood
+        :rtype: List[Piece]
+        """
+        x, y = square
+        return self.query(Point(x - radius, y - radius), Point(x + radius, y + radius))
@@ -0,0 +1,63 @@
+"""
+This module contains the Counters class,
+which counts the work done on the hot paths of a board.
+
+A board only counts while a Counters object is attached to it,
+otherwise every counting site costs a single None check.
+"""
+
+from collections import Counter
+from typing import Dict
+from .pieces import PieceName
+from .moves import RejectReason
+
+class Counters:
+    """
+    The Counters class stores how often the hot paths of a board ran.
+    """
+    __slots__ = ("moves_generated", "rays_generated", "validator_calls", "rejections",
+                 "make_move", "undo_move", "get_piece_at", "check_tests", "misfire_iterations")
+
+    def __init__(self) -> None:
+        """
+        The constructor for the Counters class.
+        """
+        self.moves_generated: Dict[PieceName, int] = Counter()
+        self.rays_generated: Dict[PieceName, int] = Counter()
+        self.validator_calls = 0
+        self.rejections: Dict[RejectReason, int] = Counter()
+        self.make_move = 0
+        self.undo_move = 0
+        self.get_piece_at = 0
+        self.check_tests = 0
+        self.misfire_iterations = 0
+
+    def reset(self) -> None:
+        """
+        Set every counter back to zero.
+        """
+        self.__init__()
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current counts as plain data, ready to be dumped as JSON.
+        Piece kinds and rejection reasons are keyed by their lowercase names.
+
+        :return: counts by counter name
+        :rtype: dict
+        """
+        return {"moves_generated": {name.name.lower(): count
+                                    for name, count in self.moves_generated.items()},
+                "rays_generated": {name.name.lower(): count
+                                   for name, count in self.rays_generated.items()},
+                "validator_calls": self.validator_calls,
+                "rejections": {reason.name.lower(): count
+                               for reason, count in self.rejections.items()},
+                "make_move": self.make_move,
+                "undo_move": self.undo_move,
+                "get_piece_at": self.get_piece_at,
+                "check_tests": self.check_tests,
+                "misfire_iterations": self.misfire_iterations}
+
+    def __repr__(self) -> str:
+        return f"Counters({self.snapshot()})"
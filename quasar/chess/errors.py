@@ -65,3 +65,19 @@ class EmptyPositionError(BaseChessError):
     :param BaseChessError: The base chess error class.
     :type BaseChessError: BaseChessError
     """
+
+class PositionKeyError(BaseChessError):
+    """
+    Raised when the incremental position key doesn't match a full recompute.
+
+    :param BaseChessError: The base chess error class.
+    :type BaseChessError: BaseChessError
+    """
+
+class PositionStoreError(BaseChessError):
+    """
+    Raised when a position store file is malformed or a record doesn't fit it.
+
+    :param BaseChessError: The base chess error class.
+    :type BaseChessError: BaseChessError
+    """
@@ -0,0 +1,217 @@
+"""
+This module parses and formats positions in standard FEN
+and in the extended FEN used for the unbounded board.
+
+Extended FEN keeps the five state fields of FEN after the placement
+but lists the pieces one by one with numeric coordinates, so they can stand
+anywhere on the plane, negative coordinates included:
+
+    Ke1 -> K5,1    moved black rook at (-3, 12) -> r-3,12*
+
+The pieces are separated by slashes, a trailing * marks a piece that has moved,
+and an empty board is written as -. The fields that follow are the side to move,
+the en passant square as x,y or -, the halfmove clock and the fullmove number:
+
+    K5,1/R8,1/P-3,2*/k5,8 b 4,3 0 12
+
+The moved marks replace the castling field: a king and a rook
+that haven't moved can castle, wherever they stand.
+"""
+
+#Built-in imports
+from typing import Generator, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+#Internal imports
+from .point import Point
+from .pieces import PieceColor, PieceName
+from .errors import InvalidPositionError
+from .utils import standard_notation_to_point, point_to_standard_notation
+
+if TYPE_CHECKING:
+    from .board import Board
+
+# name, color, x, y, moved
+PieceRecord = Tuple[PieceName, PieceColor, int, int, bool]
+# pieces, side to move, en passant square, halfmove clock, fullmove number
+Position = Tuple[List[PieceRecord], PieceColor, Optional[Point], int, int]
+
+FEN_PIECES = {char: (name, color)
+              for name, upper in ((PieceName.PAWN, "P"), (PieceName.KNIGHT, "N"),
+                                  (PieceName.BISHOP, "B"), (PieceName.ROOK, "R"),
+                                  (PieceName.QUEEN, "Q"), (PieceName.KING, "K"))
+              for char, color in ((upper, PieceColor.WHITE), (upper.lower(), PieceColor.BLACK))}
+FEN_COLORS = {"w": PieceColor.WHITE, "b": PieceColor.BLACK}
+COLOR_CHARS = {PieceColor.WHITE: "w", PieceColor.BLACK: "b"}
+
+# castling right: king square, rook square, color
+CASTLING_RIGHTS = {"K": (Point(5, 1), Point(8, 1), PieceColor.WHITE),
+                   "Q": (Point(5, 1), Point(1, 1), PieceColor.WHITE),
+                   "k": (Point(5, 8), Point(8, 8), PieceColor.BLACK),
+                   "q": (Point(5, 8), Point(1, 8), PieceColor.BLACK)}
+
+def parse_fen(fen: str) -> Position:
+    """
+    Parse a standard FEN string.
+    Pawns off their starting rank are marked as moved, and so are the kings
+    and rooks that the castling field doesn't give a right to.
+
+    :param fen: FEN string
+    :type fen: str
+    :raises InvalidPositionError: when the string isn't valid FEN
+    :return: parsed position
+    :rtype: Position
+    """
+    try:
+        placement, turn, castling, en_passant, halfmove, fullmove = fen.split()
+        rows = placement.split("/")
+        if len(rows) != 8:
+            raise ValueError(f"expected 8 ranks, got {len(rows)}")
+        rights = {} if castling == "-" else {CASTLING_RIGHTS[char][:2]: char
+                                             for char in castling}
+        castlers = {square for pair in rights for square in pair}
+        pieces = []
+        for index, row in enumerate(rows):
+            y = 8 - index
+            x = 1
+            for char in row:
+                if char.isdigit():
+                    x += int(char)
+                    continue
+                name, color = FEN_PIECES[char]
+                if name == PieceName.PAWN:
+                    moved = y != (2 if color == PieceColor.WHITE else 7)
+                elif name in (PieceName.KING, PieceName.ROOK):
+                    moved = (x, y) not in castlers
+                else:
+                    moved = False
+                pieces.append((name, color, x, y, moved))
+                x += 1
+            if x != 9:
+                raise ValueError(f"rank {y} has {x - 1} squares")
+        for (king, rook), char in rights.items():
+            color = CASTLING_RIGHTS[char][2]
+            if (PieceName.KING, color, *king, False) not in pieces or \
+                    (PieceName.ROOK, color, *rook, False) not in pieces:
+                raise ValueError(f"castling right {char} without its king and rook")
+        return (pieces, FEN_COLORS[turn],
+                None if en_passant == "-" else standard_notation_to_point(en_passant),
+                int(halfmove), int(fullmove))
+    except (ValueError, KeyError) as error:
+        raise InvalidPositionError(f"Invalid FEN {fen!r}: {error}") from error
+
+def parse_xfen(xfen: str) -> Position:
+    """
+    Parse an extended FEN string.
+
+    :param xfen: extended FEN string
+    :type xfen: str
+    :raises InvalidPositionError: when the string isn't valid extended FEN
+    :return: parsed position
+    :rtype: Position
+    """
+    try:
+        placement, turn, en_passant, halfmove, fullmove = xfen.split()
+        pieces = []
+        if placement != "-":
+            for token in placement.split("/"):
+                name, color = FEN_PIECES[token[0]]
+                moved = token[-1] == "*"
+                x, y = token[1:-1 if moved else None].split(",")
+                pieces.append((name, color, int(x), int(y), moved))
+        if en_passant == "-":
+            square = None
+        else:
+            x, y = en_passant.split(",")
+            square = Point(int(x), int(y))
+        return pieces, FEN_COLORS[turn], square, int(halfmove), int(fullmove)
+    except (ValueError, KeyError, IndexError) as error:
+        raise InvalidPositionError(f"Invalid extended FEN {xfen!r}: {error}") from error
+
+def iter_xfen(lines: Iterable[str]) -> Generator[Position, None, None]:
+    """
+    Parse extended FEN strings one line at a time,
+    skipping empty lines and lines starting with #.
+    Only the current line is held in memory, so files of any size can be streamed.
+
+    :param lines: lines to parse, e.g. an open file
+    :type lines: Iterable[str]
+    :raises InvalidPositionError: when a line isn't valid extended FEN
+    :yield: parsed position
+    :rtype: Position
+    """
+    for line in lines:
+        if line.isspace() or not line or line[0] == "#":
+            continue
+        yield parse_xfen(line)
+
+def stream_positions(lines: Iterable[str], board: "Board") -> Generator["Board", None, None]:
+    """
+    Load extended FEN strings one line at a time into the same board.
+    The board is reused for every position, so copy it to keep one.
+
+    :param lines: lines to load, e.g. an open file
+    :type lines: Iterable[str]
+    :param board: board to load the positions into
+    :type board: Board
+    :raises InvalidPositionError: when a line isn't a valid position
+    :yield: the board holding the next position
+    :rtype: Board
+    """
+    for position in iter_xfen(lines):
+        board.load_position(position)
+        yield board
+
+def format_xfen(board: "Board") -> str:
+    """
+    Format the position of a board as extended FEN.
+
+    :param board: board to format
+    :type board: Board
+    :return: extended FEN string
+    :rtype: str
+    """
+    placement = "/".join(f"{piece.get_fen_char()}{piece.position[0]},{piece.position[1]}"
+                         f"{'*' if piece.moved else ''}" for piece in board.pieces)
+    en_passant = "-" if board.en_passant is None else \
+        f"{board.en_passant[0]},{board.en_passant[1]}"
+    return (f"{placement or '-'} {COLOR_CHARS[board.current_player]} {en_passant} "
+            f"{board.halfmove_clock} {board.fullmove_number}")
+
+def format_fen(board: "Board") -> str:
+    """
+    Format the position of a board as standard FEN.
+    The castling field is derived from the kings and rooks that haven't moved.
+
+    :param board: board to format
+    :type board: Board
+    :raises InvalidPositionError: when a piece stands outside the 8x8 area
+    :return: FEN string
+    :rtype: str
+    """
+    for piece in board.pieces:
+        if not (1 <= piece.position[0] <= 8 and 1 <= piece.position[1] <= 8):
+            raise InvalidPositionError(f"{piece} can't be written as standard FEN")
+    rows = []
+    for y in range(8, 0, -1):
+        row = ""
+        empty = 0
+        for x in range(1, 9):
+            piece = board.piece_map.get((x, y))
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                row += str(empty)
+                empty = 0
+            row += piece.get_fen_char()
+        rows.append(row + (str(empty) if empty else ""))
+    castling = ""
+    for char, (king, rook, color) in CASTLING_RIGHTS.items():
+        pieces = (board.piece_map.get(king), board.piece_map.get(rook))
+        if all(piece is not None and piece.color == color and not piece.moved
+               for piece in pieces) and pieces[0].is_king() and pieces[1].is_rook():
+            castling += char
+    en_passant = "-" if board.en_passant is None else \
+        point_to_standard_notation(board.en_passant)
+    return (f"{'/'.join(rows)} {COLOR_CHARS[board.current_player]} {castling or '-'} "
+            f"{en_passant} {board.halfmove_clock} {board.fullmove_number}")
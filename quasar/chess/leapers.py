@@ -0,0 +1,167 @@
+"""
+This module generates the candidate moves of every leaper of one side at once:
+knights, kings and pawns, the pieces with a fixed set of offsets.
+
+The coordinates of the leapers are gathered into NumPy arrays and broadcast
+against the offset tables, then the targets outside the bounds, on own pieces,
+the pawn pushes onto or over occupied squares and pawn diagonals onto empty ones
+are masked out in one step. What is left only needs the king safety checks.
+
+Squares are compared as single integers, x * 2**32 + y,
+which is exact for coordinates between -2**31 and 2**31.
+"""
+
+from typing import List, Sequence
+import numpy as np
+from .moves import Move
+from .pieces import Piece, PieceColor, PieceName, KNIGHT_OFFSETS, ROYAL_OFFSETS
+from .point import Point
+
+KNIGHT_TABLE = np.array(KNIGHT_OFFSETS, dtype=np.int64)
+KING_TABLE = np.array(ROYAL_OFFSETS, dtype=np.int64)
+PAWN_CAPTURE_TABLE = np.array(((-1, 1), (1, 1)), dtype=np.int64)
+
+def square_keys(squares: np.ndarray) -> np.ndarray:
+    """
+    Combine the coordinates of squares into single integers.
+
+    :param squares: array of shape (n, 2) of x, y coordinates
+    :type squares: np.ndarray
+    :return: array of shape (n,) of keys
+    :rtype: np.ndarray
+    """
+    return (squares[:, 0] << 32) + squares[:, 1]
+
+def broadcast(sources: np.ndarray, table: np.ndarray) -> tuple:
+    """
+    Add every offset of a table to every source square.
+
+    :param sources: array of shape (n, 2) of source squares
+    :type sources: np.ndarray
+    :param table: array of shape (m, 2) of offsets
+    :type table: np.ndarray
+    :return: index of the source of every target, shape (n * m,),
+        and the targets, shape (n * m, 2)
+    :rtype: tuple
+    """
+    targets = (sources[:, None, :] + table[None, :, :]).reshape(-1, 2)
+    return np.repeat(np.arange(len(sources)), len(table)), targets
+
+def in_bounds(targets: np.ndarray, bottom_left_bound: Point, top_right_bound: Point) -> np.ndarray:
+    """
+    Mask of the targets inside the bounds.
+
+    :param targets: array of shape (n, 2) of squares
+    :type targets: np.ndarray
+    :param bottom_left_bound: bottom left corner of the area
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area
+    :type top_right_bound: Point
+    :return: boolean array of shape (n,)
+    :rtype: np.ndarray
+    """
+    return ((targets[:, 0] >= bottom_left_bound[0]) & (targets[:, 0] <= top_right_bound[0]) &
+            (targets[:, 1] >= bottom_left_bound[1]) & (targets[:, 1] <= top_right_bound[1]))
+
+def sorted_keys(squares: List[Point]) -> np.ndarray:
+    """
+    Sorted keys of a list of squares, for membership tests with is_member.
+
+    :param squares: squares to combine
+    :type squares: List[Point]
+    :return: sorted array of keys
+    :rtype: np.ndarray
+    """
+    keys = square_keys(np.array(squares, dtype=np.int64).reshape(-1, 2))
+    keys.sort()
+    return keys
+
+def is_member(keys: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """
+    Mask of the keys present in a sorted table.
+
+    :param keys: keys to look up
+    :type keys: np.ndarray
+    :param table: sorted keys, made by sorted_keys
+    :type table: np.ndarray
+    :return: boolean array of the same shape as keys
+    :rtype: np.ndarray
+    """
+    if not len(table):
+        return np.zeros(len(keys), dtype=bool)
+    index = np.searchsorted(table, keys)
+    index[index == len(table)] = 0
+    return table[index] == keys
+
+def generate_leaper_moves(pieces: Sequence[Piece],
+                          color: PieceColor,
+                          bottom_left_bound: Point,
+                          top_right_bound: Point) -> List[Move]:
+    """
+    Generate the candidate moves of the knights, kings and pawns of a side within the bounds.
+    Castling and the king safety of the moves aren't checked.
+
+    :param pieces: every piece on the board
+    :type pieces: Sequence[Piece]
+    :param color: side to generate the moves for
+    :type color: PieceColor
+    :param bottom_left_bound: bottom left corner of the area
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area
+    :type top_right_bound: Point
+    :return: candidate moves, not yet validated
+    :rtype: List[Move]
+    """
+    own_squares = []
+    enemy_squares = []
+    groups = {PieceName.KNIGHT: [], PieceName.KING: [], PieceName.PAWN: []}
+    for piece in pieces:
+        if piece.color == color:
+            own_squares.append(piece.position)
+            group = groups.get(piece.name)
+            if group is not None:
+                group.append(piece)
+        elif piece.color != PieceColor.NONE:
+            enemy_squares.append(piece.position)
+    own_keys = sorted_keys(own_squares)
+    enemy_keys = sorted_keys(enemy_squares)
+    occupied_keys = np.sort(np.concatenate((own_keys, enemy_keys)))
+    direction = 1 if color == PieceColor.WHITE else -1
+
+    leapers = []
+    batches = []
+    for name, table in ((PieceName.KNIGHT, KNIGHT_TABLE), (PieceName.KING, KING_TABLE)):
+        group = groups[name]
+        if group:
+            positions = np.array([piece.position for piece in group], dtype=np.int64)
+            sources, targets = broadcast(positions, table)
+            batches.append((sources + len(leapers), targets,
+                            ~is_member(square_keys(targets), own_keys)))
+            leapers.extend(group)
+    pawns = groups[PieceName.PAWN]
+    if pawns:
+        positions = np.array([pawn.position for pawn in pawns], dtype=np.int64)
+        sources, targets = broadcast(positions, PAWN_CAPTURE_TABLE * (1, direction))
+        batches.append((sources + len(leapers), targets,
+                        is_member(square_keys(targets), enemy_keys)))
+        sources = np.arange(len(pawns)) + len(leapers)
+        targets = positions + (0, direction)
+        single = ~is_member(square_keys(targets), occupied_keys)
+        batches.append((sources, targets, single))
+        unmoved = np.array([not pawn.moved for pawn in pawns], dtype=bool)
+        targets = positions + (0, 2 * direction)
+        batches.append((sources, targets,
+                        unmoved & single & ~is_member(square_keys(targets), occupied_keys)))
+        leapers.extend(pawns)
+    if not batches:
+        return []
+
+    sources = np.concatenate([batch[0] for batch in batches])
+    targets = np.concatenate([batch[1] for batch in batches])
+    mask = np.concatenate([batch[2] for batch in batches])
+    mask &= in_bounds(targets, bottom_left_bound, top_right_bound)
+    moves = []
+    for index, (x, y) in zip(sources[mask].tolist(), targets[mask].tolist()):
+        piece = leapers[index]
+        moves.append(Move(color, piece.position, Point(x, y)))
+    return moves
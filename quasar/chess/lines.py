@@ -0,0 +1,263 @@
+"""
+This module contains the LineIndex class,
+which keeps the occupied squares of every line of the board in sorted order.
+
+Every file, rank, diagonal and anti-diagonal that holds at least one piece
+maps to a sorted list of coordinates along it, so the first piece along a ray
+is found with a binary search instead of stepping square by square.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+from .point import Point
+
+Line = Tuple[Dict[int, List[int]], int, int]
+
+class LineIndex:
+    """
+    The LineIndex class stores sorted occupancy lists per line of the board.
+    """
+    def __init__(self) -> None:
+        """
+        The constructor for the LineIndex class.
+        """
+        self.files: Dict[int, List[int]] = {}
+        self.ranks: Dict[int, List[int]] = {}
+        self.diagonals: Dict[int, List[int]] = {}
+        self.anti_diagonals: Dict[int, List[int]] = {}
+
+    def clear(self) -> None:
+        """
+        Remove every square from the index.
+        """
+        self.files = {}
+        self.ranks = {}
+        self.diagonals = {}
+        self.anti_diagonals = {}
+
+    def copy(self) -> "LineIndex":
+        """
+        Returns an independent copy of the index.
+
+        :return: copied index
+        :rtype: LineIndex
+        """
+        clone = LineIndex()
+        clone.files = {key: line[:] for key, line in self.files.items()}
+        clone.ranks = {key: line[:] for key, line in self.ranks.items()}
+        clone.diagonals = {key: line[:] for key, line in self.diagonals.items()}
+        clone.anti_diagonals = {key: line[:] for key, line in self.anti_diagonals.items()}
+        return clone
+
+    def add(self, square: Point) -> None:
+        """
+        Mark a square as occupied.
+
+        :param square: square to add
+        :type square: Point
+        """
+        x, y = square
+        insort(self.files.setdefault(x, []), y)
+        insort(self.ranks.setdefault(y, []), x)
+        insort(self.diagonals.setdefault(x - y, []), x)
+        insort(self.anti_diagonals.setdefault(x + y, []), x)
+
+    def remove(self, square: Point) -> None:
+        """
+        Mark a square as empty.
+
+        :param square: square to remove, has to be occupied
+        :type square: Point
+        """
+        x, y = square
+        for lines, key, coord in ((self.files, x, y),
+                                  (self.ranks, y, x),
+                                  (self.diagonals, x - y, x),
+                                  (self.anti_diagonals, x + y, x)):
+            line = lines[key]
+            del line[bisect_left(line, coord)]
+            if not line:
+                del lines[key]
+
+    def get_line(self, square: Point, step: Point) -> Optional[Line]:
+        """
+        Find the line through a square in the direction of a step.
+
+        :param square: square on the line
+        :type square: Point
+        :param step: unit step along the line, e.g. Point(1, -1)
+        :type step: Point
+        :return: the line dictionary, the key of the line and the coordinate of the square
+            along it, or None if the step isn't a unit orthogonal or diagonal step
+        :rtype: Optional[Line]
+        """
+        x, y = square
+        dx, dy = step
+        if dx == 0 and dy in (1, -1):
+            return self.files, x, y
+        if dy == 0 and dx in (1, -1):
+            return self.ranks, y, x
+        if dx == dy and dx in (1, -1):
+            return self.diagonals, x - y, x
+        if dx == -dy and dx in (1, -1):
+            return self.anti_diagonals, x + y, x
+        return None
+
+    def nearest(self, square: Point, step: Point) -> Optional[Point]:
+        """
+        Find the first occupied square along a ray, the starting square excluded.
+
+        :param square: starting square of the ray
+        :type square: Point
+        :param step: unit step of the ray, e.g. Point(0, 1)
+        :type step: Point
+        :return: the first occupied square, or None if the ray is empty
+        :rtype: Optional[Point]
+        """
+        found = self.get_line(square, step)
+        if found is None:
+            return None
+        lines, key, coord = found
+        line = lines.get(key)
+        if line is None:
+            return None
+        forward = step[1] > 0 if step[0] == 0 else step[0] > 0
+        if forward:
+            index = bisect_right(line, coord)
+            if index == len(line):
+                return None
+        else:
+            index = bisect_left(line, coord) - 1
+            if index < 0:
+                return None
+        distance = abs(line[index] - coord)
+        return Point(square[0] + step[0] * distance, square[1] + step[1] * distance)
+
+    def distance_to_blocker(self, square: Point, step: Point) -> Optional[int]:
+        """
+        Count the steps to the first occupied square along a ray.
+
+        :param square: starting square of the ray
+        :type square: Point
+        :param step: unit step of the ray
+        :type step: Point
+        :return: number of steps, or None if the ray is empty
+        :rtype: Optional[int]
+        """
+        blocker = self.nearest(square, step)
+        if blocker is None:
+            return None
+        return max(abs(blocker[0] - square[0]), abs(blocker[1] - square[1]))
+
+def get_step(source: Point, target: Point) -> Optional[Point]:
+    """
+    Get the unit step leading from one square to another along a line.
+
+    :param source: starting square
+    :type source: Point
+    :param target: square to reach
+    :type target: Point
+    :return: unit orthogonal or diagonal step, or None if the squares don't share a line
+    :rtype: Optional[Point]
+    """
+    dx = target[0] - source[0]
+    dy = target[1] - source[1]
+    if (dx == 0 and dy == 0) or (dx != 0 and dy != 0 and abs(dx) != abs(dy)):
+        return None
+    return Point((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+
+def get_distance(source: Point, target: Point) -> int:
+    """
+    Count the king steps between two squares.
+
+    :param source: first square
+    :type source: Point
+    :param target: second square
+    :type target: Point
+    :return: number of steps
+    :rtype: int
+    """
+    return max(abs(target[0] - source[0]), abs(target[1] - source[1]))
+
+def get_ray_length(square: Point, step: Point, bottom_left_bound: Point,
+                   top_right_bound: Point) -> int:
+    """
+    Count the steps a ray can take before leaving the bounds.
+
+    :param square: starting square of the ray
+    :type square: Point
+    :param step: unit step of the ray
+    :type step: Point
+    :param bottom_left_bound: bottom left corner of the area
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area
+    :type top_right_bound: Point
+    :return: number of steps inside the bounds, zero or negative if there are none
+    :rtype: int
+    """
+    limits = []
+    if step[0] == 0 and not bottom_left_bound[0] <= square[0] <= top_right_bound[0]:
+        return 0
+    if step[1] == 0 and not bottom_left_bound[1] <= square[1] <= top_right_bound[1]:
+        return 0
+    if step[0] > 0:
+        limits.append(top_right_bound[0] - square[0])
+    elif step[0] < 0:
+        limits.append(square[0] - bottom_left_bound[0])
+    if step[1] > 0:
+        limits.append(top_right_bound[1] - square[1])
+    elif step[1] < 0:
+        limits.append(square[1] - bottom_left_bound[1])
+    return min(limits)
+
+def get_ray_entry(square: Point, step: Point, bottom_left_bound: Point,
+                  top_right_bound: Point) -> int:
+    """
+    Count the steps a ray takes to enter the bounds, for rays starting outside of them.
+
+    :param square: starting square of the ray
+    :type square: Point
+    :param step: unit step of the ray
+    :type step: Point
+    :param bottom_left_bound: bottom left corner of the area
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area
+    :type top_right_bound: Point
+    :return: number of steps to the first square inside the bounds, at least 1
+    :rtype: int
+    """
+    entry = 1
+    for axis in (0, 1):
+        if step[axis] > 0:
+            entry = max(entry, bottom_left_bound[axis] - square[axis])
+        elif step[axis] < 0:
+            entry = max(entry, square[axis] - top_right_bound[axis])
+    return entry
+
+def get_intersection(origin: Point, step: Point, other_origin: Point,
+                     other_step: Point) -> Optional[Tuple[int, int]]:
+    """
+    Find the square where two lines cross, given as a number of steps along each line.
+
+    :param origin: square on the first line
+    :type origin: Point
+    :param step: unit step of the first line
+    :type step: Point
+    :param other_origin: square on the second line
+    :type other_origin: Point
+    :param other_step: unit step of the second line
+    :type other_step: Point
+    :return: steps along the first and the second line,
+        or None if the lines are parallel or don't cross on a square
+    :rtype: Optional[Tuple[int, int]]
+    """
+    determinant = other_step[0] * step[1] - step[0] * other_step[1]
+    if determinant == 0:
+        return None
+    dx = other_origin[0] - origin[0]
+    dy = other_origin[1] - origin[1]
+    steps = other_step[0] * dy - other_step[1] * dx
+    other_steps = step[0] * dy - step[1] * dx
+    if steps % determinant or other_steps % determinant:
+        return None
+    return steps // determinant, other_steps // determinant
@@ -1,18 +1,46 @@
 """
-This module contains the Move and MoveFlags classes.
+This module contains the Move, RayMove and MoveFlags classes
+and the RejectReason enum.
 """
 
-from dataclasses import dataclass
+from enum import Enum
+from typing import Generator, Optional
 from .pieces import PieceName, PieceColor, Piece
 from .point import Point
+from .lines import get_ray_length, get_ray_entry
 
 NONE_PIECE = Piece(PieceName.NONE, Point(0,0), PieceColor.NONE)
 
-@dataclass
+class RejectReason(Enum):
+    """
+    Enumerated type that represents why the validator rejected a move.
+    """
+    NONE = "Move is legal"
+    PAWN_DIAGONAL = "Pawn can't move diagonally without capturing"
+    PAWN_FORWARD = "Pawn can't move forward without capturing"
+    OWN_CAPTURE = "Can't capture own piece"
+    NOT_ON_LINE = "Move not along piece's lines"
+    PATH_BLOCKED = "Path is blocked"
+    CASTLE_BLOCKED = "Can't castle through pieces"
+    SAME_SQUARE = "Source and target are the same"
+    WRONG_SOURCE = "Source and piece position are different"
+    NOT_IN_OFFSETS = "Move not in piece's offsets"
+    CASTLE_IN_CHECK = "Can't castle out of check"
+    CASTLE_ATTACKED = "Can't castle through or into check"
+    TARGET_ATTACKED = "Can't move, target square is attacked"
+    DOUBLE_CHECK = "Only the king can move in double check"
+    CHECK_NOT_RESOLVED = "Move doesn't resolve the check"
+    PINNED = "Piece is pinned"
+
 class Move:
     """
     The Move class is responsible for storing the moves in the game.
+    Moves are slotted and their flags are only allocated when first needed.
+    Two moves are equal if they have the same color, source and target.
     """
+    __slots__ = ("color_to_move", "source", "target", "moved", "captured",
+                 "legal", "reject_reason", "_flags")
+
     def __init__(self,
                  color_to_move: PieceColor,
                  source: Point,
@@ -33,19 +61,201 @@ class Move:
         self.moved: Piece = NONE_PIECE
         self.captured: Piece = NONE_PIECE
         self.legal: bool = True
-        self.flags: MoveFlags = MoveFlags()
+        self.reject_reason: RejectReason = RejectReason.NONE
+        self._flags: Optional[MoveFlags] = None
+
+    @property
+    def flags(self) -> "MoveFlags":
+        """
+        Returns the flags of the move, creating them on first access.
+
+        :return: move flags
+        :rtype: MoveFlags
+        """
+        if self._flags is None:
+            self._flags = MoveFlags()
+        return self._flags
+
+    def has_flags(self) -> bool:
+        """
+        Returns True if the flags of the move were ever accessed.
+
+        :return: True if the flags are allocated
+        :rtype: bool
+        """
+        return self._flags is not None
+
+    def is_castling(self) -> bool:
+        """
+        Returns True if the move is castling, without allocating the flags.
+
+        :return: True if the castling flag is set
+        :rtype: bool
+        """
+        return self._flags is not None and self._flags.castling
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Move):
+            return NotImplemented
+        return self.source == other.source and self.target == other.target and \
+            self.color_to_move == other.color_to_move
+
+    def __hash__(self) -> int:
+        return hash((self.color_to_move, self.source, self.target))
 
     def __str__(self) -> str:
         return f"{self.moved} -> {repr(self.target)}"
-    
+
     def __repr__(self) -> str:
         return f"{self.moved} -> {repr(self.target)}"
 
-@dataclass
+class RayMove:
+    """
+    The RayMove class stores a family of quiet slider moves along one ray:
+    the piece can stop on any square from start to end steps away from the source.
+    The end is None when the ray is empty up to infinity.
+    """
+    __slots__ = ("moved", "color_to_move", "source", "step", "start", "end")
+
+    def __init__(self,
+                 moved: Piece,
+                 step: Point,
+                 start: int = 1,
+                 end: Optional[int] = None) -> None:
+        """
+        The constructor for the RayMove class.
+
+        :param moved: sliding piece that moves
+        :type moved: Piece
+        :param step: unit step of the ray
+        :type step: Point
+        :param start: distance of the first target square
+        :type start: int
+        :param end: distance of the last target square, None if unbounded
+        :type end: Optional[int]
+        """
+        self.moved: Piece = moved
+        self.color_to_move: PieceColor = moved.color
+        self.source: Point = moved.position
+        self.step: Point = step
+        self.start: int = start
+        self.end: Optional[int] = end
+
+    def __str__(self) -> str:
+        end = "inf" if self.end is None else self.end
+        return f"{self.moved} -> {repr(self.step)} x [{self.start}, {end}]"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def is_bounded(self) -> bool:
+        """
+        Returns True if the ray has a last square.
+
+        :return: True if the ray is finite
+        :rtype: bool
+        """
+        return self.end is not None
+
+    def get_target(self, distance: int) -> Point:
+        """
+        Returns the target square at a distance along the ray.
+
+        :param distance: number of steps from the source
+        :type distance: int
+        :return: target square
+        :rtype: Point
+        """
+        return self.source + self.step * distance
+
+    def get_distance(self, target: Point) -> Optional[int]:
+        """
+        Returns the distance of a target square along the ray.
+
+        :param target: square to look up
+        :type target: Point
+        :return: number of steps from the source, or None if the square isn't a target
+        :rtype: Optional[int]
+        """
+        dx = target.x - self.source.x
+        dy = target.y - self.source.y
+        distance = max(abs(dx), abs(dy))
+        if Point(dx, dy) != self.step * distance:
+            return None
+        if distance < self.start or (self.end is not None and distance > self.end):
+            return None
+        return distance
+
+    def contains(self, target: Point) -> bool:
+        """
+        Returns True if a square is one of the targets of the ray.
+
+        :param target: square to look up
+        :type target: Point
+        :return: True if the piece can stop on the square
+        :rtype: bool
+        """
+        return self.get_distance(target) is not None
+
+    def get_move(self, distance: int) -> Move:
+        """
+        Returns the concrete move to the square at a distance along the ray.
+
+        :param distance: number of steps from the source
+        :type distance: int
+        :return: validated move
+        :rtype: Move
+        """
+        move = Move(self.color_to_move, self.source, self.get_target(distance))
+        move.moved = self.moved
+        return move
+
+    def clip(self, bottom_left_bound: Point, top_right_bound: Point) -> range:
+        """
+        Returns the distances of the targets inside the bounds.
+
+        :param bottom_left_bound: bottom left corner of the area
+        :type bottom_left_bound: Point
+        :param top_right_bound: top right corner of the area
+        :type top_right_bound: Point
+        :return: distances along the ray
+        :rtype: range
+        """
+        length = get_ray_length(self.source, self.step, bottom_left_bound, top_right_bound)
+        if self.end is not None:
+            length = min(length, self.end)
+        entry = get_ray_entry(self.source, self.step, bottom_left_bound, top_right_bound)
+        return range(max(self.start, entry), length + 1)
+
+    def expand(self,
+               bottom_left_bound: Optional[Point] = None,
+               top_right_bound: Optional[Point] = None) -> Generator[Move, None, None]:
+        """
+        Expand the ray into concrete moves, optionally only inside the bounds.
+
+        :param bottom_left_bound: bottom left corner of the area
+        :type bottom_left_bound: Optional[Point]
+        :param top_right_bound: top right corner of the area
+        :type top_right_bound: Optional[Point]
+        :raises ValueError: when an unbounded ray is expanded without bounds
+        :yield: validated move
+        :rtype: Move
+        """
+        if bottom_left_bound is None or top_right_bound is None:
+            if self.end is None:
+                raise ValueError("Can't expand an unbounded ray move without bounds")
+            distances = range(self.start, self.end + 1)
+        else:
+            distances = self.clip(bottom_left_bound, top_right_bound)
+        for distance in distances:
+            yield self.get_move(distance)
+
 class MoveFlags:
     """
     The MoveFlags class is responsible for storing the flags for a move.
     """
+    __slots__ = ("promotion", "castling", "en_passant", "check", "checkmate", "stalemate")
+
     def __init__(self) -> None:
         """
         The constructor for the MoveFlags class.
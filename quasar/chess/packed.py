@@ -0,0 +1,298 @@
+"""
+This module contains the PackedMove and MoveBuffer classes,
+a compact integer encoding of moves.
+
+A packed move is a plain integer, so equality and hashing run in C,
+and it fits a 64-bit ``array`` slot. The bits, from the lowest, hold:
+
+- 4 bits of flags (castling, promotion, en passant, check),
+- 3 bits for the kind of the moved piece and 3 for the captured one,
+- 1 bit for the color, set for black,
+- 13 bits each for the source x and y and the x and y deltas to the target.
+
+Coordinates and deltas are stored biased, from -4096 to 4095.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, TYPE_CHECKING
+from .point import Point
+from .pieces import PieceColor, PieceName
+from .moves import Move
+
+if TYPE_CHECKING:
+    from .board import Board
+
+FLAG_CASTLING = 1
+FLAG_PROMOTION = 2
+FLAG_EN_PASSANT = 4
+FLAG_CHECK = 8
+
+FLAG_BITS = 4
+KIND_BITS = 3
+COORD_BITS = 13
+
+MOVED_SHIFT = FLAG_BITS
+CAPTURED_SHIFT = MOVED_SHIFT + KIND_BITS
+COLOR_SHIFT = CAPTURED_SHIFT + KIND_BITS
+SOURCE_X_SHIFT = COLOR_SHIFT + 1
+SOURCE_Y_SHIFT = SOURCE_X_SHIFT + COORD_BITS
+DELTA_X_SHIFT = SOURCE_Y_SHIFT + COORD_BITS
+DELTA_Y_SHIFT = DELTA_X_SHIFT + COORD_BITS
+
+FLAG_MASK = (1 << FLAG_BITS) - 1
+KIND_MASK = (1 << KIND_BITS) - 1
+COORD_MASK = (1 << COORD_BITS) - 1
+COORD_BIAS = 1 << (COORD_BITS - 1)
+
+PIECE_NAMES = tuple(PieceName)
+
+def _bias(value: int) -> int:
+    """
+    Biases a coordinate into its unsigned field.
+
+    :param value: coordinate or delta
+    :type value: int
+    :raises ValueError: when the value doesn't fit the field
+    :return: biased value
+    :rtype: int
+    """
+    biased = value + COORD_BIAS
+    if not 0 <= biased <= COORD_MASK:
+        raise ValueError(f"Coordinate {value} doesn't fit in {COORD_BITS} bits")
+    return biased
+
+def pack(color: PieceColor,
+         source: Point,
+         target: Point,
+         moved: PieceName = PieceName.NONE,
+         captured: PieceName = PieceName.NONE,
+         flags: int = 0) -> int:
+    """
+    Packs the parts of a move into an integer.
+
+    :param color: color of the side making the move
+    :type color: PieceColor
+    :param source: tile to move from
+    :type source: Point
+    :param target: tile to move to
+    :type target: Point
+    :param moved: kind of the moved piece
+    :type moved: PieceName
+    :param captured: kind of the captured piece
+    :type captured: PieceName
+    :param flags: bitfield of FLAG_* constants
+    :type flags: int
+    :raises ValueError: when a coordinate or delta doesn't fit its field
+    :return: packed move
+    :rtype: int
+    """
+    return (flags |
+            moved.value << MOVED_SHIFT |
+            captured.value << CAPTURED_SHIFT |
+            (color == PieceColor.BLACK) << COLOR_SHIFT |
+            _bias(source[0]) << SOURCE_X_SHIFT |
+            _bias(source[1]) << SOURCE_Y_SHIFT |
+            _bias(target[0] - source[0]) << DELTA_X_SHIFT |
+            _bias(target[1] - source[1]) << DELTA_Y_SHIFT)
+
+class PackedMove(int):
+    """
+    Class to represent a move packed into an integer.
+    The fields are decoded on access and the rich Move is only built on demand.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_move(cls, move: Move) -> "PackedMove":
+        """
+        Packs a validated move.
+
+        :param move: move to pack
+        :type move: Move
+        :raises ValueError: when a coordinate or delta doesn't fit its field
+        :return: packed move
+        :rtype: PackedMove
+        """
+        flags = 0
+        if move.has_flags():
+            flags = (FLAG_CASTLING * move.flags.castling |
+                     FLAG_PROMOTION * move.flags.promotion |
+                     FLAG_EN_PASSANT * move.flags.en_passant |
+                     FLAG_CHECK * move.flags.check)
+        return cls(pack(move.color_to_move, move.source, move.target,
+                        move.moved.name, move.captured.name, flags))
+
+    @property
+    def flags(self) -> int:
+        """
+        Bitfield of the FLAG_* constants.
+        """
+        return self & FLAG_MASK
+
+    @property
+    def moved(self) -> PieceName:
+        """
+        Kind of the moved piece.
+        """
+        return PIECE_NAMES[self >> MOVED_SHIFT & KIND_MASK]
+
+    @property
+    def captured(self) -> PieceName:
+        """
+        Kind of the captured piece, PieceName.NONE for quiet moves.
+        """
+        return PIECE_NAMES[self >> CAPTURED_SHIFT & KIND_MASK]
+
+    @property
+    def color(self) -> PieceColor:
+        """
+        Color of the side making the move.
+        """
+        return PieceColor.BLACK if self >> COLOR_SHIFT & 1 else PieceColor.WHITE
+
+    @property
+    def source(self) -> Point:
+        """
+        Tile to move from.
+        """
+        return Point((self >> SOURCE_X_SHIFT & COORD_MASK) - COORD_BIAS,
+                     (self >> SOURCE_Y_SHIFT & COORD_MASK) - COORD_BIAS)
+
+    @property
+    def delta(self) -> Point:
+        """
+        Offset from the source to the target.
+        """
+        return Point((self >> DELTA_X_SHIFT & COORD_MASK) - COORD_BIAS,
+                     (self >> DELTA_Y_SHIFT & COORD_MASK) - COORD_BIAS)
+
+    @property
+    def target(self) -> Point:
+        """
+        Tile to move to.
+        """
+        return self.source + self.delta
+
+    def is_capture(self) -> bool:
+        """
+        Returns True if the move captures a piece.
+
+        :return: True for captures
+        :rtype: bool
+        """
+        return self >> CAPTURED_SHIFT & KIND_MASK != 0
+
+    def is_castling(self) -> bool:
+        """
+        Returns True if the move is castling.
+
+        :return: True for castling
+        :rtype: bool
+        """
+        return bool(self & FLAG_CASTLING)
+
+    def to_move(self, board: "Board") -> Move:
+        """
+        Builds the rich move on the board it was packed on.
+
+        :param board: board in the position the move was generated in
+        :type board: Board
+        :return: move with the moved and captured pieces filled in
+        :rtype: Move
+        """
+        source = self.source
+        target = source + self.delta
+        move = Move(self.color, source, target)
+        move.moved = board.get_piece_at(source)
+        move.captured = board.get_piece_at(target)
+        flags = self & FLAG_MASK
+        if flags:
+            move.flags.castling = bool(flags & FLAG_CASTLING)
+            move.flags.promotion = bool(flags & FLAG_PROMOTION)
+            move.flags.en_passant = bool(flags & FLAG_EN_PASSANT)
+            move.flags.check = bool(flags & FLAG_CHECK)
+        return move
+
+    def __repr__(self) -> str:
+        return f"PackedMove({self.source!r}->{self.target!r})"
+
+class MoveBuffer:
+    """
+    Class to store packed moves in a contiguous 64-bit array.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, moves: Optional[Iterable[int]] = None) -> None:
+        """
+        MoveBuffer constructor.
+
+        :param moves: packed moves to start with
+        :type moves: Optional[Iterable[int]]
+        """
+        self.data = array("q", moves or ())
+
+    @classmethod
+    def from_moves(cls, moves: Iterable[Move]) -> "MoveBuffer":
+        """
+        Packs rich moves into a new buffer.
+
+        :param moves: moves to pack
+        :type moves: Iterable[Move]
+        :return: buffer of packed moves
+        :rtype: MoveBuffer
+        """
+        return cls(PackedMove.from_move(move) for move in moves)
+
+    def append(self, move: int) -> None:
+        """
+        Appends a packed move.
+
+        :param move: packed move
+        :type move: int
+        """
+        self.data.append(move)
+
+    def extend(self, moves: Iterable[int]) -> None:
+        """
+        Appends several packed moves.
+
+        :param moves: packed moves
+        :type moves: Iterable[int]
+        """
+        self.data.extend(moves)
+
+    def clear(self) -> None:
+        """
+        Removes every move, keeping the buffer object.
+        """
+        del self.data[:]
+
+    def to_moves(self, board: "Board") -> List[Move]:
+        """
+        Builds the rich moves on the board they were packed on.
+
+        :param board: board in the position the moves were generated in
+        :type board: Board
+        :return: rich moves
+        :rtype: List[Move]
+        """
+        return [PackedMove(move).to_move(board) for move in self.data]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the stored moves in bytes.
+        """
+        return len(self.data) * self.data.itemsize
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> PackedMove:
+        return PackedMove(self.data[index])
+
+    def __iter__(self) -> Iterator[PackedMove]:
+        return map(PackedMove, self.data)
+
+    def __contains__(self, move: int) -> bool:
+        return move in self.data
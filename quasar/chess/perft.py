@@ -0,0 +1,170 @@
+"""
+This module contains the perft (performance test) functions,
+which count the leaf nodes of the move tree to test move generation.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from quasar.logger import silence
+from quasar.chess.board import Board
+from quasar.chess.moves import Move
+from quasar.chess.point import Point
+
+DEFAULT_BOTTOM_LEFT_BOUND = Point(1, 1)
+DEFAULT_TOP_RIGHT_BOUND = Point(8, 8)
+
+@dataclass
+class PerftResult:
+    """
+    The PerftResult class stores the outcome of a perft run.
+    """
+    depth: int = 0
+    nodes: int = 0
+    time: float = 0.0
+    divide: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def nps(self) -> int:
+        """
+        Nodes counted per second.
+
+        :return: nodes per second
+        :rtype: int
+        """
+        if self.time <= 0:
+            return 0
+        return int(self.nodes / self.time)
+
+def move_notation(move: Move) -> str:
+    """
+    Returns a coordinate notation of a move that works on the infinite board.
+
+    :param move: move to describe
+    :type move: Move
+    :return: move in the form "(x, y)->(x, y)"
+    :rtype: str
+    """
+    return f"{move.source!r}->{move.target!r}"
+
+def generate_moves(board: Board,
+                   bottom_left_bound: Point = DEFAULT_BOTTOM_LEFT_BOUND,
+                   top_right_bound: Point = DEFAULT_TOP_RIGHT_BOUND) -> List[Move]:
+    """
+    Generate the legal moves of the side to move within the bounds.
+
+    :param board: board to generate the moves on
+    :type board: Board
+    :param bottom_left_bound: bottom left corner of the area
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area
+    :type top_right_bound: Point
+    :return: legal moves
+    :rtype: List[Move]
+    """
+    return board.generate_legal_moves(bottom_left_bound, top_right_bound)
+
+def perft(board: Board,
+          depth: int,
+          bottom_left_bound: Point = DEFAULT_BOTTOM_LEFT_BOUND,
+          top_right_bound: Point = DEFAULT_TOP_RIGHT_BOUND) -> int:
+    """
+    Count the positions reachable in exactly depth moves.
+
+    :param board: board to count the positions on, restored before returning
+    :type board: Board
+    :param depth: depth of the move tree in plies
+    :type depth: int
+    :param bottom_left_bound: bottom left corner of the area moves are generated in
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area moves are generated in
+    :type top_right_bound: Point
+    :return: number of leaf nodes
+    :rtype: int
+    """
+    if depth == 0:
+        return 1
+    moves = generate_moves(board, bottom_left_bound, top_right_bound)
+    if depth == 1:
+        return len(moves)
+    count = 0
+    for move in moves:
+        board.make_move(move, False)
+        count += perft(board, depth - 1, bottom_left_bound, top_right_bound)
+        board.undo_move()
+    return count
+
+def _perft_root_move(board: Board,
+                     move: Tuple[Point, Point],
+                     depth: int,
+                     bounds: Tuple[Point, Point]) -> int:
+    """
+    Worker task: play one root move on a copy of the board and count its subtree.
+    The move is sent as its source and target, so it works on any square
+    of the infinite board, and validated again to fill in the pieces and flags.
+
+    :param board: pickled copy of the root position
+    :type board: Board
+    :param move: source and target of the root move
+    :type move: Tuple[Point, Point]
+    :param depth: depth of the whole perft
+    :type depth: int
+    :param bounds: bottom left and top right corner of the move generation area
+    :type bounds: Tuple[Point, Point]
+    :return: number of leaf nodes below the root move
+    :rtype: int
+    """
+    silence()
+    board.make_move(Move(board.current_player, *move))
+    return perft(board, depth - 1, *bounds)
+
+def divide(board: Board,
+           depth: int,
+           bottom_left_bound: Point = DEFAULT_BOTTOM_LEFT_BOUND,
+           top_right_bound: Point = DEFAULT_TOP_RIGHT_BOUND,
+           processes: Optional[int] = 1) -> PerftResult:
+    """
+    Run perft and count the leaf nodes separately for every root move.
+    With more than one process the root moves are split across a process pool.
+
+    :param board: board to count the positions on, restored before returning
+    :type board: Board
+    :param depth: depth of the move tree in plies, at least 1
+    :type depth: int
+    :param bottom_left_bound: bottom left corner of the area moves are generated in
+    :type bottom_left_bound: Point
+    :param top_right_bound: top right corner of the area moves are generated in
+    :type top_right_bound: Point
+    :param processes: number of worker processes, None uses every core
+    :type processes: Optional[int]
+    :raises ValueError: if depth is lower than 1
+    :return: per root move counts, total nodes and timing
+    :rtype: PerftResult
+    """
+    if depth < 1:
+        raise ValueError("Divide depth has to be at least 1")
+    start = time.perf_counter()
+    bounds = (bottom_left_bound, top_right_bound)
+    moves = generate_moves(board, *bounds)
+    result = PerftResult(depth=depth)
+
+    if processes == 1 or depth == 1:
+        for move in moves:
+            board.make_move(move, False)
+            count = perft(board, depth - 1, *bounds)
+            board.undo_move()
+            notation = move_notation(move)
+            result.divide[notation] = result.divide.get(notation, 0) + count
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_perft_root_move, board, (move.source, move.target),
+                                       depth, bounds)
+                       for move in moves]
+            for move, future in zip(moves, futures):
+                notation = move_notation(move)
+                result.divide[notation] = result.divide.get(notation, 0) + future.result()
+
+    result.nodes = sum(result.divide.values())
+    result.time = time.perf_counter() - start
+    return result
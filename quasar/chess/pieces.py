@@ -3,12 +3,31 @@ This module contains the Piece class,
 which is responsible for managing the state of the pieces.
 """
 
-from typing import Generator
+from typing import Generator, TYPE_CHECKING
 from enum import Enum
-import numpy as np
+import random
 from quasar.logger import logger
 from .point import Point
 
+if TYPE_CHECKING:
+    from .counters import Counters
+
+WHITE_PAWN_OFFSETS = (Point(0, 1), Point(-1, 1), Point(1, 1))
+WHITE_PAWN_FIRST_OFFSETS = WHITE_PAWN_OFFSETS + (Point(0, 2),)
+BLACK_PAWN_OFFSETS = (Point(0, -1), Point(-1, -1), Point(1, -1))
+BLACK_PAWN_FIRST_OFFSETS = BLACK_PAWN_OFFSETS + (Point(0, -2),)
+KNIGHT_OFFSETS = (Point(1, 2),
+                  Point(2, 1),
+                  Point(-1, 2),
+                  Point(2, -1),
+                  Point(-1, -2),
+                  Point(-2, -1),
+                  Point(1, -2),
+                  Point(-2, 1))
+ORTHOGONAL_OFFSETS = (Point(1, 0), Point(0, 1), Point(-1, 0), Point(0, -1))
+DIAGONAL_OFFSETS = (Point(1, 1), Point(-1, 1), Point(-1, -1), Point(1, -1))
+ROYAL_OFFSETS = ORTHOGONAL_OFFSETS + DIAGONAL_OFFSETS
+
 class PieceColor(Enum):
     """
     Enumerated type that represents piece color.
@@ -52,14 +71,15 @@ class Piece:
         :type color: PieceColor
         :raises TypeError: when position is not of Point type
         """
-        self.unique_id = np.random.randint(0, 1000000000)
+        self.unique_id = random.randrange(1000000000)
         self.name = name
         self.color = color
-        logger.debug("Creating %s %s with id: %s at %s",
-                     self.color.name.lower(),
-                     self.name.name.lower(),
-                     self.unique_id,
-                     position.__repr__())
+        if name != PieceName.NONE:
+            logger.debug("Creating %s %s with id: %s at %s",
+                         self.color.name.lower(),
+                         self.name.name.lower(),
+                         self.unique_id,
+                         position.__repr__())
         if not isinstance(position, Point):
             raise TypeError(f"Position has to be of type point, got {type(position)} instead")
         self.position = position
@@ -171,11 +191,14 @@ class Piece:
         return False
 
     def get_offset_generator(self, bottom_left_bound,
-                             top_right_bound) -> Generator[Point, None, None]:
+                             top_right_bound,
+                             counters: "Counters" = None) -> Generator[Point, None, None]:
         """
         Creates a generator that yields offsets of the piece,
         acording to the way that the piece moves.
 
+        :param counters: counters to add the iterations of the sliding loop to
+        :type counters: Counters
         :yield: offset
         :rtype: Point
         """
@@ -194,6 +217,8 @@ class Piece:
                         yield offset * i
                     else:
                         misfire += 1
+                if counters is not None:
+                    counters.misfire_iterations += 1
 
     def get_position(self) -> Point:
         """
@@ -221,6 +246,17 @@ class Piece:
         except AttributeError:
             pass
 
+    def copy(self) -> "Piece":
+        """
+        Returns a copy of the piece with the same id, without running the constructor.
+
+        :return: copied piece
+        :rtype: Piece
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
     def get_name(self) -> PieceName:
         """
         Returns piece name.
@@ -299,13 +335,9 @@ class Pawn(Piece):
         Updates pawn offsets after initial move.
         """
         if self.color == PieceColor.WHITE:
-            self.offsets = [Point(0, 1), Point(-1, 1), Point(1, 1)]
-            if not self.moved:
-                self.offsets.append(Point(0, 2))
+            self.offsets = WHITE_PAWN_OFFSETS if self.moved else WHITE_PAWN_FIRST_OFFSETS
         if self.color == PieceColor.BLACK:
-            self.offsets = [Point(0, -1), Point(-1, -1), Point(1, -1)]
-            if not self.moved:
-                self.offsets.append(Point(0, -2))
+            self.offsets = BLACK_PAWN_OFFSETS if self.moved else BLACK_PAWN_FIRST_OFFSETS
 
 class Knight(Piece):
     """
@@ -327,14 +359,7 @@ class Knight(Piece):
         """
         super().__init__(piece_name, position, color)
         self.sliding = False
-        self.offsets = [Point(1, 2),
-                        Point(2, 1),
-                        Point(-1, 2),
-                        Point(2, -1),
-                        Point(-1, -2),
-                        Point(-2, -1),
-                        Point(1, -2),
-                        Point(-2, 1)]
+        self.offsets = KNIGHT_OFFSETS
 
 class Bishop(Piece):
     """
@@ -356,7 +381,7 @@ class Bishop(Piece):
         """
         super().__init__(piece_name, position, color)
         self.sliding = True
-        self.offsets = [Point(1, 1), Point(-1, 1), Point(-1, -1), Point(1, -1)]
+        self.offsets = DIAGONAL_OFFSETS
 
 class Rook(Piece):
     """
@@ -378,7 +403,7 @@ class Rook(Piece):
         """
         super().__init__(piece_name, position, color)
         self.sliding = True
-        self.offsets = [Point(1, 0), Point(0, 1), Point(-1, 0), Point(0, -1)]
+        self.offsets = ORTHOGONAL_OFFSETS
 
 class Queen(Piece):
     """
@@ -400,14 +425,7 @@ class Queen(Piece):
         """
         super().__init__(piece_name, position, color)
         self.sliding = True
-        self.offsets = [Point(1, 0),
-                        Point(0, 1),
-                        Point(-1, 0),
-                        Point(0, -1),
-                        Point(1, 1),
-                        Point(-1, 1),
-                        Point(-1, -1),
-                        Point(1, -1)]
+        self.offsets = ROYAL_OFFSETS
 
 class King(Piece):
     """
@@ -429,14 +447,7 @@ class King(Piece):
         """
         super().__init__(piece_name, position, color)
         self.sliding = False
-        self.offsets = [Point(1, 0),
-                        Point(0, 1),
-                        Point(-1, 0),
-                        Point(0, -1),
-                        Point(1, 1),
-                        Point(-1, 1),
-                        Point(-1, -1),
-                        Point(1, -1)]
+        self.offsets = ROYAL_OFFSETS
 
 class PieceFactory:
     """
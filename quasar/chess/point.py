@@ -2,15 +2,46 @@
 This file is defines the Point class, which is used to represent a point in a 2D plane.
 """
 
-from typing import Union, Any, Tuple, List
+from operator import itemgetter
+from typing import Union, Tuple, List
 
 NumericType = Union[int, float]
+OperandType = Union["Point", NumericType, Tuple[NumericType, NumericType], List[NumericType]]
 
-class Point:
+_new_tuple = tuple.__new__
+
+def _split_operand(other: OperandType) -> Tuple[NumericType, NumericType]:
+    """
+    Splits an arithmetic operand into its x and y components.
+
+    :param other: operand, either a point, a number or a pair of numbers
+    :type other: Union[Point, int, float, Tuple[NumericType], List[NumericType]]
+    :raises ValueError: when the operand is not supported
+    :return: x and y components of the operand
+    :rtype: Tuple[NumericType, NumericType]
+    """
+    if isinstance(other, (int, float)):
+        return other, other
+    if isinstance(other, (tuple, list)) and len(other) == 2:
+        return other[0], other[1]
+    raise ValueError("Invalid operand")
+
+class Point(tuple):
     """
     Class to represent a point in a 2D plane.
+
+    Points are immutable ``(x, y)`` tuples, so hashing and equality run in C
+    and a point can safely be used as a dictionary key.
+    Arithmetic always returns a new point, also with a plain tuple on the left.
+    Points have no ordering.
+
+    Equality is left to the tuple, so a point equals the plain tuple of its
+    coordinates: a Python ``__eq__`` would run on every square lookup
+    and make them about three times slower.
     """
-    def __init__(self, x: NumericType, y: NumericType) -> None:
+    __slots__ = ()
+
+    def __new__(cls, x: NumericType, y: NumericType) -> "Point":
         """
         Point constructor.
 
@@ -19,261 +50,89 @@ class Point:
         :param y: y coordinate of the point
         :type y: Union[int, float]
         """
-        self.x = x
-        self.y = y
+        return _new_tuple(cls, (x, y))
+
+    x = property(itemgetter(0), doc="x coordinate of the point")
+    y = property(itemgetter(1), doc="y coordinate of the point")
+
+    def __getnewargs__(self) -> Tuple[NumericType, NumericType]:
+        return tuple(self)
 
     def __str__(self) -> str:
-        return f"Point({self.x}, {self.y})"
+        return f"Point({self[0]}, {self[1]})"
 
     def __repr__(self) -> str:
-        return f"({self.x}, {self.y})"
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, Point):
-            return False
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self) -> int:
-        return hash(self.x)+hash(self.y)
-
-    def __add__(self,
-                other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x+other.x, self.y+other.y)
-        if isinstance(other, int):
-            return Point(self.x+other, self.y+other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x+other[0], self.y+other[1])
-        if isinstance(other, list) and len(other) == 2:
-            return Point(self.x+other[0], self.y+other[1])
-        raise ValueError("Invalid operand")
-
-    def __iadd__(self,
-                 other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x += other.x
-            self.y += other.y
-            return self
-        if isinstance(other, int):
-            self.x += other
-            self.y += other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x += other[0]
-            self.y += other[1]
-            return self
-        if isinstance(other, list):
-            self.x += other[0]
-            self.y += other[1]
-            return self
-        raise ValueError("Invalid operand")
-
-    def __sub__(self,
-                other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x-other.x, self.y-other.y)
-        if isinstance(other, int):
-            return Point(self.x-other, self.y-other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x-other[0], self.y-other[1])
-        if isinstance(other, list):
-            return Point(self.x-other[0], self.y-other[1])
-        raise ValueError("Invalid operand")
-
-    def __isub__(self,
-                 other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x -= other.x
-            self.y -= other.y
-            return self
-        if isinstance(other, int):
-            self.x -= other
-            self.y -= other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x -= other[0]
-            self.y -= other[1]
-            return self
-        if isinstance(other, list):
-            self.x -= other[0]
-            self.y -= other[1]
-            return self
-        raise ValueError("Invalid operand")
-
-    def __mul__(self,
-                other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x*other.x, self.y*other.y)
-        if isinstance(other, int):
-            return Point(self.x*other, self.y*other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x*other[0], self.y*other[1])
-        if isinstance(other, list):
-            return Point(self.x*other[0], self.y*other[1])
-        raise ValueError("Invalid operand")
-
-    def __imul__(self,
-                 other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x *= other.x
-            self.y *= other.y
-            return self
-        if isinstance(other, int):
-            self.x *= other
-            self.y *= other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x *= other[0]
-            self.y *= other[1]
-            return self
-        if isinstance(other, list):
-            self.x *= other[0]
-            self.y *= other[1]
-            return self
-        raise ValueError("Invalid operand")
-
-    def __truediv__(self,
-                    other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x/other.x, self.y/other.y)
-        if isinstance(other, int):
-            return Point(self.x/other, self.y/other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x/other[0], self.y/other[1])
-        if isinstance(other, list):
-            return Point(self.x/other[0], self.y/other[1])
-        raise ValueError("Invalid operand")
-
-    def __itruediv__(self,
-                     other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x /= other.x
-            self.y /= other.y
-            return self
-        if isinstance(other, int):
-            self.x /= other
-            self.y /= other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x /= other[0]
-            self.y /= other[1]
-            return self
-        if isinstance(other, list):
-            self.x /= other[0]
-            self.y /= other[1]
-            return self
-        raise ValueError("Invalid operand")
-
-    def __floordiv__(self,
-                     other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x//other.x, self.y//other.y)
-        if isinstance(other, int):
-            return Point(self.x//other, self.y//other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x//other[0], self.y//other[1])
-        if isinstance(other, list):
-            return Point(self.x//other[0], self.y//other[1])
-        raise ValueError("Invalid operand")
-
-    def __ifloordiv__(self,
-                      other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x //= other.x
-            self.y //= other.y
-            return self
-        if isinstance(other, int):
-            self.x //= other
-            self.y //= other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x //= other[0]
-            self.y //= other[1]
-            return self
-        if isinstance(other, list):
-            self.x //= other[0]
-            self.y //= other[1]
-            return self
-        raise ValueError("Invalid operand")
-
-    def __mod__(self,
-                other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x%other.x, self.y%other.y)
-        if isinstance(other, int):
-            return Point(self.x%other, self.y%other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x%other[0], self.y%other[1])
-        if isinstance(other, list):
-            return Point(self.x%other[0], self.y%other[1])
-        raise ValueError("Invalid operand")
-
-    def __imod__(self,
-                 other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x %= other.x
-            self.y %= other.y
-            return self
-        if isinstance(other, int):
-            self.x %= other
-            self.y %= other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x %= other[0]
-            self.y %= other[1]
-            return self
-        if isinstance(other, list):
-            self.x %= other[0]
-            self.y %= other[1]
-            return self
-        raise ValueError("Invalid operand")
-
-    def __pow__(self,
-                other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            return Point(self.x**other.x, self.y**other.y)
-        if isinstance(other, int):
-            return Point(self.x**other, self.y**other)
-        if isinstance(other, tuple) and len(other) == 2:
-            return Point(self.x**other[0], self.y**other[1])
-        if isinstance(other, list):
-            return Point(self.x**other[0], self.y**other[1])
-        raise ValueError("Invalid operand")
-
-    def __ipow__(self,
-                 other: Union["Point", int, Tuple[NumericType], List[NumericType]]) -> "Point":
-        if isinstance(other, Point):
-            self.x **= other.x
-            self.y **= other.y
-            return self
-        if isinstance(other, int):
-            self.x **= other
-            self.y **= other
-            return self
-        if isinstance(other, tuple) and len(other) == 2:
-            self.x **= other[0]
-            self.y **= other[1]
-            return self
-        if isinstance(other, list):
-            self.x **= other[0]
-            self.y **= other[1]
-            return self
-        raise ValueError("Invalid operand")
+        return f"({self[0]}, {self[1]})"
+
+    __hash__ = tuple.__hash__
+
+    def _unordered(self, other: object) -> bool:
+        raise TypeError("Points have no ordering")
+
+    __lt__ = __le__ = __gt__ = __ge__ = _unordered
+
+    def __add__(self, other: OperandType) -> "Point":
+        if other.__class__ is Point:
+            return _new_tuple(Point, (self[0]+other[0], self[1]+other[1]))
+        if other.__class__ is int:
+            return _new_tuple(Point, (self[0]+other, self[1]+other))
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]+x, self[1]+y))
+
+    # a plain tuple on the left would otherwise concatenate
+    __radd__ = __add__
+
+    def __sub__(self, other: OperandType) -> "Point":
+        if other.__class__ is Point:
+            return _new_tuple(Point, (self[0]-other[0], self[1]-other[1]))
+        if other.__class__ is int:
+            return _new_tuple(Point, (self[0]-other, self[1]-other))
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]-x, self[1]-y))
+
+    def __rsub__(self, other: OperandType) -> "Point":
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (x-self[0], y-self[1]))
+
+    def __mul__(self, other: OperandType) -> "Point":
+        if other.__class__ is int:
+            return _new_tuple(Point, (self[0]*other, self[1]*other))
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]*x, self[1]*y))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: OperandType) -> "Point":
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]/x, self[1]/y))
+
+    def __floordiv__(self, other: OperandType) -> "Point":
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]//x, self[1]//y))
+
+    def __mod__(self, other: OperandType) -> "Point":
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]%x, self[1]%y))
+
+    def __pow__(self, other: OperandType) -> "Point":
+        x, y = _split_operand(other)
+        return _new_tuple(Point, (self[0]**x, self[1]**y))
 
     def __neg__(self) -> "Point":
-        return Point(-self.x, -self.y)
+        return _new_tuple(Point, (-self[0], -self[1]))
 
     def __pos__(self) -> "Point":
-        return Point(self.x, self.y)
+        return self
 
     def __abs__(self) -> "Point":
-        return Point(abs(self.x), abs(self.y))
+        return _new_tuple(Point, (abs(self[0]), abs(self[1])))
 
     def copy(self) -> "Point":
         """
         Creates a copy of self.
+        Points are immutable, so the point itself is returned.
 
         :return: creates copy
         :rtype: Point
         """
-        return Point(self.x, self.y)
+        return self
@@ -0,0 +1,173 @@
+"""
+This module contains the BoardStats class,
+which keeps running statistics of the pieces of a board.
+
+Adding or removing a piece updates the material counts and the coordinate sums
+behind the centroid in constant time. Everything is kept in lists indexed by
+the integer values of the colors and piece kinds, as hashing enum members
+costs more than the rest of the update.
+
+The bounding box of a color is extended in place as pieces are added.
+When a piece leaves one of its edges it is only marked stale, and recomputed
+from the chunk index of the board the next time it is asked for.
+"""
+
+from typing import List, Optional, Tuple
+from .chunks import ChunkIndex
+from .pieces import Piece, PieceColor, PieceName
+from .point import Point
+
+# slot of each color in the lists, WHITE is 1 and BLACK is -1, so the last slot
+COLORS = (PieceColor.WHITE, PieceColor.BLACK)
+KINDS = len(PieceName)
+
+class BoardStats:
+    """
+    The BoardStats class stores the material, centroid and bounding box of each color.
+    """
+    __slots__ = ("chunks", "material", "counts", "xs", "ys", "boxes")
+
+    def __init__(self, chunks: ChunkIndex) -> None:
+        """
+        The constructor for the BoardStats class.
+
+        :param chunks: chunk index of the same pieces, to recompute the bounding boxes from
+        :type chunks: ChunkIndex
+        """
+        self.chunks = chunks
+        self.material: List[List[int]] = [[0] * KINDS for _ in range(3)]
+        self.counts = [0, 0, 0]
+        self.xs = [0, 0, 0]
+        self.ys = [0, 0, 0]
+        # left, bottom, right, top of each color, None until computed again
+        self.boxes: List[Optional[List[int]]] = [None, None, None]
+
+    def copy(self, chunks: ChunkIndex) -> "BoardStats":
+        """
+        Returns an independent copy of the statistics.
+
+        :param chunks: chunk index of the copied pieces
+        :type chunks: ChunkIndex
+        :return: copied statistics
+        :rtype: BoardStats
+        """
+        stats = BoardStats(chunks)
+        stats.material = [kinds[:] for kinds in self.material]
+        stats.counts = self.counts[:]
+        stats.xs = self.xs[:]
+        stats.ys = self.ys[:]
+        stats.boxes = [box[:] if box is not None else None for box in self.boxes]
+        return stats
+
+    def add(self, piece: Piece) -> None:
+        """
+        Count a piece under its current position.
+
+        :param piece: piece to count
+        :type piece: Piece
+        """
+        slot = piece.color._value_
+        x, y = piece.position
+        self.material[slot][piece.name._value_] += 1
+        self.counts[slot] += 1
+        self.xs[slot] += x
+        self.ys[slot] += y
+        box = self.boxes[slot]
+        if box is not None:
+            if x < box[0]:
+                box[0] = x
+            elif x > box[2]:
+                box[2] = x
+            if y < box[1]:
+                box[1] = y
+            elif y > box[3]:
+                box[3] = y
+        elif self.counts[slot] == 1:
+            self.boxes[slot] = [x, y, x, y]
+
+    def remove(self, piece: Piece) -> None:
+        """
+        Stop counting a piece, from under its current position.
+
+        :param piece: piece to remove, has to be counted
+        :type piece: Piece
+        """
+        slot = piece.color._value_
+        x, y = piece.position
+        self.material[slot][piece.name._value_] -= 1
+        self.counts[slot] -= 1
+        self.xs[slot] -= x
+        self.ys[slot] -= y
+        box = self.boxes[slot]
+        if box is not None and (x == box[0] or x == box[2] or y == box[1] or y == box[3]):
+            self.boxes[slot] = None
+
+    def count(self, name: PieceName, color: PieceColor) -> int:
+        """
+        Returns the number of pieces of a kind and color.
+
+        :param name: kind of the pieces
+        :type name: PieceName
+        :param color: color of the pieces
+        :type color: PieceColor
+        :return: number of pieces
+        :rtype: int
+        """
+        return self.material[color._value_][name._value_]
+
+    def get_colors(self, color: Optional[PieceColor]) -> Tuple[PieceColor, ...]:
+        """
+        Returns the colors a query covers.
+
+        :param color: color to query, None for both
+        :type color: Optional[PieceColor]
+        :return: the colors
+        :rtype: Tuple[PieceColor, ...]
+        """
+        return COLORS if color is None else (color,)
+
+    def get_bounding_box(self, color: Optional[PieceColor] = None) -> Optional[Tuple[Point, Point]]:
+        """
+        Returns the smallest rectangle holding the pieces of a color.
+
+        :param color: color of the pieces, None for both
+        :type color: Optional[PieceColor]
+        :return: bottom left and top right corners, or None if there are no pieces
+        :rtype: Optional[Tuple[Point, Point]]
+        """
+        corners = None
+        for current in self.get_colors(color):
+            slot = current._value_
+            if not self.counts[slot]:
+                continue
+            box = self.boxes[slot]
+            if box is None:
+                box = self.boxes[slot] = self.chunks.get_extent(current)
+            if corners is None:
+                corners = box[:]
+            else:
+                corners = [min(corners[0], box[0]), min(corners[1], box[1]),
+                           max(corners[2], box[2]), max(corners[3], box[3])]
+        if corners is None:
+            return None
+        return Point(corners[0], corners[1]), Point(corners[2], corners[3])
+
+    def get_centroid(self, color: Optional[PieceColor] = None) -> Optional[Tuple[float, float]]:
+        """
+        Returns the mean position of the pieces of a color.
+        It is a pair of floats rather than a Point, as it usually falls between squares.
+
+        :param color: color of the pieces, None for both
+        :type color: Optional[PieceColor]
+        :return: x and y of the centroid, or None if there are no pieces
+        :rtype: Optional[Tuple[float, float]]
+        """
+        count = x = y = 0
+        for current in self.get_colors(color):
+            slot = current._value_
+            count += self.counts[slot]
+            x += self.xs[slot]
+            y += self.ys[slot]
+        if not count:
+            return None
+        return x / count, y / count
@@ -0,0 +1,308 @@
+"""
+This module contains the compact binary position encoding
+and the PositionStore class, a memory-mapped file of encoded positions.
+
+An encoded position holds, in order:
+
+- a state byte, bit 0 set when black is to move and bit 1 when there is an en passant square,
+- the halfmove clock and the fullmove number as varints,
+- the en passant square as two zigzag varints, when there is one,
+- the number of pieces as a varint,
+- one nibble per piece, the kind in the low 3 bits and the color in the high bit,
+- one bit per piece, set when the piece has moved,
+- the coordinates of the pieces sorted by square, each one as a delta from the previous:
+  the x delta as a varint, zigzag for the first piece, and the y delta as a zigzag varint.
+
+The store pads every encoded position to the same record size,
+so a record is found by its index without any lookup table.
+"""
+
+#Built-in imports
+import mmap
+import struct
+from typing import Generator, Iterable, List, TYPE_CHECKING
+
+#Internal imports
+from .point import Point
+from .pieces import PieceColor, PieceName
+from .errors import PositionStoreError
+from .fen import Position
+
+if TYPE_CHECKING:
+    from .board import Board
+
+# magic, version, record size, number of records
+STORE_HEADER = struct.Struct("<4sHHQ")
+STORE_MAGIC = b"QPOS"
+STORE_VERSION = 1
+DEFAULT_RECORD_SIZE = 128
+
+STATE_BLACK = 1
+STATE_EN_PASSANT = 2
+
+PIECE_NAMES = tuple(PieceName)
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Append a non-negative integer as a varint, 7 bits per byte.
+
+    :param buffer: buffer to append to
+    :type buffer: bytearray
+    :param value: non-negative integer
+    :type value: int
+    """
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def _read_varint(data: memoryview, offset: int) -> tuple:
+    """
+    Read a varint.
+
+    :param data: encoded data
+    :type data: memoryview
+    :param offset: index of the first byte of the varint
+    :type offset: int
+    :return: the integer and the index after the varint
+    :rtype: tuple
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+def _zigzag(value: int) -> int:
+    """
+    Map a signed integer to a non-negative one, small magnitudes to small values.
+
+    :param value: signed integer
+    :type value: int
+    :return: non-negative integer
+    :rtype: int
+    """
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value: int) -> int:
+    """
+    Invert _zigzag.
+
+    :param value: non-negative integer
+    :type value: int
+    :return: signed integer
+    :rtype: int
+    """
+    return (value >> 1) ^ -(value & 1)
+
+def encode_position(board: "Board") -> bytes:
+    """
+    Encode the position of a board. The move history isn't included.
+
+    :param board: board to encode
+    :type board: Board
+    :return: encoded position
+    :rtype: bytes
+    """
+    pieces = sorted(board.pieces, key=lambda piece: tuple(piece.position))
+    buffer = bytearray()
+    buffer.append((board.current_player == PieceColor.BLACK) * STATE_BLACK |
+                  (board.en_passant is not None) * STATE_EN_PASSANT)
+    _write_varint(buffer, board.halfmove_clock)
+    _write_varint(buffer, board.fullmove_number)
+    if board.en_passant is not None:
+        _write_varint(buffer, _zigzag(board.en_passant[0]))
+        _write_varint(buffer, _zigzag(board.en_passant[1]))
+    _write_varint(buffer, len(pieces))
+    codes = [piece.name.value | (piece.color == PieceColor.BLACK) << 3 for piece in pieces]
+    codes.append(0)
+    buffer.extend(codes[i] | codes[i + 1] << 4 for i in range(0, len(pieces), 2))
+    for i in range(0, len(pieces), 8):
+        buffer.append(sum(1 << bit for bit, piece in enumerate(pieces[i:i + 8]) if piece.moved))
+    last_x = last_y = 0
+    for index, piece in enumerate(pieces):
+        x, y = piece.position
+        _write_varint(buffer, _zigzag(x) if index == 0 else x - last_x)
+        _write_varint(buffer, _zigzag(y - last_y))
+        last_x, last_y = x, y
+    return bytes(buffer)
+
+def decode_position(data: memoryview) -> Position:
+    """
+    Decode a position made by encode_position. Trailing padding is ignored.
+
+    :param data: encoded position
+    :type data: memoryview
+    :raises PositionStoreError: when the data ends before the position does
+    :return: decoded position, ready for Board.load_position
+    :rtype: Position
+    """
+    try:
+        state = data[0]
+        halfmove_clock, offset = _read_varint(data, 1)
+        fullmove_number, offset = _read_varint(data, offset)
+        en_passant = None
+        if state & STATE_EN_PASSANT:
+            x, offset = _read_varint(data, offset)
+            y, offset = _read_varint(data, offset)
+            en_passant = Point(_unzigzag(x), _unzigzag(y))
+        count, offset = _read_varint(data, offset)
+        codes = offset
+        moved = codes + (count + 1) // 2
+        offset = moved + (count + 7) // 8
+        pieces: List[tuple] = []
+        x = y = 0
+        for index in range(count):
+            code = data[codes + index // 2] >> (index & 1) * 4 & 0xF
+            dx, offset = _read_varint(data, offset)
+            dy, offset = _read_varint(data, offset)
+            x = _unzigzag(dx) if index == 0 else x + dx
+            y += _unzigzag(dy)
+            pieces.append((PIECE_NAMES[code & 7],
+                           PieceColor.BLACK if code & 8 else PieceColor.WHITE,
+                           x, y, bool(data[moved + index // 8] >> (index & 7) & 1)))
+    except IndexError as error:
+        raise PositionStoreError("Encoded position is truncated") from error
+    player = PieceColor.BLACK if state & STATE_BLACK else PieceColor.WHITE
+    return pieces, player, en_passant, halfmove_clock, fullmove_number
+
+class PositionStore:
+    """
+    Class to read a file of fixed-size encoded positions through a memory map.
+    Records are only read from disk when they are accessed,
+    and iterating over the raw records doesn't copy them.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Open a store written by PositionStore.write.
+
+        :param path: path of the store file
+        :type path: str
+        :raises PositionStoreError: when the file isn't a position store
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:
+            self.file.close()
+            raise PositionStoreError(f"{path} is empty") from error
+        self.view = memoryview(self.map)
+        try:
+            magic, version, self.record_size, self.count = STORE_HEADER.unpack_from(self.map)
+        except struct.error as error:
+            self.close()
+            raise PositionStoreError(f"{path} is too short for a header") from error
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self.close()
+            raise PositionStoreError(f"{path} isn't a version {STORE_VERSION} position store")
+        if len(self.map) != STORE_HEADER.size + self.record_size * self.count:
+            self.close()
+            raise PositionStoreError(f"{path} doesn't hold {self.count} records")
+
+    @classmethod
+    def write(cls,
+              path: str,
+              boards: Iterable["Board"],
+              record_size: int = DEFAULT_RECORD_SIZE) -> int:
+        """
+        Write the positions of boards to a new store file.
+        The boards are encoded one at a time, so a generator that reuses
+        a single board, such as fen.stream_positions, can be written directly.
+
+        :param path: path of the store file
+        :type path: str
+        :param boards: boards holding the positions to write
+        :type boards: Iterable[Board]
+        :param record_size: size of every record in bytes
+        :type record_size: int
+        :raises PositionStoreError: when a position doesn't fit in a record
+        :return: number of written positions
+        :rtype: int
+        """
+        count = 0
+        with open(path, "wb") as file:
+            file.write(STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, record_size, 0))
+            for board in boards:
+                record = encode_position(board)
+                if len(record) > record_size:
+                    raise PositionStoreError(
+                        f"Position {count} takes {len(record)} bytes, records have {record_size}")
+                file.write(record.ljust(record_size, b"\0"))
+                count += 1
+            file.seek(0)
+            file.write(STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, record_size, count))
+        return count
+
+    def get_record(self, index: int) -> memoryview:
+        """
+        Get a record without copying it.
+
+        :param index: index of the record, negative values count from the end
+        :type index: int
+        :raises IndexError: when the index is out of range
+        :return: view of the record inside the memory map
+        :rtype: memoryview
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Record {index} out of range for {self.count} records")
+        start = STORE_HEADER.size + index * self.record_size
+        return self.view[start:start + self.record_size]
+
+    def iter_records(self) -> Generator[memoryview, None, None]:
+        """
+        Iterate over the records without copying them.
+        The views have to be released before the store is closed.
+
+        :yield: view of the record inside the memory map
+        :rtype: memoryview
+        """
+        for start in range(STORE_HEADER.size, len(self.view), self.record_size):
+            yield self.view[start:start + self.record_size]
+
+    def load(self, index: int, board: "Board") -> "Board":
+        """
+        Load a stored position into a board.
+
+        :param index: index of the record
+        :type index: int
+        :param board: board to load the position into
+        :type board: Board
+        :return: the board
+        :rtype: Board
+        """
+        with self.get_record(index) as record:
+            board.load_position(decode_position(record))
+        return board
+
+    def close(self) -> None:
+        """
+        Release the memory map and close the file.
+        """
+        self.view.release()
+        self.map.close()
+        self.file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Position:
+        with self.get_record(index) as record:
+            return decode_position(record)
+
+    def __iter__(self) -> Generator[Position, None, None]:
+        for record in self.iter_records():
+            with record:
+                yield decode_position(record)
+
+    def __enter__(self) -> "PositionStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -13,25 +13,46 @@ POSITION_5_FEN = "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8"
 
 def standard_notation_to_point(square: str) -> Point:
     """
-    Convert a square in standard notation (e.g. e2) to a Point object (e.g. Point(5, 2))
+    Convert a square in standard notation (e.g. e2) to a Point object (e.g. Point(5, 2)).
+    Files past h continue up to z, then aa, ab... and ranks can have several digits,
+    so every square with positive coordinates has a name (e.g. aa10 is Point(27, 10)).
 
     :param square: string representing a square in standard notation (e.g. e2)
     :type square: str
-    :raises ValueError: when square has length different than 2
-    :raises ValueError: when square[1] is not a digit
-    :raises ValueError: when square[0] is not a letter representing a file
+    :raises ValueError: when square doesn't start with lowercase letters
+    :raises ValueError: when square doesn't end with a positive rank
     :return: Point equivalent to the square in standard notation
     :rtype: Point
     """
-    if len(square) != 2:
-        raise ValueError("Invalid square notation")
-    if square[1] not in "12345678":
-        raise ValueError("Invalid square notation")
-    if square[0] not in "abcdefgh":
-        raise ValueError("Invalid square notation")
-    file = ord(square[0]) - ord('a') + 1
-    rank = int(square[1])
-    return Point(file, rank)
+    split = 0
+    while split < len(square) and "a" <= square[split] <= "z":
+        split += 1
+    letters, digits = square[:split], square[split:]
+    if not letters or not digits.isdigit() or digits[0] == "0":
+        raise ValueError(f"Invalid square notation: {square!r}")
+    file = 0
+    for letter in letters:
+        file = file * 26 + ord(letter) - ord('a') + 1
+    return Point(file, int(digits))
+
+def point_to_standard_notation(point: Point) -> str:
+    """
+    Convert a Point object (e.g. Point(5, 2)) to a square in standard notation (e.g. e2).
+
+    :param point: square to convert
+    :type point: Point
+    :raises ValueError: when a coordinate is smaller than 1
+    :return: square in standard notation
+    :rtype: str
+    """
+    file, rank = point
+    if file < 1 or rank < 1:
+        raise ValueError(f"Square {point!r} has no standard notation")
+    letters = ""
+    while file:
+        file, letter = divmod(file - 1, 26)
+        letters = chr(ord('a') + letter) + letters
+    return f"{letters}{rank}"
 
 def fen_to_piece_name(
     char: Literal["P","N","B","R","Q","K"]
@@ -0,0 +1,87 @@
+"""
+This module contains the position hashing used to identify positions cheaply.
+
+Classic Zobrist hashing draws a random number for every (piece, color, square)
+combination from a fixed table. The board here is unbounded, so instead the
+keys are derived on demand from a deterministic 64-bit mixing function of the
+piece kind, color, moved flag and coordinates.
+"""
+
+from functools import lru_cache
+from .pieces import Piece, PieceColor
+from .point import Point
+
+MASK_64 = (1 << 64) - 1
+
+_PRIME_X = 0x9E3779B97F4A7C15
+_PRIME_Y = 0xC2B2AE3D27D4EB4F
+_PRIME_CODE = 0x165667B19E3779F9
+
+def mix64(value: int) -> int:
+    """
+    Scrambles an integer into a well distributed 64-bit value (splitmix64 finalizer).
+
+    :param value: value to scramble
+    :type value: int
+    :return: 64-bit hash of the value
+    :rtype: int
+    """
+    value &= MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+SIDE_KEY = mix64(0x5EED5EED5EED5EED)
+
+def piece_code(piece: Piece) -> int:
+    """
+    Packs piece kind, color and moved flag into a small integer.
+
+    :param piece: piece to encode
+    :type piece: Piece
+    :return: code in range 0-41
+    :rtype: int
+    """
+    return piece.name.value * 6 + (piece.color.value + 1) * 2 + piece.moved
+
+@lru_cache(maxsize=1 << 16)
+def square_key(code: int, x: int, y: int) -> int:
+    """
+    Returns the key of a piece code standing on a square.
+
+    :param code: piece code returned by piece_code
+    :type code: int
+    :param x: x coordinate of the square
+    :type x: int
+    :param y: y coordinate of the square
+    :type y: int
+    :return: 64-bit key
+    :rtype: int
+    """
+    return mix64((x * _PRIME_X) ^ (y * _PRIME_Y) ^ ((code + 1) * _PRIME_CODE))
+
+def piece_key(piece: Piece, position: Point = None) -> int:
+    """
+    Returns the key of a piece on its current square, or on the given one.
+
+    :param piece: piece to hash
+    :type piece: Piece
+    :param position: square to hash the piece on, defaults to the piece position
+    :type position: Point, optional
+    :return: 64-bit key
+    :rtype: int
+    """
+    if position is None:
+        position = piece.position
+    return square_key(piece_code(piece), position[0], position[1])
+
+def side_key(color: PieceColor) -> int:
+    """
+    Returns the key contribution of the side to move.
+
+    :param color: side to move
+    :type color: PieceColor
+    :return: SIDE_KEY for black, 0 otherwise
+    :rtype: int
+    """
+    return SIDE_KEY if color == PieceColor.BLACK else 0
@@ -3,3 +3,7 @@ This package contains the engine of the Quasar application.
 """
 
 __title__ = "engine"
+
+from .evaluation import Evaluation, material_evaluation, PIECE_VALUES
+from .search import Search, SearchResult, MATE_SCORE
+from .transposition import TranspositionTable, Bound
@@ -0,0 +1,38 @@
+"""
+This module contains the position evaluation functions used by the search.
+
+An evaluation is any callable that takes a Board and returns a score in
+centipawns from the point of view of the side to move.
+"""
+
+from typing import Callable, Dict
+from quasar.chess.board import Board
+from quasar.chess.pieces import PieceColor, PieceName
+
+Evaluation = Callable[[Board], int]
+
+PIECE_VALUES: Dict[PieceName, int] = {PieceName.NONE: 0,
+                                      PieceName.PAWN: 100,
+                                      PieceName.KNIGHT: 300,
+                                      PieceName.BISHOP: 320,
+                                      PieceName.ROOK: 500,
+                                      PieceName.QUEEN: 900,
+                                      PieceName.KING: 0}
+
+def material_evaluation(board: Board) -> int:
+    """
+    Evaluates the position by counting material.
+    The counts are kept up to date by the board, so no piece is visited.
+
+    :param board: board to evaluate
+    :type board: Board
+    :return: material balance in centipawns for the side to move
+    :rtype: int
+    """
+    player = board.current_player
+    enemy = PieceColor.BLACK if player == PieceColor.WHITE else PieceColor.WHITE
+    score = 0
+    for name, value in PIECE_VALUES.items():
+        if value:
+            score += value * (board.get_material(name, player) - board.get_material(name, enemy))
+    return score
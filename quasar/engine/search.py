@@ -0,0 +1,348 @@
+"""
+This module contains the Search class,
+an iterative deepening negamax search with alpha-beta pruning.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+from quasar.logger import logger
+from quasar.chess.board import Board
+from quasar.chess.moves import Move
+from quasar.chess.packed import PackedMove
+from quasar.chess.point import Point
+from quasar.chess.pieces import PieceColor, PieceName
+from .evaluation import Evaluation, material_evaluation, PIECE_VALUES
+from .transposition import TranspositionTable, Bound, pack_move, NO_MOVE
+
+MATE_SCORE = 100_000
+INFINITY = 1_000_000
+MAX_DEPTH = 64
+
+@dataclass
+class SearchResult:
+    """
+    The SearchResult class stores the outcome of a search.
+    """
+    best_move: Optional[Move] = None
+    score: int = 0
+    pv: List[Move] = field(default_factory=list)
+    depth: int = 0
+    nodes: int = 0
+    time: float = 0.0
+
+    @property
+    def nps(self) -> int:
+        """
+        Nodes searched per second.
+
+        :return: nodes per second
+        :rtype: int
+        """
+        if self.time <= 0:
+            return 0
+        return int(self.nodes / self.time)
+
+class Search:
+    """
+    The Search class finds the best move in a position.
+    """
+    def __init__(self,
+                 evaluation: Evaluation = material_evaluation,
+                 margin: int = 2,
+                 table: Optional[TranspositionTable] = None) -> None:
+        """
+        The constructor for the Search class.
+
+        :param evaluation: Evaluation function, scores the position for the side to move.
+        :type evaluation: Evaluation
+        :param margin: How many squares around the pieces moves are generated for.
+        :type margin: int
+        :param table: Transposition table shared between searches, None disables it.
+        :type table: Optional[TranspositionTable]
+        """
+        self.evaluation = evaluation
+        self.margin = margin
+        self.table = table
+
+        self.nodes = 0
+        self.stopped = False
+        self.node_limit: Optional[int] = None
+        self.deadline: Optional[float] = None
+        self.bottom_left_bound = Point(0, 0)
+        self.top_right_bound = Point(0, 0)
+
+    def search(self,
+               board: Board,
+               depth: Optional[int] = None,
+               nodes: Optional[int] = None,
+               time_limit: Optional[float] = None,
+               callback: Optional[Callable[[SearchResult], None]] = None) -> SearchResult:
+        """
+        Search the position with iterative deepening until a limit is hit.
+
+        :param board: Board to search. It is restored before returning.
+        :type board: Board
+        :param depth: Maximum depth in plies.
+        :type depth: Optional[int]
+        :param nodes: Maximum number of nodes.
+        :type nodes: Optional[int]
+        :param time_limit: Maximum time in seconds.
+        :type time_limit: Optional[float]
+        :param callback: Called with the result of every completed iteration.
+        :type callback: Optional[Callable[[SearchResult], None]]
+        :raises ValueError: If no limit is given.
+        :return: Result of the deepest completed iteration.
+        :rtype: SearchResult
+        """
+        if depth is None and nodes is None and time_limit is None:
+            raise ValueError("At least one search limit has to be given")
+
+        start = time.perf_counter()
+        self.nodes = 0
+        self.stopped = False
+        self.node_limit = nodes
+        self.deadline = start + time_limit if time_limit is not None else None
+        self.set_bounds(board)
+        if self.table is not None:
+            self.table.new_search()
+
+        result = SearchResult()
+        for current_depth in range(1, (depth or MAX_DEPTH) + 1):
+            score, pv = self.negamax(board, current_depth, -INFINITY, INFINITY, 0, result.pv)
+            if self.stopped and result.best_move is not None:
+                break
+            result = SearchResult(best_move=pv[0] if pv else None,
+                                  score=score,
+                                  pv=pv,
+                                  depth=current_depth,
+                                  nodes=self.nodes,
+                                  time=time.perf_counter() - start)
+            logger.info("depth %s score %s nodes %s nps %s pv %s",
+                        result.depth, result.score, result.nodes, result.nps, result.pv)
+            if callback is not None:
+                callback(result)
+            if self.stopped or abs(score) >= MATE_SCORE - MAX_DEPTH:
+                break
+        result.nodes = self.nodes
+        result.time = time.perf_counter() - start
+        return result
+
+    def set_bounds(self, board: Board) -> None:
+        """
+        Set the move generation bounds to the area around the pieces.
+
+        :param board: Board to take the pieces from.
+        :type board: Board
+        """
+        self.bottom_left_bound, self.top_right_bound = board.get_bounds(margin=self.margin)
+
+    def get_node_bounds(self, board: Board) -> Tuple[Point, Point]:
+        """
+        Get the move generation bounds of a node: the bounds of the search,
+        grown to hold every piece. A slider giving check from outside the bounds
+        stays inside them, so capturing it or blocking its line is still generated.
+
+        :param board: Board to take the pieces from.
+        :type board: Board
+        :return: The bottom left and top right corners of the area.
+        :rtype: Tuple[Point, Point]
+        """
+        bottom_left, top_right = self.bottom_left_bound, self.top_right_bound
+        box = board.get_bounding_box()
+        if box is None:
+            return bottom_left, top_right
+        if box[0].x < bottom_left.x or box[0].y < bottom_left.y:
+            bottom_left = Point(min(box[0].x, bottom_left.x), min(box[0].y, bottom_left.y))
+        if box[1].x > top_right.x or box[1].y > top_right.y:
+            top_right = Point(max(box[1].x, top_right.x), max(box[1].y, top_right.y))
+        return bottom_left, top_right
+
+    def should_stop(self) -> bool:
+        """
+        Check the node and time limits.
+
+        :return: True if the search has to stop, False otherwise.
+        :rtype: bool
+        """
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            return True
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return True
+        return False
+
+    def generate_moves(self, board: Board) -> List[Move]:
+        """
+        Generate the legal moves of the side to move.
+        Ray moves of sliders are expanded inside the bounds
+        and on the squares outside of them that give check.
+
+        :param board: Board to generate the moves on.
+        :type board: Board
+        :return: Legal moves.
+        :rtype: List[Move]
+        """
+        bottom_left, top_right = self.get_node_bounds(board)
+        moves, rays = board.generate_move_families(bottom_left, top_right)
+        enemy = PieceColor.BLACK if board.current_player == PieceColor.WHITE else PieceColor.WHITE
+        kings = board.find_pieces(PieceName.KING, enemy)
+        for ray in rays:
+            moves.extend(ray.expand(bottom_left, top_right))
+            if not kings:
+                continue
+            for distance in board.get_ray_checks(ray, kings[0]):
+                target = ray.get_target(distance)
+                if not (bottom_left.x <= target.x <= top_right.x and
+                        bottom_left.y <= target.y <= top_right.y):
+                    moves.append(ray.get_move(distance))
+        return moves
+
+    def order_moves(self,
+                    moves: List[Move],
+                    pv_move: Optional[Move],
+                    table_move: int = NO_MOVE) -> List[Move]:
+        """
+        Order moves so the principal variation move comes first,
+        then the transposition table move, then captures (MVV-LVA).
+
+        :param moves: Moves to order.
+        :type moves: List[Move]
+        :param pv_move: Best move of the previous iteration at this node, if any.
+        :type pv_move: Optional[Move]
+        :param table_move: Best move from the transposition table, packed as a PackedMove.
+        :type table_move: int
+        :return: Ordered moves.
+        :rtype: List[Move]
+        """
+        if table_move != NO_MOVE:
+            packed = PackedMove(table_move)
+            table_source, table_target = packed.source, packed.target
+
+        def key(move: Move) -> int:
+            if pv_move is not None and \
+                move.source == pv_move.source and move.target == pv_move.target:
+                return -INFINITY
+            if table_move != NO_MOVE and \
+                move.source == table_source and move.target == table_target:
+                return -INFINITY + 1
+            if move.captured.is_none():
+                return 0
+            return PIECE_VALUES[move.moved.name] - 10 * PIECE_VALUES[move.captured.name]
+        return sorted(moves, key=key)
+
+    def negamax(self,
+                board: Board,
+                depth: int,
+                alpha: int,
+                beta: int,
+                ply: int,
+                pv_hint: List[Move]) -> Tuple[int, List[Move]]:
+        """
+        Negamax search with alpha-beta pruning.
+
+        :param board: Board to search.
+        :type board: Board
+        :param depth: Remaining depth in plies.
+        :type depth: int
+        :param alpha: Lower bound of the window.
+        :type alpha: int
+        :param beta: Upper bound of the window.
+        :type beta: int
+        :param ply: Distance from the root.
+        :type ply: int
+        :param pv_hint: Principal variation of the previous iteration from this node.
+        :type pv_hint: List[Move]
+        :return: Score for the side to move and the principal variation.
+        :rtype: Tuple[int, List[Move]]
+        """
+        self.nodes += 1
+        if self.should_stop():
+            self.stopped = True
+            return 0, []
+        if depth == 0:
+            return self.evaluation(board), []
+
+        key = board.position_key
+        table_move = NO_MOVE
+        if self.table is not None:
+            entry = self.table.probe(key)
+            if entry is not None:
+                entry_depth, bound, entry_score, table_move = entry
+                entry_score = score_from_table(entry_score, ply)
+                if ply > 0 and entry_depth >= depth and \
+                    (bound == Bound.EXACT or
+                     (bound == Bound.LOWER and entry_score >= beta) or
+                     (bound == Bound.UPPER and entry_score <= alpha)):
+                    return entry_score, []
+
+        moves = self.generate_moves(board)
+        if not moves:
+            if board.is_in_check(board.current_player):
+                return -MATE_SCORE + ply, []
+            return 0, []
+
+        original_alpha = alpha
+        pv_move = pv_hint[0] if pv_hint else None
+        best_score = -INFINITY
+        best_pv: List[Move] = []
+        for move in self.order_moves(moves, pv_move, table_move):
+            follow_pv = pv_move is not None and \
+                move.source == pv_move.source and move.target == pv_move.target
+            board.make_move(move, False)
+            score, child_pv = self.negamax(board, depth - 1, -beta, -alpha, ply + 1,
+                                           pv_hint[1:] if follow_pv else [])
+            board.undo_move()
+            score = -score
+            if self.stopped:
+                break
+            if score > best_score:
+                best_score = score
+                best_pv = [move] + child_pv
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if self.table is not None and not self.stopped:
+            if best_score <= original_alpha:
+                bound = Bound.UPPER
+            elif best_score >= beta:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            self.table.store(key, depth, bound, score_to_table(best_score, ply),
+                             pack_move(best_pv[0] if best_pv else None))
+        return best_score, best_pv
+
+def score_to_table(score: int, ply: int) -> int:
+    """
+    Convert a mate score from distance-to-root to distance-to-node before storing it.
+
+    :param score: Score relative to the root.
+    :type score: int
+    :param ply: Distance of the node from the root.
+    :type ply: int
+    :return: Score relative to the node.
+    :rtype: int
+    """
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return score + ply
+    if score <= -MATE_SCORE + MAX_DEPTH:
+        return score - ply
+    return score
+
+def score_from_table(score: int, ply: int) -> int:
+    """
+    Convert a stored mate score back from distance-to-node to distance-to-root.
+
+    :param score: Score relative to the node.
+    :type score: int
+    :param ply: Distance of the node from the root.
+    :type ply: int
+    :return: Score relative to the root.
+    :rtype: int
+    """
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return score - ply
+    if score <= -MATE_SCORE + MAX_DEPTH:
+        return score + ply
+    return score
@@ -0,0 +1,188 @@
+"""
+This module contains the TranspositionTable class,
+a fixed-size hash table of search results indexed by position key.
+
+The table is stored as parallel ``array`` columns instead of Python objects,
+so its memory use is set up front and doesn't grow during the search.
+Every bucket holds two entries: a depth-preferred one, replaced only by
+deeper (or newer) searches, and an always-replace one.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Optional, Tuple
+from quasar.chess.moves import Move
+from quasar.chess.packed import PackedMove
+
+NO_MOVE = 0
+
+class Bound(IntEnum):
+    """
+    Enumerated type that represents the kind of score stored in an entry.
+    Available types: EXACT, LOWER, UPPER
+    """
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+def pack_move(move: Optional[Move]) -> int:
+    """
+    Packs a move with the PackedMove encoding, negative coordinates included.
+    A packed move always has a moved piece, so it is never NO_MOVE.
+    Moves that don't fit the fields of a PackedMove are stored as NO_MOVE.
+
+    :param move: move to pack
+    :type move: Optional[Move]
+    :return: packed move
+    :rtype: int
+    """
+    if move is None:
+        return NO_MOVE
+    try:
+        return PackedMove.from_move(move)
+    except ValueError:
+        return NO_MOVE
+
+class TranspositionTable:
+    """
+    The TranspositionTable class stores search results per position key.
+    """
+    SLOTS_PER_BUCKET = 2
+    # key (Q) + move (Q) + score (i) + depth (b) + bound (B) + generation (B)
+    ENTRY_SIZE = 8 + 8 + 4 + 1 + 1 + 1
+
+    def __init__(self, size_mb: float = 16) -> None:
+        """
+        The constructor for the TranspositionTable class.
+
+        :param size_mb: Memory budget of the table in megabytes.
+        :type size_mb: float
+        :raises ValueError: If the budget can't hold a single bucket.
+        """
+        bucket_size = self.ENTRY_SIZE * self.SLOTS_PER_BUCKET
+        buckets = int(size_mb * (1 << 20)) // bucket_size
+        if buckets < 1:
+            raise ValueError(f"Transposition table of {size_mb} MB can't hold a single bucket")
+        self.bucket_count = buckets
+        self.size = self.bucket_count * self.SLOTS_PER_BUCKET
+        self.generation = 0
+
+        self.keys = array("Q")
+        self.moves = array("Q")
+        self.scores = array("i")
+        self.depths = array("b")
+        self.bounds = array("B")
+        self.generations = array("B")
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Empty the table and reset the counters.
+        """
+        size = self.size
+        self.keys = array("Q", bytes(8 * size))
+        self.moves = array("Q", bytes(8 * size))
+        self.scores = array("i", bytes(4 * size))
+        self.depths = array("b", b"\xff" * size)
+        self.bounds = array("B", bytes(size))
+        self.generations = array("B", bytes(size))
+        self.generation = 0
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """
+        Reset the probe, hit, store and collision counters.
+        """
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.collisions = 0
+
+    def new_search(self) -> None:
+        """
+        Mark the start of a new search, so entries from older searches age out.
+        """
+        self.generation = (self.generation + 1) & 0xFF
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the table columns in bytes.
+
+        :return: bytes used
+        :rtype: int
+        """
+        return sum(column.itemsize * len(column) for column in
+                   (self.keys, self.moves, self.scores, self.depths, self.bounds, self.generations))
+
+    def hashfull(self) -> int:
+        """
+        Estimate how full the table is from its first thousand entries.
+
+        :return: occupied entries per mille
+        :rtype: int
+        """
+        sample = min(1000, self.size)
+        used = sum(1 for i in range(sample) if self.depths[i] >= 0)
+        return used * 1000 // sample
+
+    def probe(self, key: int) -> Optional[Tuple[int, Bound, int, int]]:
+        """
+        Look up a position.
+
+        :param key: 64-bit position key.
+        :type key: int
+        :return: Depth, bound, score and packed move, or None if not stored.
+        :rtype: Optional[Tuple[int, Bound, int, int]]
+        """
+        self.probes += 1
+        index = (key % self.bucket_count) * self.SLOTS_PER_BUCKET
+        keys = self.keys
+        depths = self.depths
+        for slot in (index, index + 1):
+            if keys[slot] == key and depths[slot] >= 0:
+                self.hits += 1
+                return depths[slot], Bound(self.bounds[slot]), self.scores[slot], self.moves[slot]
+        return None
+
+    def store(self, key: int, depth: int, bound: Bound, score: int, move: int = NO_MOVE) -> None:
+        """
+        Store a search result.
+        The depth-preferred slot takes it if the result is at least as deep as the
+        entry there or that entry is from an older search, otherwise it goes to the
+        always-replace slot. The move of an entry is only kept when the same
+        position is stored again without one.
+
+        :param key: 64-bit position key.
+        :type key: int
+        :param depth: Depth the position was searched to.
+        :type depth: int
+        :param bound: Kind of the score.
+        :type bound: Bound
+        :param score: Score of the position.
+        :type score: int
+        :param move: Packed best move, NO_MOVE if unknown.
+        :type move: int
+        """
+        self.stores += 1
+        index = (key % self.bucket_count) * self.SLOTS_PER_BUCKET
+        depth = min(depth, 127)
+        if self.keys[index] == key or self.depths[index] < 0 or \
+            depth >= self.depths[index] or self.generations[index] != self.generation:
+            slot = index
+        else:
+            slot = index + 1
+        if self.depths[slot] >= 0 and self.keys[slot] != key:
+            self.collisions += 1
+        if slot == index and self.keys[index + 1] == key:
+            self.depths[index + 1] = -1
+        if self.keys[slot] != key or self.depths[slot] < 0:
+            # the move of the entry replaced belongs to another position
+            self.moves[slot] = move
+        elif move != NO_MOVE:
+            self.moves[slot] = move
+        self.keys[slot] = key
+        self.scores[slot] = score
+        self.depths[slot] = depth
+        self.bounds[slot] = bound
+        self.generations[slot] = self.generation
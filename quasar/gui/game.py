@@ -26,10 +26,13 @@ class Game:
         self.display = pygame.display.set_mode((600, 600))
 
         self.square_size = self.display.get_width()//8
-        self.offset = Point(-1,8) * self.square_size
+        self.offset = Point(0,0)
         self.scale = 1
+        self.center_view()
 
         self.selected_tile = None
+        self.legal_moves = []
+        self.legal_moves_key = None
 
         self.last_mouse = Point(0,0)
 
@@ -87,6 +90,16 @@ class Game:
         i += pieces.index(piece_nickname)
         return self.images[i]
 
+    def center_view(self) -> None:
+        """
+        Move the view so the centroid of the pieces is in the middle of the display.
+        The centroid is a pair of floats, only turned into a Point once in pixels.
+        """
+        x, y = self.board.get_concentration_position()
+        scaled_tile = self.scale * self.square_size
+        center = Point(self.display.get_width(), self.display.get_height()) / 2
+        self.offset = center - Point(x * scaled_tile, -y * scaled_tile) - scaled_tile / 2
+
     def get_visible_tiles(self) -> list:
         """
         Get the visible tiles on the board.
@@ -130,6 +143,24 @@ class Game:
             int((mouse_pos.y - self.offset.y) // (self.scale * self.square_size)))
         return self.board_to_pygame(tile)
 
+    def get_legal_moves(self, bottom_left_bound: Point, top_right_bound: Point) -> list:
+        """
+        Get the legal moves of the side to move within the bounds.
+        The moves are only generated again when the position or the bounds change.
+
+        :param bottom_left_bound: Bottom left corner of the area.
+        :type bottom_left_bound: Point
+        :param top_right_bound: Top right corner of the area.
+        :type top_right_bound: Point
+        :return: The legal moves.
+        :rtype: list
+        """
+        cache_key = (self.board.get_position_key(), bottom_left_bound, top_right_bound)
+        if cache_key != self.legal_moves_key:
+            self.legal_moves = self.board.generate_legal_moves(bottom_left_bound, top_right_bound)
+            self.legal_moves_key = cache_key
+        return self.legal_moves
+
     def draw_board(self) -> None:
         """
         Draw the board on the display.
@@ -142,17 +173,18 @@ class Game:
         max_x_visible = max([self.board_to_pygame(tile).x for tile in visible_tiles])
         min_y_visible = min([self.board_to_pygame(tile).y for tile in visible_tiles])
         max_y_visible = max([self.board_to_pygame(tile).y for tile in visible_tiles])
-        possible_move_generator = self.board.get_possible_moves_generator(
-            selected_piece,
-            Point(min_x_visible, min_y_visible),
-            Point(max_x_visible, max_y_visible))
+        bottom_left = Point(min_x_visible, min_y_visible)
+        top_right = Point(max_x_visible, max_y_visible)
+        possible_moves = self.get_legal_moves(bottom_left, top_right)
+        visible_pieces = {piece.position: piece
+                          for piece in self.board.get_pieces_in(bottom_left, top_right)}
         for tile in visible_tiles:
             tile = self.board_to_pygame(tile)
             color = WHITE_TILE if (tile.y%2) == (tile.x%2) else BLACK_TILE
             if tile == self.selected_tile:
                 color = SELECTED_TILE
-            piece = self.board.get_piece_at(tile)
-            if piece.name == PieceName.KING:
+            piece = visible_pieces.get(tile)
+            if piece is not None and piece.name == PieceName.KING:
                 if self.board.is_in_check(piece.color):
                     color = CHECK_COLOR
             tile = self.board_to_pygame(tile)
@@ -162,31 +194,25 @@ class Game:
             y = np.ceil(y)
             scaled_tile = np.ceil(scaled_tile)
             pygame.draw.rect(self.display, color, (x, y, scaled_tile, scaled_tile))
-            tile = self.board_to_pygame(tile)
-
-            piece = self.board.get_piece_at(tile)
-            if piece.name != PieceName.NONE:
+            if piece is not None:
                 img = self.get_image(piece)
                 img = pygame.transform.smoothscale(img, (scaled_tile, scaled_tile))
                 self.display.blit(img, (x,y))
         if not self.board.is_in_checkmate(self.board.current_player):
             if not selected_piece.is_none() and selected_piece.color == self.board.current_player:
-                while True:
-                    try:
-                        move = next(possible_move_generator)
-                        target = move.target
-                        target = self.board_to_pygame(move.target)
-                        x = target.x * scaled_tile + self.offset.x
-                        y = target.y * scaled_tile + self.offset.y
-                        x = np.ceil(x)
-                        y = np.ceil(y)
-                        scaled_tile = np.ceil(scaled_tile)
-                        pygame.draw.circle(
-                            self.display, ACCENT_COLOR,
-                            (x + scaled_tile//2, y + scaled_tile//2),
-                            scaled_tile//4)
-                    except StopIteration:
-                        break
+                for move in possible_moves:
+                    if move.moved is not selected_piece:
+                        continue
+                    target = self.board_to_pygame(move.target)
+                    x = target.x * scaled_tile + self.offset.x
+                    y = target.y * scaled_tile + self.offset.y
+                    x = np.ceil(x)
+                    y = np.ceil(y)
+                    scaled_tile = np.ceil(scaled_tile)
+                    pygame.draw.circle(
+                        self.display, ACCENT_COLOR,
+                        (x + scaled_tile//2, y + scaled_tile//2),
+                        scaled_tile//4)
 
     def update(self) -> None:
         """
@@ -262,6 +288,16 @@ class Game:
             self.square_size *= 10
             self.scale = 1
 
+    def handle_keydown(self, event: pygame.event.Event) -> None:
+        """
+        Handle the key press event.
+
+        :param event: The event to handle.
+        :type event: pygame.event.Event
+        """
+        if event.key == pygame.K_c:
+            self.center_view()
+
     def handle_input(self) -> None:
         """
         Handle the input events.
@@ -274,6 +310,8 @@ class Game:
                 self.handle_mousemotion(event)
             if event.type == pygame.MOUSEWHEEL:
                 self.handle_mousewheel(event)
+            if event.type == pygame.KEYDOWN:
+                self.handle_keydown(event)
 
     def run(self) -> None:
         """
@@ -7,6 +7,10 @@ import logging
 import datetime
 import os
 import shutil
+from contextlib import contextmanager
+from typing import Iterator
+
+HANDLER_NAME = 'quasar-deferred'
 
 class DuplicateFilter(logging.Filter):
     """
@@ -28,6 +32,8 @@ def clear_logs() -> None:
     Clears the logs directory.
     """
     logs_path = 'logs'
+    if not os.path.isdir(logs_path):
+        return
     for filename in os.listdir(logs_path):
         file_path = os.path.join(logs_path, filename)
         try:
@@ -44,26 +50,80 @@ def silence() -> None:
     """
     logger.setLevel(logging.CRITICAL)
 
+@contextmanager
+def muted() -> Iterator[None]:
+    """
+    Silences the logger inside a with block and restores its level afterwards.
+    """
+    level = logger.level
+    logger.setLevel(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logger.setLevel(level)
+
 def unsilence() -> None:
     """
     Unsilences the logger.
     """
     logger.setLevel(logging.DEBUG)
 
-f_name = datetime.datetime.now().strftime('%Y-%m-%d_%H.%M.%S')
-logger = logging.getLogger('chess')
-logger.setLevel(logging.DEBUG)
-fh = logging.FileHandler(f'logs/{f_name}.log')
-fh.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-fh.setFormatter(formatter)
-logger.addHandler(fh)
+class DeferredHandler(logging.Handler):
+    """
+    A handler that creates the log file and console handlers
+    only when the first record has to be emitted,
+    so importing the package doesn't touch the file system.
 
-sh = logging.StreamHandler()
-sh.setLevel(logging.DEBUG)
-sh.setFormatter(formatter)
-logger.addHandler(sh)
+    :param logging.Handler: The logging handler class.
+    :type logging.Handler: class
+    """
+    def __init__(self, logs_path: str = 'logs') -> None:
+        """
+        The constructor for the DeferredHandler class.
 
-logger.addFilter(DuplicateFilter())
+        :param logs_path: Directory the log files are written to.
+        :type logs_path: str
+        """
+        super().__init__(logging.DEBUG)
+        self.set_name(HANDLER_NAME)
+        self.logs_path = logs_path
+        self.handlers = None
 
-logger.info('Logger initialized.')
+    def create_handlers(self) -> list:
+        """
+        Create the timestamped file handler and the console handler.
+
+        :return: The created handlers.
+        :rtype: list
+        """
+        os.makedirs(self.logs_path, exist_ok=True)
+        f_name = datetime.datetime.now().strftime('%Y-%m-%d_%H.%M.%S')
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        fh = logging.FileHandler(os.path.join(self.logs_path, f'{f_name}.log'))
+        fh.setLevel(logging.DEBUG)
+        fh.setFormatter(formatter)
+
+        sh = logging.StreamHandler()
+        sh.setLevel(logging.DEBUG)
+        sh.setFormatter(formatter)
+        return [fh, sh]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Pass the record to the real handlers, creating them on the first call.
+
+        :param record: The record to emit.
+        :type record: logging.LogRecord
+        """
+        if self.handlers is None:
+            self.handlers = self.create_handlers()
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+logger = logging.getLogger('chess')
+logger.setLevel(logging.DEBUG)
+if not any(handler.name == HANDLER_NAME for handler in logger.handlers):
+    logger.addHandler(DeferredHandler())
+    logger.addFilter(DuplicateFilter())
@@ -5,14 +5,15 @@ It contains the main function and the test function.
 
 import argparse
 from typing import Dict
-import pytest
 from logger import clear_logs, silence, unsilence
-from gui import Game
+from quasar.chess import Board, divide
+from quasar.chess.utils import STARTING_FEN
 
 def main() -> None:
     """
     Main entry point function to run the application.
     """
+    from gui import Game
     game = Game()
     game.run()
 
@@ -23,6 +24,7 @@ def test(flags: Dict) -> None:
     :param flags: A dictionary containing the flags for the test.
     :type flags: dict
     """
+    import pytest
     silence()
     local_flags = flags.copy()
     if not any(local_flags.values()):
@@ -46,11 +48,39 @@ def test(flags: Dict) -> None:
     pytest.main(["tests/", "-v"])
     unsilence()
 
+def perft(fen: str, depth: int, processes: int, show_divide: bool) -> None:
+    """
+    Run perft and print the node count and speed.
+
+    :param fen: FEN of the position to start from.
+    :type fen: str
+    :param depth: Depth of the move tree.
+    :type depth: int
+    :param processes: Number of worker processes, 0 uses every core.
+    :type processes: int
+    :param show_divide: If the node count of every root move should be printed.
+    :type show_divide: bool
+    """
+    silence()
+    board = Board()
+    board.load_fen(fen)
+    result = divide(board, depth, processes=processes or None)
+    if show_divide:
+        for move, nodes in result.divide.items():
+            print(f"{move}: {nodes}")
+        print()
+    print(f"Depth: {result.depth}")
+    print(f"Nodes: {result.nodes}")
+    print(f"Time: {result.time:.3f}s")
+    print(f"Nodes per second: {result.nps}")
+    unsilence()
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
 
     parser.add_argument("operation",
-help="""Indicates the operation to be performed. Options: run, test, clear_logs""")
+help="""Indicates the operation to be performed.
+Options: run, test, clear_logs, perft, divide""")
 
     parser.add_argument("-qt", "--quick-test",
                         help="Runs quick test when testing",
@@ -64,6 +94,20 @@ help="""Indicates the operation to be performed. Options: run, test, clear_logs"
                         help="Runs full test when testing",
                         action="store_true")
 
+    parser.add_argument("-d", "--depth",
+                        help="Depth of perft and divide",
+                        type=int,
+                        default=3)
+
+    parser.add_argument("--fen",
+                        help="Position used by perft and divide",
+                        default=STARTING_FEN)
+
+    parser.add_argument("-p", "--processes",
+                        help="Worker processes used by perft and divide, 0 uses every core",
+                        type=int,
+                        default=1)
+
     args = parser.parse_args()
     cmd_flags = {"qt":args.quick_test,
             "st": args.standard_test,
@@ -74,5 +118,9 @@ help="""Indicates the operation to be performed. Options: run, test, clear_logs"
         test(cmd_flags)
     elif args.operation == "clear_logs":
         clear_logs()
+    elif args.operation == "perft":
+        perft(args.fen, args.depth, args.processes, False)
+    elif args.operation == "divide":
+        perft(args.fen, args.depth, args.processes, True)
     else:
         print("Invalid command. Use -h for help.")
@@ -0,0 +1,77 @@
+"""
+Shared fixtures of the tests.
+
+The random position factory is a plain function as well,
+so benchmarks/suite.py builds the same boards.
+"""
+
+import random
+from typing import Callable, Sequence
+import pytest
+import quasar.chess.board as board_module
+from quasar.chess.board import Board
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.point import Point
+
+# mostly leapers, with a few sliders to block them
+RANDOM_PIECES = (PieceName.PAWN, PieceName.PAWN, PieceName.KNIGHT, PieceName.KNIGHT,
+                 PieceName.ROOK, PieceName.BISHOP)
+
+def random_board(count: int,
+                 span: int,
+                 seed: int = 0,
+                 names: Sequence[PieceName] = RANDOM_PIECES,
+                 kings: bool = True) -> Board:
+    """
+    Create a board with random pieces around the origin.
+    With kings, the white king stands on the origin with no piece next to it,
+    and the black king just outside the random pieces.
+
+    :param count: Number of pieces, the kings included.
+    :type count: int
+    :param span: Largest coordinate of the random pieces.
+    :type span: int
+    :param seed: Seed of the random generator.
+    :type seed: int
+    :param names: Kinds of the random pieces, picked uniformly.
+    :type names: Sequence[PieceName]
+    :param kings: If the two kings should be placed.
+    :type kings: bool
+    :return: The board.
+    :rtype: Board
+    """
+    generator = random.Random(seed)
+    board = Board()
+    if kings:
+        board.create_piece(PieceName.KING, Point(0, 0), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(span + 5, span + 5), PieceColor.BLACK)
+    while len(board.pieces) < count:
+        square = Point(generator.randint(-span, span), generator.randint(-span, span))
+        if square not in board.piece_map and (not kings or abs(square.x) + abs(square.y) > 3):
+            board.create_piece(generator.choice(names), square,
+                               generator.choice((PieceColor.WHITE, PieceColor.BLACK)))
+    return board
+
+@pytest.fixture(name="random_board")
+def random_board_fixture() -> Callable[..., Board]:
+    """
+    The random position factory, see random_board.
+    """
+    return random_board
+
+@pytest.fixture
+def legal_moves(monkeypatch) -> Callable[..., set]:
+    """
+    Generate the legal moves of a board with the module flags of quasar.chess.board
+    patched, for example legal_moves(board, bitboard_window=False, leaper_batch_size=0).
+    The bounds default to an area holding the boards of random_board with a span of 20.
+    """
+    def generate(board: Board,
+                 bottom_left: Point = Point(-25, -25),
+                 top_right: Point = Point(35, 35),
+                 **flags) -> set:
+        for name, value in flags.items():
+            monkeypatch.setattr(board_module, name.upper(), value)
+        return {(move.source, move.target)
+                for move in board.generate_legal_moves(bottom_left, top_right)}
+    return generate
@@ -0,0 +1,112 @@
+"""
+Test the bitboard window and the move generation from it.
+"""
+
+from quasar.chess.bitboards import BitboardWindow, WINDOW_SIZE, BOUNDS_CACHE_SIZE, \
+    get_clipped_mask, shift, iterate_bits
+from quasar.chess.board import Board
+from quasar.chess.moves import Move, RejectReason
+from quasar.chess.perft import perft
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+
+class TestBitboards:
+    """
+    Test the bitboard window and the move generation from it.
+    """
+    def test_shift_drops_edges(self):
+        """
+        Test that shifted squares don't wrap around the edges of the window.
+        """
+        corner = 1 << (WINDOW_SIZE - 1)
+        assert shift(corner, Point(1, 0)) == 0
+        assert shift(corner, Point(-2, 1)) == 1 << (2 * WINDOW_SIZE - 3)
+        assert list(iterate_bits(0b10110)) == [1, 2, 4]
+
+    def test_matches_sparse_generation(self, random_board, legal_moves):
+        """
+        Test that the bitboards find the same legal moves as the sparse representation.
+        """
+        boards = [random_board(100, 20, seed, tuple(PieceName)[1:6]) for seed in range(3)]
+        for fen in (STARTING_FEN, POSITION_5_FEN):
+            board = Board()
+            board.load_fen(fen)
+            boards.append(board)
+        for board in boards:
+            assert legal_moves(board, bitboard_window=True) == \
+                legal_moves(board, bitboard_window=False)
+            assert board.window is not None
+
+    def test_window_follows_moves(self):
+        """
+        Test that make and undo keep the window in sync and that it is dropped
+        once a piece leaves it, then fitted again.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        assert perft(board, 3) == 8902
+        window = board.get_window()
+        assert window.occupied == BitboardWindow.fit(board.pieces).occupied
+        rook = board.get_piece_at(Point(1, 1))
+        board.remove_piece(board.get_piece_at(Point(1, 2)))
+        board.unindex_piece(rook)
+        rook.set_position(Point(1, 60))
+        board.index_piece(rook)
+        assert board.window is None
+        assert board.get_window() is not None
+
+    def test_window_too_large(self, monkeypatch):
+        """
+        Test that no window is fitted around pieces too far apart.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(0, 0), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(WINDOW_SIZE, 0), PieceColor.BLACK)
+        assert board.get_window() is None
+        # the bounding box is enough to tell, the pieces aren't visited again
+        monkeypatch.setattr(BitboardWindow, "fit", None)
+        assert board.get_window() is None
+        monkeypatch.undo()
+        assert len(board.generate_legal_moves(Point(-5, -5), Point(70, 5))) == 8
+
+    def test_double_push_blocked(self, legal_moves):
+        """
+        Test that a pawn can't push two squares over a piece.
+        """
+        board = Board()
+        board.load_xfen("K1,1/P3,2/N3,3/k8,8 w - 0 1")
+        for bitboards in (True, False):
+            moves = legal_moves(board, bitboard_window=bitboards)
+            assert (Point(3, 2), Point(3, 4)) not in moves
+            assert (Point(1, 1), Point(1, 2)) in moves
+        move, is_legal = board.validator(Move(PieceColor.WHITE, Point(3, 2), Point(3, 4)), board)
+        assert not is_legal
+        assert move.reject_reason == RejectReason.PATH_BLOCKED
+
+    def test_bounds_masks(self):
+        """
+        Test that the bounds masks only depend on the part of the bounds inside the window
+        and that their cache is bounded.
+        """
+        window = BitboardWindow(Point(0, 0))
+        full = window.get_bounds_mask(Point(-100, -100), Point(100, 100))
+        assert full == window.get_bounds_mask(Point(-1, -5), Point(WINDOW_SIZE, 10**6))
+        assert window.get_bounds_mask(Point(-9, 0), Point(-3, 5)) == 0
+        assert window.get_bounds_mask(Point(1, 1), Point(1, 1)) == 1 << (WINDOW_SIZE + 1)
+        for x in range(BOUNDS_CACHE_SIZE * 2):
+            window.get_bounds_mask(Point(x - 100, 0), Point(x, 10))
+        assert get_clipped_mask.cache_info().currsize <= BOUNDS_CACHE_SIZE
+
+    def test_castling_within_bounds(self, legal_moves):
+        """
+        Test that castling is only generated onto squares inside the bounds,
+        with the bitboards, the NumPy batch and the piece by piece generation.
+        """
+        board = Board()
+        board.load_fen("4k3/8/8/8/8/8/8/4K2R w K - 0 1")
+        castling = (Point(5, 1), Point(7, 1))
+        for bitboards, batch_size in ((True, 0), (False, 0), (False, 10**9)):
+            flags = {"bitboard_window": bitboards, "leaper_batch_size": batch_size}
+            assert castling in legal_moves(board, Point(1, 1), Point(7, 8), **flags)
+            assert castling not in legal_moves(board, Point(1, 1), Point(6, 8), **flags)
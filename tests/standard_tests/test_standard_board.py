@@ -2,9 +2,12 @@
 Test the Board class.
 """
 
+import pickle
 from quasar.chess.board import Board
 from quasar.chess.point import Point
 from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.moves import Move, RejectReason
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
 
 class TestBoard:
     """
@@ -63,7 +66,7 @@ class TestBoard:
         piece2 = board.create_piece(PieceName.ROOK, Point(1, 1), PieceColor.WHITE)
         board.add_piece(piece1)
         board.add_piece(piece2)
-        assert board.get_concentration_position() == Point(0.5, 0.5)
+        assert board.get_concentration_position() == (0.5, 0.5)
 
     def test_get_white_pieces(self):
         """
@@ -82,3 +85,288 @@ class TestBoard:
         board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
         board.create_piece(PieceName.ROOK, Point(1, 1), PieceColor.BLACK)
         assert len(board.get_black_pieces()) == 1
+
+    def test_get_piece_at(self):
+        """
+        Test the lookup of a piece by its position.
+        """
+        board = Board()
+        piece = board.create_piece(PieceName.ROOK, Point(3, 4), PieceColor.WHITE)
+        assert board.get_piece_at(Point(3, 4)) is piece
+        assert board.get_piece_at(Point(4, 3)).is_none()
+        board.remove_piece(piece)
+        assert board.get_piece_at(Point(3, 4)).is_none()
+
+    def test_piece_index_follows_moves(self):
+        """
+        Test that the square index is kept up to date by make_move and undo_move.
+        """
+        board = Board()
+        board.load_fen('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
+        pawn = board.get_piece_at(Point(5, 2))
+        board.make_move(Move(PieceColor.WHITE, Point(5, 2), Point(5, 4)))
+        assert board.get_piece_at(Point(5, 2)).is_none()
+        assert board.get_piece_at(Point(5, 4)) is pawn
+        board.undo_move()
+        assert board.get_piece_at(Point(5, 2)) is pawn
+        assert board.get_piece_at(Point(5, 4)).is_none()
+
+    def test_position_key_transposition(self):
+        """
+        Test that move orders reaching the same position share a key.
+        """
+        first = Board()
+        first.load_fen(STARTING_FEN)
+        second = Board()
+        second.load_fen(STARTING_FEN)
+        start_key = first.get_position_key()
+        for board, order in ((first, [(7, 1, 6, 3), (2, 8, 3, 6), (2, 1, 3, 3)]),
+                             (second, [(2, 1, 3, 3), (2, 8, 3, 6), (7, 1, 6, 3)])):
+            for sx, sy, tx, ty in order:
+                board.make_move(Move(board.current_player, Point(sx, sy), Point(tx, ty)))
+        assert first.get_position_key() == second.get_position_key()
+        assert first.get_position_key() != start_key
+        first.check_position_key()
+
+    def test_position_key_verification(self):
+        """
+        Test the incremental position key against a full recompute during a perft.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        board.verify_key = True
+
+        def perft(depth: int) -> int:
+            if depth == 0:
+                return 1
+            count = 0
+            for piece in board.get_pieces().copy():
+                if piece.color == board.current_player:
+                    generator = board.get_possible_moves_generator(piece, Point(1,1), Point(8,8))
+                    for move in list(generator):
+                        board.make_move(move)
+                        count += perft(depth - 1)
+                        board.undo_move()
+            return count
+
+        assert perft(1) > 0
+        assert board.get_position_key() == board.compute_position_key()
+
+    def test_generate_legal_moves(self):
+        """
+        Test that bulk move generation matches the per piece generators.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        expected = []
+        for piece in board.get_pieces().copy():
+            if piece.color == board.current_player:
+                generator = board.get_possible_moves_generator(piece, Point(1,1), Point(8,8))
+                expected.extend((move.source, move.target) for move in generator)
+        moves = board.generate_legal_moves(Point(1,1), Point(8,8))
+        def key(pair):
+            return tuple(pair[0]), tuple(pair[1])
+        assert sorted(((move.source, move.target) for move in moves), key=key) == \
+            sorted(expected, key=key)
+
+    def test_pinned_piece(self):
+        """
+        Test that a pinned piece can only move along the pin.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(1, 1), PieceColor.WHITE).moved = True
+        rook = board.create_piece(PieceName.ROOK, Point(1, 3), PieceColor.WHITE)
+        board.create_piece(PieceName.ROOK, Point(1, 8), PieceColor.BLACK)
+        board.create_piece(PieceName.KING, Point(8, 8), PieceColor.BLACK)
+        moves = board.generate_legal_moves(Point(1, 1), Point(8, 8))
+        targets = {move.target for move in moves if move.moved is rook}
+        assert targets == {Point(1, y) for y in range(2, 9) if y != 3}
+
+    def test_check_evasions(self):
+        """
+        Test that only moves resolving a check are legal.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(1, 1), PieceColor.WHITE).moved = True
+        board.create_piece(PieceName.BISHOP, Point(3, 4), PieceColor.WHITE)
+        board.create_piece(PieceName.ROOK, Point(1, 8), PieceColor.BLACK)
+        board.create_piece(PieceName.KING, Point(8, 8), PieceColor.BLACK)
+        moves = board.generate_legal_moves(Point(1, 1), Point(8, 8))
+        bishop_targets = {move.target for move in moves if move.moved.is_bishop()}
+        king_targets = {move.target for move in moves if move.moved.is_king()}
+        assert bishop_targets == {Point(1, 2), Point(1, 6)}
+        assert king_targets == {Point(2, 1), Point(2, 2)}
+
+    def test_slider_moves_stop_at_blocker(self):
+        """
+        Test that a slider yields every square up to a blocker once, plus the capture.
+        """
+        board = Board()
+        rook = board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
+        board.create_piece(PieceName.PAWN, Point(0, 40), PieceColor.BLACK)
+        board.create_piece(PieceName.PAWN, Point(-3, 0), PieceColor.WHITE)
+        targets = [move.target for move in
+                   board.get_candidate_moves_generator(rook, Point(-5, -2), Point(100, 100))]
+        assert len(targets) == len(set(targets))
+        assert set(targets) == {Point(0, y) for y in range(1, 41)} | \
+            {Point(x, 0) for x in (-2, -1)} | \
+            {Point(x, 0) for x in range(1, 101)} | \
+            {Point(0, -1), Point(0, -2)}
+
+    def test_no_duplicate_moves(self):
+        """
+        Test that every move of position 5 is generated once. Before the line index
+        the distance-1 slider moves came twice. The position has 41 distinct moves,
+        the reference 44 less the underpromotions of d7xc8.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        moves = [(tuple(move.source), tuple(move.target))
+                 for piece in board.get_pieces().copy() if piece.color == board.current_player
+                 for move in board.get_possible_moves_generator(piece, Point(1, 1), Point(8, 8))]
+        assert len(moves) == len(set(moves))
+
+    def test_line_index_follows_moves(self):
+        """
+        Test that the line index is kept current by making and undoing moves.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        move = Move(PieceColor.WHITE, Point(5, 2), Point(5, 4))
+        board.make_move(move)
+        assert board.lines.nearest(Point(5, 1), Point(0, 1)) == Point(5, 4)
+        assert board.lines.nearest(Point(6, 1), Point(-1, 1)) is None
+        board.undo_move()
+        assert board.lines.nearest(Point(5, 1), Point(0, 1)) == Point(5, 2)
+        assert board.lines.nearest(Point(6, 1), Point(-1, 1)) == Point(5, 2)
+
+    def test_reject_reason(self):
+        """
+        Test that rejected moves carry the reason of the rejection.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        move, is_legal = board.validator(Move(PieceColor.WHITE, Point(1, 1), Point(1, 3)), board)
+        assert not is_legal
+        assert move.reject_reason == RejectReason.PATH_BLOCKED
+        move, is_legal = board.validator(Move(PieceColor.WHITE, Point(2, 1), Point(3, 3)), board)
+        assert is_legal
+        assert move.reject_reason == RejectReason.NONE
+
+    def test_undo_restores_exact_state(self):
+        """
+        Test that undoing captures and castling restores the board exactly.
+        """
+        board = Board()
+        for x, name in ((1, PieceName.ROOK), (5, PieceName.KING), (8, PieceName.ROOK)):
+            board.create_piece(name, Point(x, 1), PieceColor.WHITE)
+            board.create_piece(name, Point(x, 8), PieceColor.BLACK)
+        board.verify_key = True
+
+        def snapshot():
+            return [(piece.unique_id, piece.position, piece.moved, piece.offsets)
+                    for piece in board.get_pieces()]
+
+        before = snapshot()
+        key = board.get_position_key()
+        for source, target in (((5, 1), (7, 1)), ((1, 8), (1, 1)), ((7, 1), (7, 2))):
+            board.make_move(Move(board.current_player, Point(*source), Point(*target)))
+        assert board.get_piece_at(Point(6, 1)).is_rook()
+        assert len(board.captured_pieces) == 1
+        for _ in range(3):
+            board.undo_move()
+        assert snapshot() == before
+        assert board.get_position_key() == key
+        assert not board.captured_pieces and not board.undo_records
+
+    def test_copy(self):
+        """
+        Test that a copied board is independent of the original.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        clone = board.copy()
+        assert clone.get_position_key() == board.get_position_key()
+        move = clone.generate_legal_moves(Point(1, 1), Point(8, 8))[0]
+        clone.make_move(move, False)
+        assert clone.get_position_key() != board.get_position_key()
+        assert board.get_piece_at(move.source).position == move.source
+        clone.undo_move()
+        assert clone.get_position_key() == board.get_position_key()
+        clone.check_position_key()
+        with board.counting() as counters:
+            clone = board.copy()
+            assert clone.counters is None
+            assert clone.validator is not board.validator
+            clone.make_move(clone.generate_legal_moves(Point(1, 1), Point(8, 8))[0], False)
+        assert counters.make_move == 0
+
+    def test_pickle(self):
+        """
+        Test that a board survives pickling as a compact byte string.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(-10**9, 3), PieceColor.WHITE)
+        pawn = board.create_piece(PieceName.PAWN, Point(4, -7), PieceColor.BLACK)
+        board.remove_piece(pawn)
+        pawn.set_position(Point(4, -8))
+        board.add_piece(pawn)
+        board.create_piece(PieceName.QUEEN, Point(10**12, 0), PieceColor.BLACK)
+        board.change_player()
+        data = pickle.dumps(board)
+        assert len(data) < 200
+        clone = pickle.loads(data)
+        assert clone.current_player == PieceColor.BLACK
+        assert [(piece.name, piece.color, piece.position, piece.moved, piece.offsets)
+                for piece in clone.get_pieces()] == \
+            [(piece.name, piece.color, piece.position, piece.moved, piece.offsets)
+             for piece in board.get_pieces()]
+        assert clone.get_position_key() == board.get_position_key()
+        clone.check_position_key()
+
+    def test_pickle_keeps_state(self):
+        """
+        Test that pickling keeps the en passant square and the move clocks.
+        """
+        board = Board()
+        board.load_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w Kq d6 0 3")
+        board.halfmove_clock = 7
+        clone = pickle.loads(pickle.dumps(board))
+        assert clone.en_passant == Point(4, 6)
+        assert (clone.halfmove_clock, clone.fullmove_number) == (7, 3)
+        assert clone.get_fen() == board.get_fen()
+        board.en_passant = None
+        assert Board.from_bytes(board.to_bytes()).en_passant is None
+
+    def test_is_square_attacked(self):
+        """
+        Test the attack query for every kind of attacker, through blockers and the ignored piece.
+        """
+        board = Board()
+        king = board.create_piece(PieceName.KING, Point(0, 0), PieceColor.WHITE)
+        board.create_piece(PieceName.ROOK, Point(0, 10**6), PieceColor.BLACK)
+        board.create_piece(PieceName.KNIGHT, Point(7, 2), PieceColor.BLACK)
+        board.create_piece(PieceName.PAWN, Point(-5, 6), PieceColor.BLACK)
+        board.create_piece(PieceName.BISHOP, Point(-20, -20), PieceColor.BLACK)
+        board.create_piece(PieceName.KNIGHT, Point(-10, -10), PieceColor.WHITE)
+        assert board.is_square_attacked(Point(0, 1), PieceColor.BLACK)
+        assert board.is_square_attacked(Point(5, 1), PieceColor.BLACK)
+        assert board.is_square_attacked(Point(-4, 5), PieceColor.BLACK)
+        assert not board.is_square_attacked(Point(-5, 5), PieceColor.BLACK)
+        assert not board.is_square_attacked(Point(-1, -1), PieceColor.BLACK)
+        assert not board.is_square_attacked(Point(0, -1), PieceColor.BLACK)
+        assert board.is_square_attacked(Point(0, -1), PieceColor.BLACK, ignore=king)
+        assert board.is_in_check(PieceColor.WHITE)
+        assert not board.is_in_check(PieceColor.BLACK)
+
+    def test_pinned_piece_gives_check(self):
+        """
+        Test that a piece pinned to its own king still gives check.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(4, 4), PieceColor.WHITE)
+        board.create_piece(PieceName.ROOK, Point(5, 2), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(5, 8), PieceColor.BLACK)
+        board.create_piece(PieceName.KNIGHT, Point(5, 6), PieceColor.BLACK)
+        assert board.is_in_check(PieceColor.WHITE)
+        assert not board.is_in_check(PieceColor.BLACK)
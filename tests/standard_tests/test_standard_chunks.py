@@ -0,0 +1,135 @@
+"""
+Test the ChunkIndex class and the range queries of the board.
+"""
+
+import random
+from quasar.chess.board import Board
+from quasar.chess.chunks import ChunkIndex, CHUNK_SIZE
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.point import Point
+
+def scan(board: Board, bottom_left: Point, top_right: Point) -> set:
+    """
+    Find the pieces inside a rectangle by looking at every piece.
+
+    :param board: Board to search.
+    :type board: Board
+    :param bottom_left: Bottom left corner of the rectangle.
+    :type bottom_left: Point
+    :param top_right: Top right corner of the rectangle.
+    :type top_right: Point
+    :return: The pieces inside the rectangle.
+    :rtype: set
+    """
+    return {piece for piece in board.pieces
+            if bottom_left.x <= piece.position.x <= top_right.x and
+            bottom_left.y <= piece.position.y <= top_right.y}
+
+class TestChunks:
+    """
+    Test the ChunkIndex class and the range queries of the board.
+    """
+    def test_query_matches_scan(self, random_board):
+        """
+        Test that range queries find the same pieces as a scan of the board.
+        """
+        board = random_board(400, 100, 0, tuple(PieceName)[1:], False)
+        generator = random.Random(1)
+        for _ in range(200):
+            x, y = generator.randint(-120, 100), generator.randint(-120, 100)
+            width, height = generator.randint(0, 60), generator.randint(0, 60)
+            bottom_left, top_right = Point(x, y), Point(x + width, y + height)
+            found = board.get_pieces_in(bottom_left, top_right)
+            assert len(found) == len(set(found))
+            assert set(found) == scan(board, bottom_left, top_right)
+        assert set(board.get_pieces_in(Point(-1000, -1000), Point(1000, 1000))) == \
+            set(board.pieces)
+        assert not board.get_pieces_in(Point(5, 5), Point(4, 5))
+
+    def test_neighbours(self):
+        """
+        Test the neighbourhood of a square across chunk borders.
+        """
+        board = Board()
+        center = board.create_piece(PieceName.KING, Point(-1, -1), PieceColor.WHITE)
+        near = board.create_piece(PieceName.KNIGHT, Point(1, 0), PieceColor.BLACK)
+        board.create_piece(PieceName.PAWN, Point(2, 2), PieceColor.BLACK)
+        assert set(board.get_pieces_near(Point(-1, -1), 2)) == {center, near}
+
+    def test_follows_moves(self):
+        """
+        Test that make, undo and copy keep the chunks in sync and drop empty ones.
+        """
+        board = Board()
+        rook = board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
+        target = board.create_piece(PieceName.KNIGHT, Point(0, 40), PieceColor.BLACK)
+        moves = board.generate_legal_moves(Point(-50, -50), Point(50, 50))
+        capture = next(move for move in moves if move.target == target.position)
+        board.make_move(capture, False)
+        assert len(board.chunks) == 1
+        assert board.get_pieces_in(Point(0, 32), Point(15, 47)) == [rook]
+        copy = board.copy()
+        board.undo_move()
+        assert set(board.get_pieces_in(Point(0, 0), Point(0, 40))) == {rook, target}
+        assert [piece.position for piece in copy.get_pieces_in(Point(0, 0), Point(0, 40))] == \
+            [Point(0, 40)]
+
+    def test_chunk_masks(self):
+        """
+        Test the occupancy masks of a chunk.
+        """
+        index = ChunkIndex()
+        board = Board()
+        white = board.create_piece(PieceName.PAWN, Point(CHUNK_SIZE + 1, 2), PieceColor.WHITE)
+        black = board.create_piece(PieceName.PAWN, Point(CHUNK_SIZE + 3, 2), PieceColor.BLACK)
+        index.add(white)
+        index.add(black)
+        chunk = index.chunks[(1, 0)]
+        assert chunk.mask == chunk.white | chunk.black
+        assert chunk.get_color_mask(PieceColor.WHITE) == 1 << (2 * CHUNK_SIZE + 1)
+        knight = Board().create_piece(PieceName.KNIGHT, white.position, PieceColor.BLACK)
+        index.add(knight)
+        assert chunk.white == 0
+        assert chunk.black == chunk.mask
+        index.remove(knight)
+        index.remove(black)
+        assert not index.chunks
+        assert not index.regions
+
+    def test_regions(self):
+        """
+        Test that regions track their occupied chunks, so huge rectangles stay cheap.
+        """
+        board = Board()
+        near = board.create_piece(PieceName.KING, Point(0, 0), PieceColor.WHITE)
+        far = board.create_piece(PieceName.KING, Point(10**6, -10**6), PieceColor.BLACK)
+        assert len(board.chunks.regions) == 2
+        assert set(board.get_pieces_in(Point(-10**7, -10**7), Point(10**7, 10**7))) == \
+            {near, far}
+        assert board.get_pieces_in(Point(1, -10**7), Point(10**7, 10**7)) == [far]
+        board.remove_piece(far)
+        assert list(board.chunks.regions) == [(0, 0)]
+
+    def test_bounded_rays(self):
+        """
+        Test that sliders outside the bounds only get moves inside them.
+        """
+        board = Board()
+        board.create_piece(PieceName.ROOK, Point(-100, 4), PieceColor.WHITE)
+        board.create_piece(PieceName.BISHOP, Point(20, 20), PieceColor.WHITE)
+        board.create_piece(PieceName.PAWN, Point(8, 4), PieceColor.BLACK)
+        moves = board.generate_legal_moves(Point(1, 1), Point(8, 8))
+        assert {move.target for move in moves} == \
+            {Point(x, 4) for x in range(1, 9)} | {Point(i, i) for i in range(1, 9)}
+
+    def test_extent(self, random_board):
+        """
+        Test that the extent of a color is found from the chunk masks.
+        """
+        for seed in range(3):
+            board = random_board(300, 100, seed, tuple(PieceName)[1:], False)
+            for color in (PieceColor.WHITE, PieceColor.BLACK):
+                xs = [piece.position.x for piece in board.pieces if piece.color == color]
+                ys = [piece.position.y for piece in board.pieces if piece.color == color]
+                assert board.chunks.get_extent(color) == [min(xs), min(ys), max(xs), max(ys)]
+        assert ChunkIndex().get_extent(PieceColor.WHITE) is None
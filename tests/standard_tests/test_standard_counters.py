@@ -0,0 +1,59 @@
+"""
+Test the Counters class and the counting on the board.
+"""
+
+from quasar.chess.board import Board
+from quasar.chess.counters import Counters
+from quasar.chess.moves import Move
+from quasar.chess.perft import perft
+from quasar.chess.pieces import PieceColor, PieceName
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN
+
+class TestCounters:
+    """
+    Test the Counters class and the counting on the board.
+    """
+    def test_counting(self):
+        """
+        Test that the board only counts inside the with block.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        with board.counting() as counters:
+            assert perft(board, 2) == 400
+        assert board.counters is None
+        snapshot = counters.snapshot()
+        assert snapshot["make_move"] == snapshot["undo_move"] == 20
+        assert snapshot["moves_generated"]["pawn"] == 16 + 20 * 16
+        assert snapshot["validator_calls"] > snapshot["get_piece_at"] // 4
+        assert sum(snapshot["rejections"].values()) > 0
+        perft(board, 1)
+        assert counters.snapshot() == snapshot
+
+    def test_rejections_and_reset(self):
+        """
+        Test that rejections are counted by reason and that reset clears every counter.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        counters = Counters()
+        with board.counting(counters):
+            board.validator(Move(PieceColor.WHITE, Point(1, 1), Point(1, 2)), board)
+            assert counters.snapshot()["rejections"] == {"own_capture": 1}
+            board.is_in_check(PieceColor.WHITE)
+        assert counters.check_tests == 1
+        counters.reset()
+        assert counters.snapshot()["validator_calls"] == 0
+        assert not counters.rejections
+
+    def test_misfire_iterations(self):
+        """
+        Test that the sliding loop of the offset generator is counted.
+        """
+        board = Board()
+        rook = board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
+        counters = Counters()
+        offsets = list(rook.get_offset_generator(Point(-3, -3), Point(3, 3), counters))
+        assert len(offsets) == 4 + 4 * 3
+        assert counters.misfire_iterations > 0
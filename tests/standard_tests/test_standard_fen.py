@@ -0,0 +1,141 @@
+"""
+Test the FEN and extended FEN parsers and formatters.
+"""
+
+import io
+import pytest
+from quasar.chess.board import Board
+from quasar.chess.point import Point
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.moves import Move
+from quasar.chess.errors import InvalidPositionError
+from quasar.chess.fen import parse_fen, iter_xfen, stream_positions
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN, standard_notation_to_point, \
+    point_to_standard_notation
+
+class TestFen:
+    """
+    Test the FEN and extended FEN parsers and formatters.
+    """
+    def test_fen_round_trip(self):
+        """
+        Test that loading and exporting FEN gives back the same string.
+        """
+        for fen in (STARTING_FEN, POSITION_5_FEN,
+                    "r3k2r/8/8/3pP3/8/8/8/R3K2R w Kq d6 0 3"):
+            board = Board()
+            board.load_fen(fen)
+            assert board.get_fen() == fen
+            assert board.position_key == board.compute_position_key()
+
+    def test_fen_state(self):
+        """
+        Test that empty squares, side to move, castling rights and en passant are kept.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        assert board.get_piece_at(Point(4, 7)).name == PieceName.PAWN
+        assert board.get_piece_at(Point(6, 2)).color == PieceColor.BLACK
+        assert board.current_player == PieceColor.WHITE
+        assert not board.get_piece_at(Point(8, 1)).moved
+        assert board.get_piece_at(Point(8, 8)).moved
+        assert board.get_piece_at(Point(4, 7)).moved
+        assert (board.halfmove_clock, board.fullmove_number) == (1, 8)
+        board.load_fen("8/8/8/8/4P3/8/8/4K2k b - e3 0 1")
+        assert len(board.pieces) == 3
+        assert board.current_player == PieceColor.BLACK
+        assert board.en_passant == Point(5, 3)
+
+    def test_invalid_fen(self):
+        """
+        Test that malformed FEN strings are rejected.
+        """
+        for fen in ("8/8/8 w - - 0 1",
+                    "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                    "4k3/8/8/8/8/8/8/4K3 w K - 0 1",
+                    "4k3/8/8/8/8/8/8/4K3 x - - 0 1"):
+            with pytest.raises(InvalidPositionError):
+                parse_fen(fen)
+
+    def test_xfen_round_trip(self):
+        """
+        Test that pieces far from the 8x8 area and their moved flags survive extended FEN.
+        """
+        xfen = "K5,1/R8,1/P-3,2*/q-4096,100000*/k5,8 b 4,3 7 12"
+        board = Board()
+        board.load_xfen(xfen)
+        assert board.get_xfen() == xfen
+        assert board.get_piece_at(Point(-4096, 100000)).name == PieceName.QUEEN
+        assert board.get_piece_at(Point(-3, 2)).moved
+        assert board.en_passant == Point(4, 3)
+        assert board.position_key == board.compute_position_key()
+        with pytest.raises(InvalidPositionError):
+            board.get_fen()
+
+    def test_xfen_matches_fen(self):
+        """
+        Test that the extended FEN of a standard position loads the same position.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        other = Board()
+        other.load_xfen(board.get_xfen())
+        assert other.get_fen() == POSITION_5_FEN
+        assert other.position_key == board.position_key
+
+    def test_invalid_xfen(self):
+        """
+        Test that malformed extended FEN strings and overlapping pieces are rejected.
+        """
+        board = Board()
+        for xfen in ("K5,1 w - 0", "X5,1 w - 0 1", "K5 w - 0 1", "K5,1 w 4 0 1",
+                     "K5,1/k5,1 w - 0 1"):
+            with pytest.raises(InvalidPositionError):
+                board.load_xfen(xfen)
+
+    def test_stream_positions(self):
+        """
+        Test streaming positions from a file into a reused board.
+        """
+        lines = io.StringIO("# comment\nK0,0/k10,-10 w - 0 1\n\n- b - 3 40\nK1,1 w - 0 1\n")
+        assert len(list(iter_xfen(lines))) == 3
+        lines.seek(0)
+        board = Board()
+        counts = [(len(position.pieces), position.current_player)
+                  for position in stream_positions(lines, board)]
+        assert counts == [(2, PieceColor.WHITE), (0, PieceColor.BLACK), (1, PieceColor.WHITE)]
+
+    def test_move_counters(self):
+        """
+        Test that moves update the en passant square and the clocks, and undo restores them.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        knight = board.get_piece_at(Point(7, 1))
+        move = Move(PieceColor.WHITE, Point(7, 1), Point(6, 3))
+        move.moved = knight
+        board.make_move(move)
+        assert (board.halfmove_clock, board.fullmove_number) == (1, 1)
+        pawn = board.get_piece_at(Point(5, 7))
+        move = Move(PieceColor.BLACK, Point(5, 7), Point(5, 5))
+        move.moved = pawn
+        board.make_move(move)
+        assert board.en_passant == Point(5, 6)
+        assert (board.halfmove_clock, board.fullmove_number) == (0, 2)
+        board.undo_move()
+        board.undo_move()
+        assert board.get_fen() == STARTING_FEN
+
+    def test_standard_notation(self):
+        """
+        Test the conversion of squares past the h file and the 8th rank.
+        """
+        assert standard_notation_to_point("e2") == Point(5, 2)
+        assert standard_notation_to_point("aa10") == Point(27, 10)
+        assert point_to_standard_notation(Point(27, 10)) == "aa10"
+        assert point_to_standard_notation(Point(26, 1)) == "z1"
+        for square in ("e0", "2e", "E2", "e", ""):
+            with pytest.raises(ValueError):
+                standard_notation_to_point(square)
+        with pytest.raises(ValueError):
+            point_to_standard_notation(Point(0, 5))
@@ -0,0 +1,43 @@
+"""
+Test that the headless packages import without the GUI dependencies.
+"""
+
+import os
+import subprocess
+import sys
+
+class TestImports:
+    """
+    Test the lazy imports of the package.
+    """
+    def test_headless_import(self, tmp_path):
+        """
+        Test that importing the chess and engine packages loads neither pygame nor numpy
+        and creates no log files.
+        """
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        code = ("import sys, quasar, quasar.chess, quasar.engine\n"
+                "quasar.chess.Board()\n"
+                "print(sorted(name for name in ('pygame', 'numpy', 'quasar.gui') "
+                "if name in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path,
+                                env=dict(os.environ, PYTHONPATH=root),
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+        assert not os.listdir(tmp_path)
+
+    def test_chess_lazy_modules(self, tmp_path):
+        """
+        Test that importing the chess package loads neither perft, store nor packed
+        until one of their names is accessed.
+        """
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        code = ("import sys, quasar.chess\n"
+                "lazy = ('quasar.chess.perft', 'quasar.chess.store', 'quasar.chess.packed', "
+                "'concurrent.futures', 'mmap')\n"
+                "print(sorted(name for name in lazy if name in sys.modules))\n"
+                "print(quasar.chess.perft.__module__, quasar.chess.PackedMove.__module__)")
+        result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path,
+                                env=dict(os.environ, PYTHONPATH=root),
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.split("\n")[:2] == ["[]", "quasar.chess.perft quasar.chess.packed"]
@@ -0,0 +1,44 @@
+"""
+Test the batched leaper move generation.
+"""
+
+from quasar.chess.board import Board
+from quasar.chess.leapers import generate_leaper_moves
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+
+class TestLeapers:
+    """
+    Test the batched leaper move generation.
+    """
+    def test_matches_scalar_generation(self, random_board, legal_moves):
+        """
+        Test that the batched path finds the same legal moves as the piece by piece one.
+        """
+        names = (PieceName.PAWN, PieceName.PAWN, PieceName.KNIGHT, PieceName.KING, PieceName.ROOK)
+        boards = [random_board(120, 20, seed, names) for seed in range(3)]
+        for fen in (STARTING_FEN, POSITION_5_FEN):
+            board = Board()
+            board.load_fen(fen)
+            boards.append(board)
+        for board in boards:
+            assert legal_moves(board, bitboard_window=False, leaper_batch_size=0) == \
+                legal_moves(board, bitboard_window=False, leaper_batch_size=10**9)
+
+    def test_pawn_masks(self):
+        """
+        Test that pawns only push onto empty squares and only capture enemy pieces.
+        """
+        board = Board()
+        board.create_piece(PieceName.PAWN, Point(0, 2), PieceColor.WHITE)
+        board.create_piece(PieceName.PAWN, Point(1, 3), PieceColor.BLACK)
+        board.create_piece(PieceName.KNIGHT, Point(-1, 3), PieceColor.WHITE)
+        blocked = board.create_piece(PieceName.PAWN, Point(5, 2), PieceColor.WHITE)
+        board.create_piece(PieceName.ROOK, Point(5, 3), PieceColor.BLACK)
+        blocked.set_position(blocked.position)
+        moves = {(move.source, move.target) for move in generate_leaper_moves(
+            board.pieces, PieceColor.WHITE, Point(-10, -10), Point(10, 10))
+                 if move.source.x >= 0}
+        assert moves == {(Point(0, 2), Point(0, 3)), (Point(0, 2), Point(0, 4)),
+                         (Point(0, 2), Point(1, 3))}
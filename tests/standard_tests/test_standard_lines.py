@@ -0,0 +1,53 @@
+"""
+Test the LineIndex class.
+"""
+
+from quasar.chess.lines import LineIndex, get_step, get_ray_length, get_ray_entry
+from quasar.chess.point import Point
+
+class TestLineIndex:
+    """
+    Test the LineIndex class.
+    """
+    def test_nearest(self):
+        """
+        Test finding the first occupied square along every kind of line.
+        """
+        lines = LineIndex()
+        for square in (Point(0, 0), Point(0, 50), Point(-7, 0), Point(3, 3), Point(-2, 2)):
+            lines.add(square)
+        assert lines.nearest(Point(0, 0), Point(0, 1)) == Point(0, 50)
+        assert lines.nearest(Point(0, 0), Point(0, -1)) is None
+        assert lines.nearest(Point(0, 0), Point(-1, 0)) == Point(-7, 0)
+        assert lines.nearest(Point(0, 0), Point(1, 1)) == Point(3, 3)
+        assert lines.nearest(Point(0, 0), Point(-1, 1)) == Point(-2, 2)
+        assert lines.nearest(Point(0, 0), Point(1, 2)) is None
+        assert lines.distance_to_blocker(Point(0, 10), Point(0, 1)) == 40
+
+    def test_remove(self):
+        """
+        Test that removed squares no longer block and empty lines are dropped.
+        """
+        lines = LineIndex()
+        lines.add(Point(1, 1))
+        lines.add(Point(1, 5))
+        lines.remove(Point(1, 5))
+        assert lines.nearest(Point(1, 1), Point(0, 1)) is None
+        lines.remove(Point(1, 1))
+        assert not lines.files and not lines.ranks
+        assert not lines.diagonals and not lines.anti_diagonals
+
+    def test_helpers(self):
+        """
+        Test the step and ray length helpers.
+        """
+        assert get_step(Point(1, 1), Point(4, 4)) == Point(1, 1)
+        assert get_step(Point(1, 1), Point(1, -3)) == Point(0, -1)
+        assert get_step(Point(1, 1), Point(2, 3)) is None
+        assert get_step(Point(1, 1), Point(1, 1)) is None
+        assert get_ray_length(Point(2, 2), Point(1, 0), Point(1, 1), Point(8, 8)) == 6
+        assert get_ray_length(Point(2, 2), Point(-1, -1), Point(1, 1), Point(8, 8)) == 1
+        assert get_ray_length(Point(2, 9), Point(1, 0), Point(1, 1), Point(8, 8)) == 0
+        assert get_ray_entry(Point(2, 2), Point(1, 0), Point(1, 1), Point(8, 8)) == 1
+        assert get_ray_entry(Point(-5, 2), Point(1, 0), Point(1, 1), Point(8, 8)) == 6
+        assert get_ray_entry(Point(12, 10), Point(-1, -1), Point(1, 1), Point(8, 8)) == 4
@@ -0,0 +1,71 @@
+"""
+Test the Move and RayMove classes.
+"""
+
+import pytest
+from quasar.chess.board import Board
+from quasar.chess.moves import RayMove
+from quasar.chess.point import Point
+from quasar.chess.pieces import PieceName, PieceColor
+
+class TestRayMove:
+    """
+    Test the RayMove class.
+    """
+    def test_expand(self):
+        """
+        Test expanding a ray move with and without bounds.
+        """
+        board = Board()
+        queen = board.create_piece(PieceName.QUEEN, Point(0, 0), PieceColor.WHITE)
+        ray = RayMove(queen, Point(1, 1))
+        assert not ray.is_bounded()
+        assert ray.contains(Point(10**6, 10**6))
+        assert not ray.contains(Point(2, 1))
+        with pytest.raises(ValueError):
+            list(ray.expand())
+        targets = [move.target for move in ray.expand(Point(-5, -5), Point(3, 8))]
+        assert targets == [Point(1, 1), Point(2, 2), Point(3, 3)]
+        assert all(move.moved is queen for move in ray.expand(Point(-5, -5), Point(3, 8)))
+        assert len(list(RayMove(queen, Point(0, -1), 2, 4).expand())) == 3
+
+    def test_move_families(self):
+        """
+        Test that an open slider yields one ray move per direction instead of every square.
+        """
+        board = Board()
+        board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
+        board.create_piece(PieceName.PAWN, Point(0, 5), PieceColor.BLACK)
+        moves, rays = board.generate_move_families()
+        assert [move.target for move in moves] == [Point(0, 5)]
+        assert len(rays) == 4
+        up = [ray for ray in rays if ray.step == Point(0, 1)][0]
+        assert (up.start, up.end) == (1, 4)
+        legal = board.generate_legal_moves(Point(-2, -2), Point(2, 8))
+        assert len(legal) == 2 + 2 + 2 + 4 + 1
+
+    def test_restricted_by_check(self):
+        """
+        Test that a ray move is narrowed to the interposing square when in check.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(0, 0), PieceColor.WHITE).moved = True
+        board.create_piece(PieceName.ROOK, Point(-50, 30), PieceColor.WHITE)
+        board.create_piece(PieceName.QUEEN, Point(0, 100), PieceColor.BLACK)
+        _, rays = board.generate_move_families()
+        rook_rays = [ray for ray in rays if ray.moved.is_rook()]
+        assert len(rook_rays) == 1
+        assert rook_rays[0].get_target(rook_rays[0].start) == Point(0, 30)
+        assert rook_rays[0].start == rook_rays[0].end
+
+    def test_ray_checks(self):
+        """
+        Test finding the squares of a ray that attack the enemy king.
+        """
+        board = Board()
+        rook = board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
+        king = board.create_piece(PieceName.KING, Point(40, 7), PieceColor.BLACK)
+        assert board.get_ray_checks(RayMove(rook, Point(1, 0)), king) == [40]
+        assert board.get_ray_checks(RayMove(rook, Point(0, 1)), king) == [7]
+        board.create_piece(PieceName.PAWN, Point(20, 7), PieceColor.BLACK)
+        assert board.get_ray_checks(RayMove(rook, Point(0, 1)), king) == []
@@ -0,0 +1,80 @@
+"""
+Test the PackedMove and MoveBuffer classes.
+"""
+
+import pytest
+from quasar.chess.board import Board
+from quasar.chess.moves import Move
+from quasar.chess.packed import PackedMove, MoveBuffer, pack, FLAG_CASTLING
+from quasar.chess.pieces import PieceColor, PieceName
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+
+class TestPackedMove:
+    """
+    Test the PackedMove class.
+    """
+    def test_fields(self):
+        """
+        Test that every field survives packing.
+        """
+        packed = PackedMove(pack(PieceColor.BLACK, Point(-4000, 17), Point(-4000, -4000),
+                                 PieceName.QUEEN, PieceName.ROOK, FLAG_CASTLING))
+        assert packed.source == Point(-4000, 17)
+        assert packed.target == Point(-4000, -4000)
+        assert packed.delta == Point(0, -4017)
+        assert packed.color == PieceColor.BLACK
+        assert packed.moved == PieceName.QUEEN
+        assert packed.captured == PieceName.ROOK
+        assert packed.is_capture() and packed.is_castling()
+        assert 0 < packed < 1 << 63
+        with pytest.raises(ValueError):
+            pack(PieceColor.WHITE, Point(5000, 0), Point(5001, 0))
+
+    def test_round_trip(self):
+        """
+        Test packing the generated moves and building them back on the board.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        moves = board.generate_legal_moves(Point(1, 1), Point(8, 8))
+        packed = [PackedMove.from_move(move) for move in moves]
+        assert len(set(packed)) == len(moves)
+        for move, value in zip(moves, packed):
+            rebuilt = value.to_move(board)
+            assert rebuilt == move
+            assert rebuilt.moved is move.moved
+            assert rebuilt.captured is move.captured or \
+                rebuilt.captured.is_none() and move.captured.is_none()
+            assert rebuilt.is_castling() == move.is_castling()
+            assert value == PackedMove.from_move(rebuilt)
+
+class TestMoveBuffer:
+    """
+    Test the MoveBuffer class.
+    """
+    def test_buffer(self):
+        """
+        Test storing moves in the array-backed buffer.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        moves = board.generate_legal_moves(Point(1, 1), Point(8, 8))
+        buffer = MoveBuffer.from_moves(moves)
+        assert len(buffer) == 20
+        assert buffer.nbytes == 20 * 8
+        assert PackedMove.from_move(moves[3]) in buffer
+        assert buffer[3].target == moves[3].target
+        assert buffer.to_moves(board) == moves
+        buffer.clear()
+        assert len(buffer) == 0
+
+    def test_move_equality(self):
+        """
+        Test that rich moves compare by color, source and target.
+        """
+        first = Move(PieceColor.WHITE, Point(1, 2), Point(1, 4))
+        second = Move(PieceColor.WHITE, Point(1, 2), Point(1, 4))
+        assert first == second and hash(first) == hash(second)
+        assert first != Move(PieceColor.WHITE, Point(1, 2), Point(1, 3))
+        assert not first.has_flags()
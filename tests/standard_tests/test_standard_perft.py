@@ -0,0 +1,53 @@
+"""
+Test the perft functions.
+"""
+
+from quasar.chess.board import Board
+from quasar.chess.perft import perft, divide
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN
+
+class TestPerft:
+    """
+    Test the perft functions.
+    """
+    def test_perft(self):
+        """
+        Test perft from the starting position.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        key = board.get_position_key()
+        assert perft(board, 1) == 20
+        assert perft(board, 2) == 400
+        assert board.get_position_key() == key
+
+    def test_divide(self):
+        """
+        Test that divide splits the node count between the root moves.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        result = divide(board, 2)
+        assert len(result.divide) == 20
+        assert all(nodes == 20 for nodes in result.divide.values())
+        assert result.nodes == 400
+
+    def test_divide_in_processes(self):
+        """
+        Test that splitting the root moves across processes gives the same counts.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        assert divide(board, 2, processes=2).divide == divide(board, 2).divide
+
+    def test_divide_far_from_origin(self):
+        """
+        Test that root moves far from the origin reach the worker processes.
+        """
+        board = Board()
+        board.load_xfen("K5000,1/k5000,8/R4999,1 w - 0 1")
+        bounds = (Point(4990, -5), Point(5010, 12))
+        single = divide(board, 2, *bounds)
+        assert single.nodes == 193
+        assert divide(board, 2, *bounds, processes=2).divide == single.divide
@@ -0,0 +1,63 @@
+"""
+Test the Point class.
+"""
+
+import pickle
+import pytest
+from quasar.chess.point import Point
+
+class TestPoint:
+    """
+    Test the Point class.
+    """
+    def test_arithmetic(self):
+        """
+        Test the arithmetic operators.
+        """
+        assert Point(1, 2) + Point(3, 4) == Point(4, 6)
+        assert Point(1, 2) - Point(3, 4) == Point(-2, -2)
+        assert Point(1, 2) * 3 == Point(3, 6)
+        assert Point(1, 2) + (1, 1) == Point(2, 3)
+        assert Point(2, 4) / 2 == Point(1, 2)
+        assert abs(Point(-1, 2)) == Point(1, 2)
+
+    def test_immutable(self):
+        """
+        Test that a point can't be changed in place.
+        """
+        point = Point(1, 2)
+        with pytest.raises(AttributeError):
+            point.x = 3
+        moved = point
+        moved += Point(1, 1)
+        assert point == Point(1, 2)
+        assert moved == Point(2, 3)
+
+    def test_hash(self):
+        """
+        Test that mirrored points hash differently.
+        """
+        assert hash(Point(1, 2)) != hash(Point(2, 1))
+        assert hash(Point(1, 2)) == hash(Point(1, 2))
+
+    def test_pickle(self):
+        """
+        Test that a point survives pickling.
+        """
+        assert pickle.loads(pickle.dumps(Point(-5, 7))) == Point(-5, 7)
+
+    def test_tuple_operands(self):
+        """
+        Test that plain tuples and numbers on either side give points, and that points aren't ordered.
+        """
+        assert (1, 2) + Point(3, 4) == Point(4, 6)
+        assert isinstance((1, 2) + Point(3, 4), Point)
+        assert (1, 2) - Point(3, 4) == Point(-2, -2)
+        assert 1 + Point(3, 4) == Point(4, 5)
+        assert Point(3, 4) - 1 == Point(2, 3)
+        with pytest.raises(TypeError):
+            Point(1, 2) < Point(2, 1)
+        with pytest.raises(TypeError):
+            (1, 2) <= Point(2, 1)
+        with pytest.raises(ValueError):
+            Point(1, 2) + (1, 2, 3)
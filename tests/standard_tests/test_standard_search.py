@@ -0,0 +1,78 @@
+"""
+Test the Search class.
+"""
+
+from quasar.chess.board import Board
+from quasar.chess.point import Point
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.engine.search import Search
+from quasar.engine.transposition import TranspositionTable
+
+class TestSearch:
+    """
+    Test the Search class.
+    """
+    def create_board(self) -> Board:
+        """
+        Create a position where white can win the black queen with the rook.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(5, 1), PieceColor.WHITE).moved = True
+        board.create_piece(PieceName.ROOK, Point(1, 1), PieceColor.WHITE).moved = True
+        board.create_piece(PieceName.KING, Point(7, 8), PieceColor.BLACK).moved = True
+        board.create_piece(PieceName.QUEEN, Point(1, 6), PieceColor.BLACK)
+        return board
+
+    def test_captures_hanging_queen(self):
+        """
+        Test that the search finds the free queen capture.
+        """
+        board = self.create_board()
+        key = board.get_position_key()
+        result = Search(margin=1).search(board, depth=2)
+        assert result.best_move.target == Point(1, 6)
+        assert result.pv[0] is result.best_move
+        assert result.score > 0
+        assert result.depth == 2
+        assert board.get_position_key() == key
+
+    def test_node_limit(self):
+        """
+        Test that the search stops at the node limit.
+        """
+        board = self.create_board()
+        result = Search(margin=1).search(board, nodes=50)
+        assert result.best_move is not None
+        assert result.nodes <= 51
+        assert result.nps >= 0
+
+    def test_transposition_table(self):
+        """
+        Test that the transposition table doesn't change the search result.
+        """
+        table = TranspositionTable(1)
+        result = Search(margin=1, table=table).search(self.create_board(), depth=3)
+        expected = Search(margin=1).search(self.create_board(), depth=3)
+        assert result.best_move.target == expected.best_move.target
+        assert result.score == expected.score
+        assert table.stores > 0
+        assert result.nodes <= expected.nodes
+
+    def test_capture_checker_outside_bounds(self):
+        """
+        Test that a slider checking from outside the search bounds can be captured.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(8, 1), PieceColor.WHITE).moved = True
+        queen = board.create_piece(PieceName.QUEEN, Point(3, 2), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(1, 8), PieceColor.BLACK).moved = True
+        board.create_piece(PieceName.BISHOP, Point(0, -3), PieceColor.BLACK)
+        search = Search()
+        search.set_bounds(board)
+        assert (search.bottom_left_bound, search.top_right_bound) == (Point(-2, -5), Point(10, 10))
+        check = [move for move in search.generate_moves(board)
+                 if move.moved is queen and move.target == Point(-5, 2)]
+        assert len(check) == 1
+        board.make_move(check[0])
+        replies = [(move.source, move.target) for move in search.generate_moves(board)]
+        assert (Point(0, -3), Point(-5, 2)) in replies
@@ -0,0 +1,97 @@
+"""
+Test the BoardStats class and the statistics kept by the board.
+"""
+
+import random
+from quasar.chess.board import Board, DEFAULT_BOUNDS_MARGIN
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.point import Point
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+from quasar.engine.evaluation import material_evaluation
+
+def recompute(board: Board, color: PieceColor) -> tuple:
+    """
+    Compute the bounding box, centroid and material of a color from scratch.
+
+    :param board: Board to take the pieces from.
+    :type board: Board
+    :param color: Color of the pieces.
+    :type color: PieceColor
+    :return: The bounding box, the centroid and the material by kind.
+    :rtype: tuple
+    """
+    pieces = [piece for piece in board.pieces if piece.color == color]
+    xs = [piece.position.x for piece in pieces]
+    ys = [piece.position.y for piece in pieces]
+    box = (Point(min(xs), min(ys)), Point(max(xs), max(ys)))
+    centroid = (sum(xs) / len(pieces), sum(ys) / len(pieces))
+    material = {name: sum(piece.name == name for piece in pieces) for name in PieceName}
+    return box, centroid, material
+
+class TestStats:
+    """
+    Test the BoardStats class and the statistics kept by the board.
+    """
+    def test_follows_moves(self):
+        """
+        Test that the statistics match a full recompute along random games and their undo.
+        """
+        generator = random.Random(0)
+        for fen in (STARTING_FEN, POSITION_5_FEN):
+            board = Board()
+            board.load_fen(fen)
+            for _ in range(2):
+                for _ in range(40):
+                    moves = board.generate_legal_moves(Point(-3, -3), Point(12, 12))
+                    if not moves:
+                        break
+                    board.make_move(generator.choice(moves), False)
+                    for color in (PieceColor.WHITE, PieceColor.BLACK):
+                        box, centroid, material = recompute(board, color)
+                        assert board.get_bounding_box(color) == box
+                        assert board.stats.get_centroid(color) == centroid
+                        assert all(board.get_material(name, color) == count
+                                   for name, count in material.items())
+                copy = board.copy()
+                while board.moves:
+                    board.undo_move()
+                for color in (PieceColor.WHITE, PieceColor.BLACK):
+                    assert copy.get_bounding_box(color) == recompute(copy, color)[0]
+                    assert board.get_bounding_box(color) == recompute(board, color)[0]
+
+    def test_bounding_box(self):
+        """
+        Test that the bounding box grows and shrinks with the pieces.
+        """
+        board = Board()
+        assert board.get_bounding_box() is None
+        board.create_piece(PieceName.KING, Point(0, 0), PieceColor.WHITE)
+        far = board.create_piece(PieceName.ROOK, Point(-40, 7), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(3, 12), PieceColor.BLACK)
+        assert board.get_bounding_box(PieceColor.WHITE) == (Point(-40, 0), Point(0, 7))
+        assert board.get_bounding_box() == (Point(-40, 0), Point(3, 12))
+        board.remove_piece(far)
+        assert board.get_bounding_box(PieceColor.WHITE) == (Point(0, 0), Point(0, 0))
+        assert board.get_concentration_position() == (1.5, 6.0)
+
+    def test_default_bounds(self):
+        """
+        Test that moves are generated around the pieces when no bounds are given.
+        """
+        board = Board()
+        board.create_piece(PieceName.ROOK, Point(0, 0), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(5, 5), PieceColor.BLACK)
+        assert board.get_bounds() == (Point(-DEFAULT_BOUNDS_MARGIN, -DEFAULT_BOUNDS_MARGIN),
+                                      Point(5 + DEFAULT_BOUNDS_MARGIN, 5 + DEFAULT_BOUNDS_MARGIN))
+        assert len(board.generate_legal_moves()) == 4 * DEFAULT_BOUNDS_MARGIN + 10
+        assert Board().get_bounds(margin=1) == (Point(-1, -1), Point(1, 1))
+
+    def test_material_evaluation(self):
+        """
+        Test that the material evaluation follows captures.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        assert material_evaluation(board) == 0
+        board.remove_piece(board.get_piece_at(Point(4, 7)))
+        assert material_evaluation(board) == -100
@@ -0,0 +1,80 @@
+"""
+Test the binary position encoding and the PositionStore class.
+"""
+
+import io
+import pytest
+from quasar.chess.board import Board
+from quasar.chess.errors import PositionStoreError
+from quasar.chess.fen import stream_positions
+from quasar.chess.store import PositionStore, encode_position, decode_position
+from quasar.chess.utils import STARTING_FEN, POSITION_5_FEN
+
+XFENS = ("K0,0/r-5000,123456*/p3,-2/k10,-10 b 7,-1 4 90",
+         "- w - 0 1",
+         "R1,1/K5,1/k5,8/R8,1 w - 0 1")
+
+class TestStore:
+    """
+    Test the binary position encoding and the PositionStore class.
+    """
+    def test_encode_round_trip(self):
+        """
+        Test that decoding an encoded position gives back the same position.
+        """
+        for xfen in XFENS:
+            board = Board()
+            board.load_xfen(xfen)
+            other = Board()
+            other.load_position(decode_position(memoryview(encode_position(board))))
+            assert sorted(other.get_xfen().split(" ")[0].split("/")) == \
+                sorted(board.get_xfen().split(" ")[0].split("/"))
+            assert other.get_xfen().split(" ")[1:] == board.get_xfen().split(" ")[1:]
+            assert other.position_key == board.position_key
+
+    def test_encoding_size(self):
+        """
+        Test that the encoding is smaller than the text and the per-piece records.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        encoded = encode_position(board)
+        assert len(encoded) < len(board.get_xfen())
+        assert len(encoded) < len(board.to_bytes()) // 4
+
+    def test_truncated(self):
+        """
+        Test that truncated data is rejected.
+        """
+        board = Board()
+        board.load_fen(STARTING_FEN)
+        with pytest.raises(PositionStoreError):
+            decode_position(memoryview(encode_position(board)[:-1]))
+
+    def test_store(self, tmp_path):
+        """
+        Test writing boards to a store and reading them back by index and in order.
+        """
+        path = str(tmp_path / "positions.bin")
+        lines = io.StringIO("\n".join(XFENS))
+        assert PositionStore.write(path, stream_positions(lines, Board())) == len(XFENS)
+        with PositionStore(path) as store:
+            assert len(store) == len(XFENS)
+            board = store.load(-1, Board())
+            assert board.get_xfen() == XFENS[2]
+            assert [len(position[0]) for position in store] == [4, 0, 4]
+            with pytest.raises(IndexError):
+                store.get_record(len(XFENS))
+
+    def test_store_errors(self, tmp_path):
+        """
+        Test that oversized records and files that aren't stores are rejected.
+        """
+        board = Board()
+        board.load_fen(POSITION_5_FEN)
+        with pytest.raises(PositionStoreError):
+            PositionStore.write(str(tmp_path / "small.bin"), [board], record_size=16)
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a position store")
+        with pytest.raises(PositionStoreError):
+            PositionStore(str(path))
@@ -0,0 +1,89 @@
+"""
+Test the TranspositionTable class.
+"""
+
+import pytest
+from quasar.chess.board import Board
+from quasar.chess.moves import Move
+from quasar.chess.packed import PackedMove
+from quasar.chess.pieces import PieceName, PieceColor
+from quasar.chess.point import Point
+from quasar.engine.transposition import TranspositionTable, Bound, NO_MOVE, pack_move
+
+class TestTranspositionTable:
+    """
+    Test the TranspositionTable class.
+    """
+    def test_memory_budget(self):
+        """
+        Test that the table stays within its memory budget.
+        """
+        table = TranspositionTable(1)
+        assert table.nbytes <= 1 << 20
+        assert table.nbytes > (1 << 20) - 2 * table.ENTRY_SIZE
+        with pytest.raises(ValueError):
+            TranspositionTable(0)
+
+    def test_store_and_probe(self):
+        """
+        Test storing and probing an entry.
+        """
+        table = TranspositionTable(1)
+        assert table.probe(1234) is None
+        table.store(1234, 5, Bound.LOWER, -70, 99)
+        assert table.probe(1234) == (5, Bound.LOWER, -70, 99)
+        assert table.probes == 2
+        assert table.hits == 1
+        assert table.stores == 1
+
+    def test_replacement(self):
+        """
+        Test the depth-preferred and always-replace slots of a bucket.
+        """
+        table = TranspositionTable(1)
+        first, second, third = 7, 7 + table.bucket_count, 7 + 2 * table.bucket_count
+        table.store(first, 6, Bound.EXACT, 10)
+        table.store(second, 2, Bound.EXACT, 20)
+        table.store(third, 1, Bound.EXACT, 30)
+        assert table.probe(first) == (6, Bound.EXACT, 10, NO_MOVE)
+        assert table.probe(second) is None
+        assert table.probe(third) == (1, Bound.EXACT, 30, NO_MOVE)
+        assert table.collisions == 1
+
+        table.new_search()
+        table.store(second, 1, Bound.EXACT, 20)
+        assert table.probe(second) is not None
+        assert table.probe(first) is None
+
+    def test_replaced_move(self):
+        """
+        Test that a stored move is kept for the same position and dropped for another one.
+        """
+        table = TranspositionTable(1)
+        first, second = 7, 7 + table.bucket_count
+        table.store(first, 2, Bound.EXACT, 10, 99)
+        table.store(first, 3, Bound.LOWER, 15)
+        assert table.probe(first) == (3, Bound.LOWER, 15, 99)
+        table.store(second, 4, Bound.EXACT, 20)
+        assert table.probe(second) == (4, Bound.EXACT, 20, NO_MOVE)
+        assert table.probe(first) is None
+        table.store(first, 1, Bound.EXACT, 30)
+        assert table.probe(first) == (1, Bound.EXACT, 30, NO_MOVE)
+
+    def test_pack_move(self):
+        """
+        Test that moves are packed as PackedMove, negative coordinates included.
+        """
+        board = Board()
+        board.create_piece(PieceName.KING, Point(-3, -7), PieceColor.WHITE)
+        board.create_piece(PieceName.KING, Point(10, 10), PieceColor.BLACK)
+        move = board.generate_legal_moves(Point(-4, -8), Point(-4, -8))[0]
+        packed = pack_move(move)
+        assert packed != NO_MOVE
+        assert PackedMove(packed) == PackedMove.from_move(move)
+        assert (PackedMove(packed).source, PackedMove(packed).target) == \
+            (Point(-3, -7), Point(-4, -8))
+        assert pack_move(None) == NO_MOVE
+        far = Move(PieceColor.WHITE, Point(10**6, 0), Point(10**6 + 1, 0))
+        far.moved = board.get_piece_at(Point(-3, -7))
+        assert pack_move(far) == NO_MOVE